@@ -0,0 +1,109 @@
+"""
+Compare the speed of converting a `CloudForCustomers` report page into a DataFrame
+column by column with `response_to_columns()` against the previous implementation,
+which checked `str(value)` for every value and rebuilt a dictionary for every row.
+
+The response is synthetic, so the benchmark runs without a C4C connection.
+
+Usage:
+    python benchmarks/c4c_entity_conversion.py --rows 100000 --columns 100
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from viadot.sources import CloudForCustomers
+
+REPORT_URL = "https://c4c.example.com/sap/c4c/odata/ana_businessanalytics_analytics.svc/RPZ1234QueryResults"
+
+
+class OfflineCloudForCustomers(CloudForCustomers):
+    """`CloudForCustomers` with a fixed column mapping instead of `$metadata`."""
+
+    column_mapping: Dict[str, str] = {}
+
+    def map_columns(self, url: str = None) -> Dict[str, str]:
+        return self.column_mapping
+
+
+def legacy_response_to_entity_list(
+    column_maper_dict: Dict[str, str], dirty_json: Dict[str, Any]
+) -> List:
+    """The per-value implementation of `response_to_entity_list()`."""
+    entity_list = []
+    for element in dirty_json["d"]["results"]:
+        new_entity = {}
+        for key, object_of_interest in element.items():
+            if key not in ["__metadata", "Photo", "", "Picture"]:
+                if "{" not in str(object_of_interest):
+                    new_key = column_maper_dict.get(key)
+                    if new_key:
+                        new_entity[new_key] = object_of_interest
+                    else:
+                        new_entity[key] = object_of_interest
+        entity_list.append(new_entity)
+    return entity_list
+
+
+def generate_response(rows: int, columns: int) -> Dict[str, Any]:
+    rng = np.random.default_rng(42)
+    data = {}
+    for i in range(columns):
+        if i % 3 == 0:
+            data[f"C{i}"] = rng.choice(["A", "B", "C", "D"], rows).tolist()
+        elif i % 3 == 1:
+            data[f"KC{i}"] = np.round(rng.random(rows) * 1000, 2).astype(str).tolist()
+        else:
+            data[f"T{i}"] = rng.integers(0, 1000, rows).tolist()
+    names = list(data)
+    results = [
+        {
+            "__metadata": {"uri": f"{REPORT_URL}('{n}')", "type": "cust.Report"},
+            **dict(zip(names, row)),
+            "Details": {"__deferred": {"uri": f"{REPORT_URL}('{n}')/Details"}},
+        }
+        for n, row in enumerate(zip(*data.values()))
+    ]
+    OfflineCloudForCustomers.column_mapping = {
+        name: f"{name} label" for name in names[::2]
+    }
+    return {"d": {"results": results}}
+
+
+def run_benchmark(rows: int, columns: int) -> None:
+    response = generate_response(rows, columns)
+    c4c = OfflineCloudForCustomers(report_url=REPORT_URL)
+
+    results = {}
+    for name, convert in (
+        (
+            "per-value conversion",
+            lambda: pd.DataFrame(
+                legacy_response_to_entity_list(c4c.map_columns(REPORT_URL), response)
+            ),
+        ),
+        (
+            "response_to_columns()",
+            lambda: pd.DataFrame(c4c.response_to_columns(response, REPORT_URL)),
+        ),
+    ):
+        start = time.perf_counter()
+        results[name] = convert()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<30} {elapsed:8.2f}s {rows / elapsed:12,.0f} rows/s")
+
+    legacy_df, df = results.values()
+    pd.testing.assert_frame_equal(legacy_df, df)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=100)
+    args = parser.parse_args()
+
+    run_benchmark(rows=args.rows, columns=args.columns)
@@ -0,0 +1,79 @@
+"""
+Compare the time it takes `DuckDB.create_table_from_parquet()` to create and append
+to many tables when reusing a single connection against the previous implementation,
+which opened a new connection for every query and scanned `information_schema.tables`
+to check whether a table exists.
+
+Usage:
+    python benchmarks/duckdb_tables.py --tables 200
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import duckdb
+import pandas as pd
+
+from viadot.sources.duckdb import DuckDB
+
+
+class LegacyDuckDB(DuckDB):
+    """`DuckDB` opening a new connection for each query, as before."""
+
+    @property
+    def con(self) -> duckdb.DuckDBPyConnection:
+        return duckdb.connect(database=self.credentials.get("database"))
+
+    def begin(self) -> None:
+        pass
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def _check_if_table_exists(self, table: str, schema: str = None) -> bool:
+        schema = schema or DuckDB.DEFAULT_SCHEMA
+        return schema + "." + table in self.tables
+
+
+def run_benchmark(tables: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        parquet_path = os.path.join(tmp_dir, "data.parquet")
+        pd.DataFrame(
+            {"country": ["italy", "germany", "spain"], "sales": [100, 50, 80]}
+        ).to_parquet(parquet_path)
+
+        for name, source_class in (
+            ("connection per query", LegacyDuckDB),
+            ("reused connection", DuckDB),
+        ):
+            database = os.path.join(tmp_dir, f"{source_class.__name__}.duckdb")
+            source = source_class(credentials=dict(database=database))
+
+            start = time.perf_counter()
+            for i in range(tables):
+                source.create_table_from_parquet(
+                    table=f"table_{i}", schema="benchmark", path=parquet_path
+                )
+                source.create_table_from_parquet(
+                    table=f"table_{i}",
+                    schema="benchmark",
+                    path=parquet_path,
+                    if_exists="append",
+                )
+            elapsed = time.perf_counter() - start
+            source.close_connection()
+
+            print(f"{name:<25} {elapsed:8.2f}s {tables / elapsed:10,.1f} tables/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tables", type=int, default=200)
+    args = parser.parse_args()
+
+    run_benchmark(tables=args.tables)
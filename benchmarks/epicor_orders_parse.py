@@ -0,0 +1,149 @@
+"""
+Compare the speed and peak memory of parsing an Epicor orders response with
+`parse_orders_xml()` against the previous implementation, which built the whole
+element tree, validated every line item with pydantic models and appended each row
+to the result with `DataFrame.append()`.
+
+The response is synthetic, so the benchmark runs without an Epicor connection.
+
+Usage:
+    python benchmarks/epicor_orders_parse.py --orders 2000 --items 3
+"""
+
+import argparse
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+import pandas as pd
+
+from viadot.sources.epicor import (
+    HEADER_FIELDS,
+    LINE_ITEM_FIELDS,
+    HeaderInformation,
+    InvoiceTotals,
+    LineItemDetail,
+    Order,
+    ShipToAddress,
+    TrackingNumbers,
+    parse_orders_xml,
+)
+
+
+def legacy_parse_orders_xml(xml_data: bytes) -> pd.DataFrame:
+    """The element tree and pydantic based implementation of `parse_orders_xml()`."""
+    final_df = pd.DataFrame()
+    ship_dict = {}
+    invoice_dict = {}
+    header_params_dict = {}
+    item_params_dict = {}
+
+    root = ET.fromstring(xml_data)
+
+    for order in root.findall("Order"):
+        for header in order.findall("HeaderInformation"):
+            for tracking_numbers in header.findall("TrackingNumbers"):
+                numbers = ""
+                for tracking_number in tracking_numbers.findall("TrackingNumber"):
+                    numbers = numbers + "'" + tracking_number.text + "'"
+                result_numbers = TrackingNumbers(TrackingNumber=numbers)
+
+            for shipto in header.findall("ShipToAddress"):
+                for ship_param in ShipToAddress.__annotations__:
+                    element = shipto.find(ship_param)
+                    ship_dict[ship_param] = None if element is None else element.text
+                ship_address = ShipToAddress(**ship_dict)
+
+            for invoice in header.findall("InvoiceTotals"):
+                for invoice_param in InvoiceTotals.__annotations__:
+                    element = invoice.find(invoice_param)
+                    invoice_dict[invoice_param] = (
+                        None if element is None else element.text
+                    )
+                invoice_total = InvoiceTotals(**invoice_dict)
+
+            for header_param in HeaderInformation.__annotations__:
+                element = header.find(header_param)
+                header_params_dict[header_param] = (
+                    None if element is None else element.text
+                )
+            header_params_dict["TrackingNumbers"] = result_numbers
+            header_params_dict["ShipToAddress"] = ship_address
+            header_params_dict["InvoiceTotals"] = invoice_total
+            header_info = HeaderInformation(**header_params_dict)
+        for items in order.findall("LineItemDetails"):
+            for item in items.findall("LineItemDetail"):
+                for item_param in LineItemDetail.__annotations__:
+                    element = item.find(item_param)
+                    item_params_dict[item_param] = (
+                        None if element is None else element.text
+                    )
+                line_item = LineItemDetail(**item_params_dict)
+                row = Order(HeaderInformation=header_info, LineItemDetail=line_item)
+                # `DataFrame.append()` was removed in pandas 2.0.
+                final_df = pd.concat(
+                    [final_df, pd.json_normalize(row.dict(), max_level=2)],
+                    ignore_index=True,
+                )
+    return final_df
+
+
+def generate_response(orders: int, items: int) -> bytes:
+    def element(tag, text):
+        return f"<{tag}>{text}</{tag}>"
+
+    def section(tag, fields, suffix):
+        return (
+            f"<{tag}>"
+            + "".join(element(f, f"{f}{suffix}") for f in fields)
+            + f"</{tag}>"
+        )
+
+    parts = ["<?xml version='1.0'?><OrderQueryResponse>"]
+    for o in range(orders):
+        header = "".join(element(field, f"{field}{o}") for field in HEADER_FIELDS)
+        header += section("ShipToAddress", ShipToAddress.__annotations__, o)
+        header += section("TrackingNumbers", ["TrackingNumber"] * 2, o)
+        header += section("InvoiceTotals", InvoiceTotals.__annotations__, o)
+        line_items = "".join(
+            section("LineItemDetail", LINE_ITEM_FIELDS, f"{o}-{i}")
+            for i in range(items)
+        )
+        parts.append(
+            f"<Order><HeaderInformation>{header}</HeaderInformation>"
+            f"<LineItemDetails>{line_items}</LineItemDetails></Order>"
+        )
+    parts.append("</OrderQueryResponse>")
+    return "".join(parts).encode("utf-8")
+
+
+def run_benchmark(orders: int, items: int) -> None:
+    xml_data = generate_response(orders, items)
+    rows = orders * items
+
+    results = {}
+    for name, parse in (
+        ("element tree + pydantic", legacy_parse_orders_xml),
+        ("parse_orders_xml()", parse_orders_xml),
+    ):
+        tracemalloc.start()
+        start = time.perf_counter()
+        results[name] = parse(xml_data)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+        print(
+            f"{name:<30} {elapsed:8.2f}s {rows / elapsed:12,.0f} rows/s {peak:8.1f} MiB peak"
+        )
+
+    legacy_df, df = results.values()
+    pd.testing.assert_frame_equal(legacy_df, df)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=3)
+    args = parser.parse_args()
+
+    run_benchmark(orders=args.orders, items=args.items)
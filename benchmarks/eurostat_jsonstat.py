@@ -0,0 +1,142 @@
+"""
+Compare the speed of decoding a Eurostat JSON-stat response with `jsonstat_to_df()`
+against the previous implementation of `Eurostat.eurostat_dictionary_to_df()`, which
+looped over every geo x time cell in Python and looked its position up in `value`.
+
+The response is a synthetic, sparse geo x time cube, so the benchmark runs without
+calling the Eurostat API.
+
+Usage:
+    python benchmarks/eurostat_jsonstat.py --geo 1000 --time 1000 --density 0.9
+"""
+
+import argparse
+import time
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+from viadot.sources.eurostat import Eurostat, jsonstat_to_df
+
+
+def legacy_eurostat_dictionary_to_df(*signals: list) -> pd.DataFrame:
+    """The per-cell implementation of `eurostat_dictionary_to_df()`."""
+
+    class T_SIGNAL:
+        signal_keys_list: list
+        signal_index_list: list
+        signal_label_list: list
+        signal_name: str
+
+    columns0 = signals[0].copy()
+    columns0.append("indicator")
+    df = pd.DataFrame(columns=columns0)
+    index_list = []
+    signal_lists = []
+    eurostat_dictionary = signals[-1]
+
+    for signal in signals[0]:
+        signal_struct = T_SIGNAL()
+        signal_struct.signal_name = signal
+        signal_struct.signal_keys_list = list(
+            eurostat_dictionary["dimension"][signal]["category"]["index"].keys()
+        )
+        signal_struct.signal_index_list = list(
+            eurostat_dictionary["dimension"][signal]["category"]["index"].values()
+        )
+        signal_label_dict = eurostat_dictionary["dimension"][signal]["category"][
+            "label"
+        ]
+        signal_struct.signal_label_list = [
+            signal_label_dict[i] for i in signal_struct.signal_keys_list
+        ]
+        signal_lists.append(signal_struct)
+
+    col_signal_temp = []
+    row_signal_temp = []
+    for row_index, row_label in zip(
+        signal_lists[0].signal_index_list, signal_lists[0].signal_label_list
+    ):
+        for col_index, col_label in zip(
+            signal_lists[1].signal_index_list, signal_lists[1].signal_label_list
+        ):
+            index = str(col_index + row_index * len(signal_lists[1].signal_label_list))
+            if index in eurostat_dictionary["value"].keys():
+                index_list.append(index)
+                col_signal_temp.append(col_label)
+                row_signal_temp.append(row_label)
+
+    indicator_list = [eurostat_dictionary["value"][i] for i in index_list]
+    df.indicator = indicator_list
+    df[signal_lists[1].signal_name] = col_signal_temp
+    df[signal_lists[0].signal_name] = row_signal_temp
+    return df
+
+
+def generate_response(geo: int, time: int, density: float) -> Dict[str, Any]:
+    rng = np.random.default_rng(42)
+    cells = geo * time
+    positions = np.flatnonzero(rng.random(cells) < density)
+    values = np.round(rng.random(len(positions)) * 1000, 1)
+
+    def dimension(codes, labels):
+        return {
+            "category": {
+                "index": {code: i for i, code in enumerate(codes)},
+                "label": dict(zip(codes, labels)),
+            }
+        }
+
+    geo_codes = [f"G{i:05d}" for i in range(geo)]
+    time_codes = [str(1000 + i) for i in range(time)]
+    return {
+        "id": ["freq", "unit", "geo", "time"],
+        "size": [1, 1, geo, time],
+        "dimension": {
+            "freq": dimension(["A"], ["Annual"]),
+            "unit": dimension(["EUR"], ["Euro"]),
+            "geo": dimension(geo_codes, [f"Region {code}" for code in geo_codes]),
+            "time": dimension(time_codes, time_codes),
+        },
+        "value": dict(zip(map(str, positions.tolist()), values.tolist())),
+    }
+
+
+def run_benchmark(geo: int, time_periods: int, density: float) -> None:
+    data = generate_response(geo, time_periods, density)
+    rows = len(data["value"])
+    eurostat = Eurostat(dataset_code="BENCHMARK")
+
+    results = {}
+    for name, decode in (
+        (
+            "per-cell loop",
+            lambda: legacy_eurostat_dictionary_to_df(["geo", "time"], data),
+        ),
+        (
+            "eurostat_dictionary_to_df()",
+            lambda: eurostat.eurostat_dictionary_to_df(["geo", "time"], data),
+        ),
+        ("jsonstat_to_df(), all dims", lambda: jsonstat_to_df(data)),
+    ):
+        start = time.perf_counter()
+        results[name] = decode()
+        elapsed = time.perf_counter() - start
+        memory = results[name].memory_usage(deep=True).sum() / 2**20
+        print(
+            f"{name:<30} {elapsed:8.2f}s {rows / elapsed:12,.0f} cells/s {memory:8.1f} MiB"
+        )
+
+    legacy_df, df, _ = results.values()
+    pd.testing.assert_frame_equal(legacy_df, df)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--geo", type=int, default=1000)
+    parser.add_argument("--time", type=int, default=1000)
+    parser.add_argument("--density", type=float, default=0.9)
+    args = parser.parse_args()
+
+    run_benchmark(geo=args.geo, time_periods=args.time, density=args.density)
@@ -0,0 +1,220 @@
+"""
+Compare the speed of flattening `analytics/conversations/details/query` responses
+with `GenesysToCSV.merge_conversations_dfs()` against the previous implementation,
+which normalized every conversation separately and concatenated the results in a loop.
+
+The conversations are synthetic, so the benchmark runs without a Genesys connection.
+
+Usage:
+    python benchmarks/genesys_conversations.py --conversations 50000
+"""
+
+import argparse
+import copy
+import time
+
+import numpy as np
+import pandas as pd
+
+from viadot.tasks import GenesysToCSV
+
+
+def legacy_merge_conversations_dfs(data_to_merge: list) -> pd.DataFrame:
+    """The per-conversation implementation of `merge_conversations_dfs()`."""
+    # LEVEL 0
+    df0 = pd.json_normalize(data_to_merge)
+    df0.drop(["participants"], axis=1, inplace=True)
+
+    # LEVEL 1
+    df1 = pd.json_normalize(
+        data_to_merge,
+        record_path=["participants"],
+        meta=["conversationId"],
+    )
+    df1.drop(["sessions"], axis=1, inplace=True)
+
+    # LEVEL 2
+    df2 = pd.json_normalize(
+        data_to_merge,
+        record_path=["participants", "sessions"],
+        meta=[
+            ["participants", "externalContactId"],
+            ["participants", "participantId"],
+        ],
+        errors="ignore",
+        sep="_",
+    )
+    df2.rename(
+        columns={
+            "participants_externalContactId": "externalContactId",
+            "participants_participantId": "participantId",
+        },
+        inplace=True,
+    )
+    for key in ["metrics", "segments", "mediaEndpointStats"]:
+        try:
+            df2.drop([key], axis=1, inplace=True)
+        except KeyError:
+            pass
+
+    # LEVEL 3
+    # not all levels 3 have the same data, and that creates problems of standardization
+    # so I add empty data where it is not available to avoid future errors
+    conversations_df = {}
+    for i, conversation in enumerate(data_to_merge):
+        for j, entry_0 in enumerate(conversation["participants"]):
+            for key in list(entry_0.keys()):
+                if key == "sessions":
+                    for k, entry_1 in enumerate(entry_0[key]):
+                        if "metrics" not in list(entry_1.keys()):
+                            conversation["participants"][j][key][k]["metrics"] = []
+                        if "segments" not in list(entry_1.keys()):
+                            conversation["participants"][j][key][k]["segments"] = []
+                        if "mediaEndpointStats" not in list(entry_1.keys()):
+                            conversation["participants"][j][key][k][
+                                "mediaEndpointStats"
+                            ] = []
+        # LEVEL 3 metrics
+        df3_1 = pd.json_normalize(
+            conversation,
+            record_path=["participants", "sessions", "metrics"],
+            meta=[
+                ["participants", "sessions", "sessionId"],
+            ],
+            errors="ignore",
+            record_prefix="metrics_",
+            sep="_",
+        )
+        df3_1.rename(
+            columns={"participants_sessions_sessionId": "sessionId"}, inplace=True
+        )
+        # LEVEL 3 segments
+        df3_2 = pd.json_normalize(
+            conversation,
+            record_path=["participants", "sessions", "segments"],
+            meta=[
+                ["participants", "sessions", "sessionId"],
+            ],
+            errors="ignore",
+            record_prefix="segments_",
+            sep="_",
+        )
+        df3_2.rename(
+            columns={"participants_sessions_sessionId": "sessionId"}, inplace=True
+        )
+        # LEVEL 3 mediaEndpointStats
+        df3_3 = pd.json_normalize(
+            conversation,
+            record_path=["participants", "sessions", "mediaEndpointStats"],
+            meta=[
+                ["participants", "sessions", "sessionId"],
+            ],
+            errors="ignore",
+            record_prefix="mediaEndpointStats_",
+            sep="_",
+        )
+        df3_3.rename(
+            columns={"participants_sessions_sessionId": "sessionId"}, inplace=True
+        )
+
+        # merging all LEVELs 3 from the same conversation
+        dff3_tmp = pd.concat([df3_1, df3_2])
+        dff3 = pd.concat([dff3_tmp, df3_3])
+
+        conversations_df.update({i: dff3})
+
+    # NERGING ALL LEVELS
+    # LEVELS 3
+    for l, key in enumerate(list(conversations_df.keys())):
+        if l == 0:
+            dff3_f = conversations_df[key]
+        else:
+            dff3_f = pd.concat([dff3_f, conversations_df[key]])
+
+    # LEVEL 3 with LEVEL 2
+    dff2 = pd.merge(dff3_f, df2, how="outer", on=["sessionId"])
+
+    # LEVEL 2 with LEVEL 1
+    dff1 = pd.merge(df1, dff2, how="outer", on=["externalContactId", "participantId"])
+
+    # LEVEL 1 with LEVEL 0
+    dff = pd.merge(df0, dff1, how="outer", on=["conversationId"])
+
+    return dff
+
+
+def generate_conversations(conversations: int) -> list:
+    rng = np.random.default_rng(42)
+    data = []
+    for i in range(conversations):
+        participants = []
+        for j in range(2):
+            session = {
+                "sessionId": f"session-{i}-{j}",
+                "mediaType": "voice",
+                "direction": "inbound",
+                "flow": {"flowId": f"flow-{j}", "flowName": "Main"},
+                "metrics": [
+                    {"name": "nConnected", "value": int(rng.integers(0, 5))},
+                    {"name": "tTalk", "value": int(rng.integers(0, 10_000))},
+                ],
+                "segments": [
+                    {
+                        "segmentStart": "2022-08-12T10:00:00Z",
+                        "segmentEnd": "2022-08-12T10:05:00Z",
+                        "segmentType": "interact",
+                        "queueId": f"queue-{j}",
+                    }
+                ],
+            }
+            if j == 0:
+                session["mediaEndpointStats"] = [{"codecs": ["opus"], "minMos": 4.5}]
+            participants.append(
+                {
+                    "participantId": f"participant-{i}-{j}",
+                    "externalContactId": f"contact-{i}",
+                    "purpose": "customer" if j == 0 else "agent",
+                    "sessions": [session],
+                }
+            )
+        data.append(
+            {
+                "conversationId": f"conversation-{i}",
+                "conversationStart": "2022-08-12T10:00:00Z",
+                "conversationEnd": "2022-08-12T10:05:00Z",
+                "divisionIds": ["division-1"],
+                "participants": participants,
+            }
+        )
+    return data
+
+
+def run_benchmark(conversations: int) -> None:
+    data = generate_conversations(conversations)
+    task = GenesysToCSV()
+
+    results = {}
+    for name, merge in (
+        ("per-conversation normalize", legacy_merge_conversations_dfs),
+        ("merge_conversations_dfs()", task.merge_conversations_dfs),
+    ):
+        data_to_merge = copy.deepcopy(data)
+        start = time.perf_counter()
+        results[name] = merge(data_to_merge)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:<30} {elapsed:8.2f}s {conversations / elapsed:12,.0f} conversations/s"
+        )
+
+    legacy_df, df = results.values()
+    pd.testing.assert_frame_equal(
+        legacy_df.reset_index(drop=True), df.reset_index(drop=True)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--conversations", type=int, default=50_000)
+    args = parser.parse_args()
+
+    run_benchmark(conversations=args.conversations)
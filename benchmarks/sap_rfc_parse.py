@@ -0,0 +1,71 @@
+"""
+Compare the speed of parsing `RFC_READ_TABLE` responses with `parse_records()` and
+`catch_extra_separators()` against the previous per-record implementation.
+
+The `DATA` payloads are synthetic, so the benchmark runs without a SAP connection.
+
+Usage:
+    python benchmarks/sap_rfc_parse.py --rows 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from viadot.sources.sap_rfc import catch_extra_separators, parse_records
+
+FIELDS = ["MANDT", "VBELN", "POSNR", "MATNR", "ARKTX", "KWMENG", "NETWR", "WAERK"]
+
+
+def legacy_parse_records(data_raw: np.array, fields: list, sep: str) -> pd.DataFrame:
+    """The per-record implementation used by `SAPRFCV2.to_df()` before vectorizing."""
+    records = np.array([row["WA"].split(sep) for row in data_raw])
+    df = pd.DataFrame(columns=fields)
+    df[fields] = records
+    return df
+
+
+def generate_data(rows: int, sep: str) -> np.array:
+    rng = np.random.default_rng(42)
+    columns = [
+        np.full(rows, "100"),
+        np.char.zfill(rng.integers(0, 10**10, rows).astype(str), 10),
+        np.char.zfill((rng.integers(1, 100, rows) * 10).astype(str), 6),
+        np.char.ljust(rng.choice(["MAT-1", "MAT-22", "MAT-333"], rows), 18),
+        np.char.ljust(rng.choice(["Bolt", "Nut", "Washer", "Screw"], rows), 40),
+        np.char.rjust(rng.integers(1, 1000, rows).astype(str), 15),
+        np.char.rjust(np.round(rng.random(rows) * 1000, 2).astype(str), 15),
+        np.full(rows, "EUR  "),
+    ]
+    lines = columns[0]
+    for column in columns[1:]:
+        lines = np.char.add(np.char.add(lines, sep), column)
+    return np.array([{"WA": line} for line in lines.tolist()])
+
+
+def run_benchmark(rows: int) -> None:
+    sep = "|"
+    data_raw = generate_data(rows, sep)
+
+    for name, parse in (
+        ("per-record split", lambda: legacy_parse_records(data_raw, FIELDS, sep)),
+        ("parse_records()", lambda: parse_records(data_raw, FIELDS, sep)),
+        (
+            "catch_extra_separators()",
+            lambda: catch_extra_separators(data_raw, "WA", sep, FIELDS, "-"),
+        ),
+    ):
+        start = time.perf_counter()
+        parse()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<30} {elapsed:8.2f}s {rows / elapsed:12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    run_benchmark(rows=args.rows)
@@ -0,0 +1,98 @@
+"""
+Compare the throughput of `SQL.insert_into()` with the previous implementation, which
+built a single `INSERT ... VALUES` string for the whole DataFrame.
+
+SQLite (through the standard library `sqlite3` module) is used as a stand-in for an
+ODBC database, so the benchmark can run without any database server or ODBC driver.
+As `sqlite3` does not support parameter arrays, `fast_executemany` is disabled; on
+SQL Server the parameterized path is expected to be considerably faster still.
+
+Usage:
+    python benchmarks/sql_insert.py --rows 100000
+"""
+
+import argparse
+import sqlite3
+import time
+
+import numpy as np
+import pandas as pd
+
+from viadot.sources.base import SQL
+
+
+def legacy_insert_into(sql: SQL, table: str, df: pd.DataFrame) -> str:
+    """The string-building implementation of `SQL.insert_into()` before batching."""
+
+    def _sql_column(column_name):
+        if isinstance(column_name, str):
+            return f"'{column_name}'"
+        return str(column_name)
+
+    values = ""
+    rows_count = df.shape[0]
+    counter = 0
+    for row in df.values:
+        counter += 1
+        out_row = ", ".join(map(_sql_column, row))
+        comma = ",\n"
+        if counter == rows_count:
+            comma = ";"
+        out_row = f"({out_row}){comma}"
+        values += out_row
+
+    columns = ", ".join(df.columns)
+
+    query = f"INSERT INTO {table} ({columns})\n VALUES {values}"
+    sql.run(query)
+
+    return query
+
+
+def generate_df(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "country": rng.choice(["italy", "germany", "spain", "poland"], rows),
+            "sales": rng.random(rows) * 1000,
+            "quantity": rng.integers(0, 100, rows),
+        }
+    )
+
+
+def run_benchmark(rows: int, batch_size: int) -> None:
+    df = generate_df(rows)
+    sql = SQL(credentials={})
+
+    for name, insert in (
+        ("string-built VALUES", lambda: legacy_insert_into(sql, "test", df)),
+        (
+            f"parameterized, batch_size={batch_size}",
+            lambda: sql.insert_into(
+                "test", df, batch_size=batch_size, fast_executemany=False
+            ),
+        ),
+    ):
+        sql._con = sqlite3.connect(":memory:")
+        sql.run(
+            "CREATE TABLE test (id INTEGER, country VARCHAR(100), sales FLOAT, quantity INTEGER)"
+        )
+
+        start = time.perf_counter()
+        insert()
+        elapsed = time.perf_counter() - start
+
+        inserted = sql.run("SELECT COUNT(*) FROM test")[0][0]
+        assert inserted == rows, f"Expected {rows} rows, got {inserted}."
+        print(f"{name:<40} {elapsed:8.2f}s {rows / elapsed:12,.0f} rows/s")
+        sql._con.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    run_benchmark(rows=args.rows, batch_size=args.batch_size)
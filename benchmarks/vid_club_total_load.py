@@ -0,0 +1,168 @@
+"""
+Compare the time it takes `VidClub.total_load()` to download a multi-year date range
+with concurrent date intervals against the previous implementation, which downloaded
+the intervals one by one, grew each interval's data frame page by page with
+`pd.concat()` and checked every cell for lists with `applymap()`.
+
+The API is simulated with a fixed latency per request, so the benchmark runs without
+Vid Club credentials.
+
+Usage:
+    python benchmarks/vid_club_total_load.py --years 3 --pages 20 --latency 0.05
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+from unittest import mock
+
+import pandas as pd
+
+from viadot.sources import VidClub, vid_club
+
+ITEMS_PER_PAGE = 100
+
+
+class LegacyVidClub(VidClub):
+    """`VidClub` downloading date intervals sequentially, as before."""
+
+    def get_response(
+        self,
+        source=None,
+        from_date="2022-03-22",
+        to_date=None,
+        items_per_page=100,
+        region=None,
+    ) -> pd.DataFrame:
+        response, first_url = self.check_connection(
+            source=source,
+            from_date=from_date,
+            to_date=to_date,
+            items_per_page=items_per_page,
+            region=region,
+        )
+        df = pd.json_normalize(response["data"])
+        length = df.shape[0]
+        page = 1
+        while length == items_per_page:
+            page += 1
+            url = f"{first_url}&page={page}"
+            r = vid_club.handle_api_response(
+                url=url, headers=self.headers, method="GET", verify=False
+            )
+            df_page = pd.json_normalize(r.json()["data"])
+            length = df_page.shape[0]
+            df = pd.concat((df, df_page), axis=0)
+        return df
+
+    def total_load(
+        self,
+        source=None,
+        from_date="2022-03-22",
+        to_date=None,
+        items_per_page=100,
+        region=None,
+        days_interval=30,
+        max_workers=None,
+    ) -> pd.DataFrame:
+        starts, ends = self.intervals(
+            from_date=from_date, to_date=to_date, days_interval=days_interval
+        )
+        dfs_list = []
+        for start, end in zip(starts, ends):
+            df = self.get_response(
+                source=source,
+                from_date=start,
+                to_date=end,
+                items_per_page=items_per_page,
+                region=region,
+            )
+            dfs_list.append(df)
+            if len(dfs_list) > 1:
+                df = pd.concat(dfs_list, axis=0, ignore_index=True)
+            else:
+                df = pd.DataFrame(dfs_list[0])
+        list_columns = df.columns[
+            df.applymap(lambda x: isinstance(x, list)).any()
+        ].tolist()
+        for i in list_columns:
+            df[i] = df[i].apply(lambda x: tuple(x) if isinstance(x, list) else x)
+        df.drop_duplicates(inplace=True)
+        return df
+
+
+def mock_api(pages: int, latency: float):
+    """Simulate the `jobs` endpoint, returning `pages` full pages per date range."""
+    regions = ["bg", "hu", "hr", "pl", "ro", "si"]
+
+    def _handle_api_response(url, **kwargs):
+        time.sleep(latency)
+        page = int(url.split("&page=")[-1]) if "&page=" in url else 1
+        from_date = url.split("from=")[1][:10]
+        seed = int(from_date.replace("-", "")) + page
+        items = ITEMS_PER_PAGE if page < pages else ITEMS_PER_PAGE // 2
+        data = [
+            {
+                "jobId": f"{from_date}-{page}-{i}",
+                "region": regions[i % len(regions)],
+                "amount": float((seed * 7919 + i * 104729) % 10_000),
+                "details": {"status": "done", "rating": (seed + i) % 5 + 1},
+                "tags": ["a", "b"] if i % 2 else [],
+            }
+            for i in range(items)
+        ]
+        response = mock.MagicMock()
+        response.json.return_value = json.loads(json.dumps({"data": data}))
+        return response
+
+    return mock.patch(
+        "viadot.sources.vid_club.handle_api_response",
+        side_effect=_handle_api_response,
+    )
+
+
+def run_benchmark(years: int, pages: int, latency: float, max_workers: int) -> None:
+    from_date = "2022-03-22"
+    to_date = datetime(2022 + years, 3, 22).strftime("%Y-%m-%d")
+    credentials = {"token": "token", "url": "https://vidclub.example.com/api/"}
+
+    results = {}
+    for name, source_class in (
+        ("sequential intervals", LegacyVidClub),
+        (f"concurrent, max_workers={max_workers}", VidClub),
+    ):
+        vc = source_class(credentials=credentials)
+        with mock_api(pages=pages, latency=latency):
+            start = time.perf_counter()
+            results[name] = vc.total_load(
+                source="jobs",
+                from_date=from_date,
+                to_date=to_date,
+                items_per_page=ITEMS_PER_PAGE,
+                max_workers=max_workers,
+            )
+            elapsed = time.perf_counter() - start
+        rows = len(results[name])
+        print(f"{name:<30} {elapsed:8.2f}s {rows / elapsed:12,.0f} rows/s")
+
+    legacy_df, df = results.values()
+    pd.testing.assert_frame_equal(
+        legacy_df.reset_index(drop=True), df.reset_index(drop=True)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--max-workers", type=int, default=4)
+    args = parser.parse_args()
+
+    run_benchmark(
+        years=args.years,
+        pages=args.pages,
+        latency=args.latency,
+        max_workers=args.max_workers,
+    )
@@ -1,3 +1,7 @@
+import copy
+import json
+from unittest import mock
+
 import pandas as pd
 import pytest
 
@@ -91,6 +95,44 @@ def test_customer_gauge_to_df_loop():
     assert len(df) > PAGESIZE
 
 
+@pytest.mark.looping_api_calls
+def test_customer_gauge_to_df_pipeline():
+    """
+    Test the 'run' method with mocked pages. Pages should be flattened in order and the token
+    should be requested only once.
+    """
+    pages = {None: (RAW_JSON["data"], 1), 1: (RAW_JSON["data"][:1], 2), 2: ([], 2)}
+
+    def mock_response(url, method="GET", params=None, **kwargs):
+        response = mock.MagicMock()
+        if method == "POST":
+            response.json.return_value = {"access_token": "token", "expires_in": 3600}
+        else:
+            data, next_cursor = pages[params["cursor"]]
+            response.json.return_value = {
+                "data": copy.deepcopy(data),
+                "cursor": {"next": next_cursor},
+            }
+        return response
+
+    credentials = json.dumps({"client_id": "pipeline-test", "client_secret": "secret"})
+    with mock.patch(
+        "viadot.tasks.customer_gauge.AzureKeyVaultSecret"
+    ) as secret, mock.patch(
+        "viadot.sources.customer_gauge.handle_api_response", side_effect=mock_response
+    ) as api:
+        secret.return_value.run.return_value = credentials
+        df = CG.run(total_load=True, unpack_by_field_reference_cols=["properties"])
+
+    assert api.call_count == 4
+    assert df["number_customer"].tolist() == ["266", "206", "266"]
+    assert df["properties_city"].tolist() == ["Eldorado", "Neverland", "Eldorado"]
+    assert df["drivers"][0] == (
+        "Product Quality and Product Performance, Function and Design, "
+        "Value for Money, Packaging"
+    )
+
+
 @pytest.mark.get_data
 def test_get_data():
     """
@@ -56,7 +56,7 @@ def var_dictionary() -> None:
 
 
 class MockGenesysTask:
-    report_data = ([[None, "COMPLETED"], [None, "COMPLETED"]],)
+    report_data = [[None, "COMPLETED"], [None, "COMPLETED"]]
 
     def genesys_api_connection(post_data_list, end_point, method="POST"):
         if method == "GET":
@@ -262,6 +262,12 @@ class MockGenesysTask:
             "V_D_PROD_FB_QUEUE_CHAT.csv",
         ]
 
+    def download_reporting_exports_when_ready(path, timeout):
+        return [
+            "V_D_PROD_FB_QUEUE_CALLBACK.csv",
+            "V_D_PROD_FB_QUEUE_CHAT.csv",
+        ]
+
     def delete_all_reporting_exports():
         pass
 
@@ -294,8 +300,8 @@ def test_genesys_files_type(mock_genesys, var_dictionary):
 
 @mock.patch("viadot.tasks.genesys.Genesys", return_value=MockGenesysTask)
 @pytest.mark.conv
-def test_genesys_conversations(mock_genesys, var_dictionary):
-    to_csv = GenesysToCSV()
+def test_genesys_conversations(mock_genesys, var_dictionary, tmp_path):
+    to_csv = GenesysToCSV(local_file_path=str(tmp_path))
     file_name = to_csv.run(
         view_type=None,
         end_point="analytics/conversations/details/query",
@@ -310,8 +316,8 @@ def test_genesys_conversations(mock_genesys, var_dictionary):
 
 @mock.patch("viadot.tasks.genesys.Genesys", return_value=MockGenesysTask)
 @pytest.mark.conv
-def test_genesys_webmsg_conversations(mock_genesys, var_dictionary):
-    to_csv = GenesysToCSV()
+def test_genesys_webmsg_conversations(mock_genesys, var_dictionary, tmp_path):
+    to_csv = GenesysToCSV(local_file_path=str(tmp_path))
     file_name = to_csv.run(
         view_type=None,
         end_point="conversations",
@@ -331,8 +337,8 @@ def test_genesys_webmsg_conversations(mock_genesys, var_dictionary):
 
 @mock.patch("viadot.tasks.genesys.Genesys", return_value=MockGenesysTask)
 @pytest.mark.conv
-def test_genesys_users(mock_genesys, var_dictionary):
-    to_csv = GenesysToCSV()
+def test_genesys_users(mock_genesys, var_dictionary, tmp_path):
+    to_csv = GenesysToCSV(local_file_path=str(tmp_path))
     file_name = to_csv.run(
         view_type=None,
         end_point="users",
@@ -361,3 +367,24 @@ def test_genesys_queue_performance_detail_view(mock_genesys, var_dictionary):
         end_date=var_dictionary["end_date"],
     )
     assert output is None
+
+
+def test_merge_conversations_dfs():
+    conversations = MockGenesysTask.genesys_api_connection(
+        post_data_list=None, end_point=None
+    )["conversations"]
+
+    df = GenesysToCSV().merge_conversations_dfs(conversations)
+
+    # one row per metric, segment and media endpoint stats entry of each session
+    assert len(df) == 14
+    assert df["conversationId"].nunique() == 1
+    for column in [
+        "participantName",
+        "metrics_name",
+        "segments_segmentType",
+        "mediaEndpointStats_minMos",
+        "flow_flowName",
+    ]:
+        assert column in df.columns
+    assert "participants" not in df.columns and "sessions" not in df.columns
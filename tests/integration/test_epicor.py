@@ -1,9 +1,16 @@
+import xml.etree.ElementTree as ET
+from unittest import mock
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 from viadot.config import local_config
 from viadot.exceptions import CredentialError, DataRangeError
 from viadot.sources import Epicor
+from viadot.sources.epicor import ORDER_COLUMNS, parse_orders_xml
+from viadot.task_utils import add_ingestion_metadata_task, cast_df_to_str
 
 
 @pytest.fixture(scope="session")
@@ -71,3 +78,93 @@ def test_credentials_not_provided():
 def test_to_df_return_type(epicor):
     df = epicor.to_df()
     assert isinstance(df, pd.DataFrame)
+
+
+def test_parse_orders_xml():
+    xml = """<?xml version="1.0"?>
+    <OrderQueryResponse>
+        <Order>
+            <HeaderInformation>
+                <OrderNumber>1</OrderNumber>
+                <TrackingNumbers>
+                    <TrackingNumber>A</TrackingNumber>
+                    <TrackingNumber>B</TrackingNumber>
+                </TrackingNumbers>
+                <InvoiceTotals><TotalInvoice>10.00</TotalInvoice></InvoiceTotals>
+            </HeaderInformation>
+            <LineItemDetails>
+                <LineItemDetail><ProductNumber>P1</ProductNumber></LineItemDetail>
+                <LineItemDetail><ProductNumber>P2</ProductNumber></LineItemDetail>
+            </LineItemDetails>
+        </Order>
+        <Order>
+            <HeaderInformation><OrderNumber>2</OrderNumber></HeaderInformation>
+            <LineItemDetails>
+                <LineItemDetail><ProductNumber>P3</ProductNumber></LineItemDetail>
+            </LineItemDetails>
+        </Order>
+    </OrderQueryResponse>"""
+
+    df = parse_orders_xml(xml)
+
+    assert df["HeaderInformation.OrderNumber"].tolist() == ["1", "1", "2"]
+    assert df["LineItemDetail.ProductNumber"].tolist() == ["P1", "P2", "P3"]
+    assert df["HeaderInformation.TrackingNumbers.TrackingNumber"].tolist() == [
+        "'A''B'",
+        "'A''B'",
+        None,
+    ]
+    assert df["HeaderInformation.InvoiceTotals.TotalInvoice"][0] == "10.00"
+
+
+def test_iter_filters_days_interval():
+    epicor = Epicor(
+        base_url="/api/orders",
+        credentials={"host": "host", "port": 1111, "username": "u", "password": "p"},
+        filters_xml="""
+    <OrderQuery>
+        <QueryFields>
+            <BegInvoiceDate>2022-05-01</BegInvoiceDate>
+            <EndInvoiceDate>2022-05-16</EndInvoiceDate>
+        </QueryFields>
+    </OrderQuery>""",
+        days_interval=7,
+    )
+
+    windows = [
+        (
+            ET.fromstring(filters).findtext(".//BegInvoiceDate"),
+            ET.fromstring(filters).findtext(".//EndInvoiceDate"),
+        )
+        for filters in epicor.iter_filters()
+    ]
+
+    assert windows == [
+        ("2022-05-01", "2022-05-07"),
+        ("2022-05-08", "2022-05-14"),
+        ("2022-05-15", "2022-05-16"),
+    ]
+
+
+def test_to_parquet_matches_df_schema(tmp_path):
+    epicor = Epicor(
+        base_url="/api/orders",
+        credentials={"host": "host", "port": 1111, "username": "u", "password": "p"},
+        filters_xml="<OrderQuery/>",
+        validate_date_filter=False,
+    )
+    rows = [[str(i)] * len(ORDER_COLUMNS) for i in range(3)]
+    path = str(tmp_path / "orders.parquet")
+
+    with mock.patch.object(Epicor, "iter_rows", side_effect=lambda: iter(rows)):
+        written = epicor.to_parquet(path=path, batch_size=2)
+        df = add_ingestion_metadata_task.run(cast_df_to_str.run(epicor.to_df()))
+
+    table = pq.read_table(path)
+    assert written is True
+    assert table.num_rows == 3
+    assert table.schema.names == list(df.columns)
+    assert (
+        table.schema.remove_metadata()
+        == pa.Table.from_pandas(df, preserve_index=False).schema.remove_metadata()
+    )
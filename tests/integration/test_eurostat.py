@@ -4,6 +4,7 @@ import pandas as pd
 import pytest
 
 from viadot.sources import Eurostat
+from viadot.sources.eurostat import jsonstat_to_df
 
 
 def test_and_validate_dataset_code_without_params(caplog):
@@ -138,3 +139,50 @@ def test_correct_params_and_dataset_code(caplog):
     assert isinstance(source, pd.DataFrame)
     assert not source.empty
     assert caplog.text == ""
+
+
+def test_jsonstat_to_df():
+    """This function tests decoding a sparse JSON-stat cube with more than two non-trivial
+    dimensions, given either as a `value` object or as a `value` array with nulls.
+    """
+    data = {
+        "id": ["unit", "geo", "time"],
+        "size": [2, 2, 3],
+        "dimension": {
+            "unit": {"category": {"index": ["EUR", "PLN"]}},
+            "geo": {
+                "category": {
+                    "index": {"PL": 1, "DE": 0},
+                    "label": {"DE": "Germany", "PL": "Poland"},
+                }
+            },
+            "time": {
+                "category": {
+                    "index": {"2021": 0, "2022": 1, "2023": 2},
+                    "label": {"2021": "2021", "2022": "2022", "2023": "2023"},
+                }
+            },
+        },
+        "value": {"11": 5.0, "0": 1.0, "4": 2.0, "7": 3.0},
+    }
+    expected_df = pd.DataFrame(
+        {
+            "unit": pd.Categorical(["EUR", "EUR", "PLN", "PLN"], ["EUR", "PLN"]),
+            "geo": pd.Categorical(
+                ["Germany", "Poland", "Germany", "Poland"], ["Germany", "Poland"]
+            ),
+            "time": pd.Categorical(
+                ["2021", "2022", "2022", "2023"], ["2021", "2022", "2023"]
+            ),
+            "indicator": [1.0, 2.0, 3.0, 5.0],
+        }
+    )
+
+    pd.testing.assert_frame_equal(jsonstat_to_df(data), expected_df)
+
+    data["value"] = [1.0, None, None, None, 2.0, None, None, 3.0, None, None, None, 5.0]
+    pd.testing.assert_frame_equal(jsonstat_to_df(data), expected_df)
+
+    df = Eurostat(dataset_code="TEST").eurostat_dictionary_to_df(["geo", "time"], data)
+    assert df.columns.tolist() == ["geo", "time", "indicator"]
+    assert df["geo"].tolist() == ["Germany", "Poland", "Germany", "Poland"]
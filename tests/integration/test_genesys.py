@@ -224,3 +224,28 @@ def test_genesys_delete_reports(mock_api_response, var_dictionary):
     g.report_data = var_dictionary["report_data"]
     g.delete_all_reporting_exports()
     mock_api_response.assert_called()
+
+
+@mock.patch.object(Genesys, "download_report")
+@mock.patch.object(Genesys, "load_reporting_exports")
+@pytest.mark.download
+def test_download_reporting_exports_when_ready(
+    mock_load_exports, mock_download_report, var_dictionary
+):
+    completed = var_dictionary["entities"]["entities"][0]
+    running = dict(completed, status="RUNNING", downloadUrl=None)
+    mock_load_exports.side_effect = [
+        {"entities": [running]},
+        {"entities": [completed]},
+    ]
+    g = Genesys(credentials_genesys={"CLIENT_ID": "id", "ENVIRONMENT": "test"})
+    g.view_type = "queue_performance_detail_view"
+    g.start_date = "2022-08-02"
+    g.report_ids = [completed["id"]]
+
+    file_names = g.download_reporting_exports_when_ready(poll_interval=0)
+
+    assert mock_load_exports.call_count == 2
+    mock_download_report.assert_called_once()
+    assert file_names == ["QUEUE_PERFORMANCE_DETAIL_VIEW_0_20220802.csv"]
+    assert g.report_data[0][-1] == "COMPLETED"
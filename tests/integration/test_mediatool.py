@@ -79,11 +79,12 @@ def test_get_vehicles_wrong_ids(caplog):
     assert "Vehicle were not found for: ['100000', '200000']" in caplog.text
 
 
-def test_get_vehicles_return_dict():
+def test_get_vehicles_return_list():
     vehicles = MTOOL.get_vehicles(
         vehicle_ids=[CREDENTIALS["VEHICLE_ID"]], return_dataframe=False
     )
-    assert isinstance(vehicles, dict)
+    assert isinstance(vehicles, list)
+    assert all(isinstance(vehicle, dict) for vehicle in vehicles)
 
 
 def test_rename_columns_correct():
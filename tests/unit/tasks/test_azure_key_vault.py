@@ -1,6 +1,12 @@
+import threading
+import time
+
 import pytest
+from cryptography.fernet import Fernet
 
 from viadot.tasks import AzureKeyVaultSecret, CreateAzureKeyVaultSecret
+from viadot.tasks import azure_key_vault
+from viadot.tasks.azure_key_vault import SecretCache
 
 
 class TestReadAzureKeyVaultSecret:
@@ -18,6 +24,76 @@ class TestReadAzureKeyVaultSecret:
         with pytest.raises(ValueError, match="secret"):
             task.run()
 
+    def test_secret_is_cached(self, monkeypatch):
+        fetched = []
+
+        class FakeSecretClient:
+            def get_secret(self, secret):
+                fetched.append(secret)
+                return type("Secret", (), {"value": "test_value"})
+
+        monkeypatch.setattr(
+            azure_key_vault, "get_key_vault", lambda **kwargs: FakeSecretClient()
+        )
+        monkeypatch.setattr(azure_key_vault, "secret_cache", SecretCache())
+
+        task = AzureKeyVaultSecret(secret="test", vault_name="test_vault")
+        assert task.run() == "test_value"
+        assert task.run() == "test_value"
+        assert fetched == ["test"]
+        assert azure_key_vault.secret_cache.hits == 1
+
+        task = AzureKeyVaultSecret(
+            secret="test", vault_name="test_vault", use_cache=False
+        )
+        task.run()
+        assert fetched == ["test", "test"]
+
+
+class TestSecretCache:
+    def test_ttl(self):
+        cache = SecretCache(ttl=0.1)
+        cache.set("vault", "secret", "value")
+        assert cache.get("vault", "secret") == "value"
+
+        time.sleep(0.2)
+        assert cache.get("vault", "secret") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_get_or_fetch_fetches_once(self):
+        cache = SecretCache()
+        fetched = []
+
+        def fetch():
+            time.sleep(0.1)
+            fetched.append(1)
+            return "value"
+
+        threads = [
+            threading.Thread(target=cache.get_or_fetch, args=("vault", "secret", fetch))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert fetched == [1]
+        assert cache.get_or_fetch("vault", "secret", fetch) == "value"
+
+    def test_encrypted_spill(self, tmp_path):
+        key = Fernet.generate_key().decode()
+        SecretCache(cache_dir=tmp_path, encryption_key=key).set(
+            "vault", "secret", "value"
+        )
+        assert b"value" not in next(tmp_path.iterdir()).read_bytes()
+
+        cache = SecretCache(cache_dir=tmp_path, encryption_key=key)
+        assert cache.get("vault", "secret") == "value"
+
+        cache.invalidate("vault", "secret")
+        assert not list(tmp_path.iterdir())
+
 
 class TestCreateAzureKeyVaultSecret:
     def test_initialization(self):
@@ -16,8 +16,8 @@ def duckdb():
     yield duckdb
 
 
-def test_create_table_empty_file(duckdb):
-    path = "empty.parquet"
+def test_create_table_empty_file(duckdb, tmp_path):
+    path = str(tmp_path / "empty.parquet")
     with open(path, "w"):
         pass
     duckdb_creds = {f"database": DATABASE_PATH}
@@ -25,7 +25,6 @@ def test_create_table_empty_file(duckdb):
     task.run(schema=SCHEMA, table=TABLE, path=path, if_empty="skip")
 
     assert duckdb._check_if_table_exists(TABLE, schema=SCHEMA) == False
-    os.remove(path)
 
 
 def test_create_table(duckdb, TEST_PARQUET_FILE_PATH):
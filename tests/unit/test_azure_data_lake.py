@@ -0,0 +1,82 @@
+import time
+
+import pytest
+from fsspec.implementations.local import LocalFileSystem
+
+from viadot.sources import AzureDataLake
+
+CREDENTIALS = {
+    "ACCOUNT_NAME": "test_account",
+    "AZURE_TENANT_ID": "00000000-0000-0000-0000-000000000000",
+    "AZURE_CLIENT_ID": "test_client",
+    "AZURE_CLIENT_SECRET": "test_secret",
+}
+
+
+@pytest.fixture
+def lake():
+    lake = AzureDataLake(credentials=CREDENTIALS)
+    lake.fs = LocalFileSystem()
+    return lake
+
+
+def test_bulk_upload(lake, tmp_path):
+    (tmp_path / "lake").mkdir()
+    paths = []
+    for i in range(10):
+        local_path = tmp_path / f"file_{i}.csv"
+        local_path.write_text("a,b\n1,2\n")
+        paths.append((str(local_path), str(tmp_path / "lake" / f"file_{i}.csv")))
+
+    summary = lake.bulk_upload(paths, max_workers=4)
+
+    assert summary["files"] == 10
+    assert summary["bytes"] == 80
+    assert len(lake.ls(str(tmp_path / "lake"))) == 10
+
+
+def test_bulk_transfer_retries(lake, tmp_path):
+    local_path = tmp_path / "file.csv"
+    local_path.write_text("a,b\n1,2\n")
+    calls = []
+    upload = lake.upload
+
+    def flaky_upload(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise ConnectionError("Connection reset.")
+        return upload(**kwargs)
+
+    lake.upload = flaky_upload
+    lake.bulk_upload([(str(local_path), str(tmp_path / "uploaded.csv"))], retry_delay=0)
+    assert len(calls) == 2
+
+    with pytest.raises(IOError, match="1 of 1"):
+        lake.bulk_upload(
+            [(str(tmp_path / "missing.csv"), str(tmp_path / "uploaded.csv"))],
+            max_retries=1,
+            retry_delay=0,
+        )
+
+
+def test_bulk_transfer_timeout(lake, tmp_path):
+    local_path = tmp_path / "file.csv"
+    local_path.write_text("a,b\n1,2\n")
+    calls = []
+
+    def upload(**kwargs):
+        calls.append(kwargs)
+        time.sleep(0.5)
+
+    lake.upload = upload
+
+    with pytest.raises(TimeoutError):
+        lake.bulk_upload(
+            [(str(local_path), str(tmp_path / f"uploaded_{i}.csv")) for i in range(4)],
+            max_workers=1,
+            timeout=0.1,
+        )
+
+    # The transfers which haven't started are cancelled.
+    time.sleep(1)
+    assert len(calls) == 1
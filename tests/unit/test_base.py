@@ -1,8 +1,12 @@
+import datetime
+import decimal
 import logging
 import os
+import sqlite3
 
 import pandas as pd
 import pyarrow as pa
+import pyodbc
 import pytest
 
 from viadot.signals import SKIP
@@ -34,6 +38,50 @@ class EmptySource(Source):
         return df
 
 
+class MixedTypesSource(Source):
+    def to_df(self, if_empty, fields=None):
+        df = pd.DataFrame({"a": [1, "x"], "b": [1, 2]})
+        return df[fields] if fields else df
+
+
+class BatchSource(NotEmptySource):
+    def to_arrow_batches(self, if_empty="warn", batch_size=2):
+        table = pa.Table.from_pandas(self.to_df(if_empty=if_empty))
+        return pa.RecordBatchReader.from_batches(
+            table.schema, table.to_batches(max_chunksize=batch_size)
+        )
+
+
+class FakeCursor:
+    description = [
+        ("country", str, None, 100, 100, 0, True),
+        ("sales", int, None, 10, 10, 0, True),
+    ]
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.arraysize = 1
+        self.closed = False
+
+    def execute(self, query):
+        pass
+
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self._cursor = FakeCursor(rows)
+
+    def cursor(self):
+        return self._cursor
+
+
 def test_empty_source_skip():
     empty = EmptySource()
     result = empty.to_csv(path=PATH, if_empty="skip")
@@ -54,6 +102,44 @@ def test_to_arrow():
     assert isinstance(res, pa.Table) == True
 
 
+def test_to_arrow_batches():
+    src = NotEmptySource()
+    reader = src.to_arrow_batches(batch_size=2)
+    batches = list(reader)
+    assert reader.schema.names == ["country", "sales"]
+    assert [batch.num_rows for batch in batches] == [2, 1]
+
+
+def test_to_csv_in_batches():
+    src = NotEmptySource()
+    res = src.to_csv(path="testbase.csv", batch_size=1)
+    assert res == True
+    df = pd.read_csv("testbase.csv", sep="\t")
+    assert df.shape == (3, 2)
+    os.remove("testbase.csv")
+
+
+def test_to_csv_mixed_types_and_to_df_kwargs(tmp_path):
+    src = MixedTypesSource()
+    path = tmp_path / "mixed.csv"
+    fields_path = tmp_path / "fields.csv"
+
+    assert src.to_csv(path=str(path)) is True
+    assert src.to_csv(path=str(fields_path), fields=["b"]) is True
+
+    assert pd.read_csv(path, sep="\t").shape == (2, 2)
+    assert pd.read_csv(fields_path, sep="\t").columns.tolist() == ["b"]
+
+
+def test_to_csv_streaming_source(tmp_path):
+    src = BatchSource()
+    path = tmp_path / "batches.csv"
+
+    assert src.to_csv(path=str(path), batch_size=1) is True
+
+    assert pd.read_csv(path, sep="\t").shape == (3, 2)
+
+
 def test_to_excel():
     src = NotEmptySource()
     res = src.to_excel(path="testbase.xlsx")
@@ -73,6 +159,34 @@ def test_to_parquet(caplog):
     os.remove("testbase.parquet")
 
 
+def test_to_parquet_in_batches():
+    src = NotEmptySource()
+    src.to_parquet(path="testbase.parquet", batch_size=1)
+    df = pd.read_parquet("testbase.parquet")
+    assert df.shape == (3, 2)
+    os.remove("testbase.parquet")
+
+
+def test_to_parquet_pandas_kwargs(tmp_path):
+    src = NotEmptySource()
+    path = str(tmp_path / "testbase.parquet")
+
+    assert src.to_parquet(path=path, engine="pyarrow") is True
+    assert src.to_parquet(path=path, if_exists="append", engine="pyarrow") is True
+    assert src.to_parquet(path=path, if_exists="skip") is False
+
+    assert pd.read_parquet(path).shape == (6, 2)
+
+
+def test_to_parquet_skip_only_if_exists(tmp_path):
+    src = NotEmptySource()
+    path = str(tmp_path / "testbase.parquet")
+
+    assert src.to_parquet(path=path, if_exists="skip") is True
+    assert src.to_parquet(path=path, if_exists="skip") is False
+    assert pd.read_parquet(path).shape == (3, 2)
+
+
 def test_handle_if_empty(caplog):
     src = EmptySource()
     src._handle_if_empty(if_empty="warn")
@@ -81,3 +195,64 @@ def test_handle_if_empty(caplog):
         src._handle_if_empty(if_empty="fail")
     with pytest.raises(SKIP):
         src._handle_if_empty(if_empty="skip")
+
+
+def test_sql_to_arrow_batches():
+    rows = [("italy", 100), ("germany", None), ("spain", 80)]
+    con = FakeConnection(rows)
+    sql = SQL(credentials={}, arraysize=2)
+
+    reader = sql.to_arrow_batches("SELECT * FROM test", con=con)
+    table = reader.read_all()
+
+    assert table.schema == pa.schema([("country", pa.string()), ("sales", pa.int64())])
+    assert table.num_rows == 3
+    assert table.to_batches()[0].num_rows == 2
+    assert table.column("sales").to_pylist() == [100, None, 80]
+    assert con._cursor.closed
+
+
+def test_sql_to_arrow_batches_empty_skip():
+    sql = SQL(credentials={})
+    with pytest.raises(SKIP):
+        sql.to_arrow_batches(
+            "SELECT * FROM test", if_empty="skip", con=FakeConnection([])
+        )
+
+
+def test_sql_insert_into_batches():
+    sql = SQL(credentials={})
+    sql._con = sqlite3.connect(":memory:")
+    sql.run("CREATE TABLE test (country VARCHAR(100), sales FLOAT)")
+    df = pd.DataFrame(
+        {"country": ["italy", "germany", "spain"], "sales": [100, None, 80]}
+    )
+
+    query = sql.insert_into("test", df, batch_size=2, fast_executemany=False)
+
+    assert query == "INSERT INTO test (country, sales)\n VALUES (?, ?);"
+    assert sql.run("SELECT * FROM test") == [
+        ("italy", 100.0),
+        ("germany", None),
+        ("spain", 80.0),
+    ]
+
+
+def test_sql_get_input_sizes_object_columns():
+    df = pd.DataFrame(
+        {
+            "date": [datetime.date(2024, 1, 1), None],
+            "timestamp": [datetime.datetime(2024, 1, 1, 12), None],
+            "amount": [decimal.Decimal("123.45"), decimal.Decimal("-0.001")],
+            "name": ["italy", None],
+            "mixed": [1, "x"],
+        }
+    )
+
+    assert SQL._get_input_sizes(df) == [
+        (pyodbc.SQL_TYPE_DATE, 0, 0),
+        (pyodbc.SQL_TYPE_TIMESTAMP, 0, 6),
+        (pyodbc.SQL_DECIMAL, 6, 3),
+        (pyodbc.SQL_WVARCHAR, 5, 0),
+        (pyodbc.SQL_WVARCHAR, 1, 0),
+    ]
@@ -1,10 +1,30 @@
 import os
+from unittest import mock
 
 import pytest
 
 from viadot.sources import CloudForCustomers
+from viadot.sources.cloud_for_customers import (
+    _COLUMN_MAPPING_CACHE,
+    get_column_mapping,
+    records_to_columns,
+)
 
 TEST_FILE_1 = "tests_out.csv"
+METADATA = """<?xml version="1.0" encoding="utf-8"?>
+<edmx:Edmx Version="1.0" xmlns:edmx="http://schemas.microsoft.com/ado/2007/06/edmx"
+    xmlns:sap="http://www.sap.com/Protocols/SAPData">
+  <edmx:DataServices>
+    <Schema Namespace="cust" xmlns="http://schemas.microsoft.com/ado/2008/09/edm">
+      <EntityType Name="Report" sap:label="Report">
+        <Key><PropertyRef Name="ID"/></Key>
+        <Property Name="ID" Type="Edm.String" Nullable="false"/>
+        <Property Name="CDOC_ID" Type="Edm.String" sap:label="Document ID"/>
+        <Property Name="KC_AMOUNT" Type="Edm.Decimal" sap:label="Amount"/>
+      </EntityType>
+    </Schema>
+  </edmx:DataServices>
+</edmx:Edmx>"""
 
 
 @pytest.fixture(scope="session")
@@ -35,3 +55,123 @@ def test_to_records(cloud_for_customers):
 def test_csv(cloud_for_customers):
     csv = cloud_for_customers.to_csv(path=TEST_FILE_1)
     assert os.path.isfile(TEST_FILE_1) == True
+
+
+def test_get_column_mapping_cached(tmp_path):
+    url = "https://c4c.example.com/sap/c4c/odata/ana_businessanalytics_analytics.svc/$metadata?entityset=Report"
+    _COLUMN_MAPPING_CACHE.clear()
+    response = mock.Mock(text=METADATA)
+    with mock.patch(
+        "viadot.sources.cloud_for_customers.handle_api_response",
+        return_value=response,
+    ) as mock_api_response:
+        mapping = get_column_mapping(url, cache_dir=tmp_path)
+        assert get_column_mapping(url, cache_dir=tmp_path) == mapping
+        assert mock_api_response.call_count == 1
+
+        # a new process only reads the mapping from disk
+        _COLUMN_MAPPING_CACHE.clear()
+        assert get_column_mapping(url, cache_dir=tmp_path) == mapping
+        assert mock_api_response.call_count == 1
+
+    assert mapping == {"CDOC_ID": "Document ID", "KC_AMOUNT": "Amount"}
+
+
+class MockODataResponse:
+    def __init__(self, response_json):
+        self.response_json = response_json
+
+    def json(self):
+        return self.response_json
+
+
+def mock_odata_service(url, params=None, **kwargs):
+    """Serves 2500 records, at most 400 per response, like a server-side page size limit."""
+    records = [{"ID": i, "Name": f"name_{i}"} for i in range(2500)]
+    if params is None:
+        # a `__next` link
+        skip, top = [int(value) for value in url.split("?")[1].split(",")]
+    else:
+        skip, top = params.get("$skip", 0), params.get("$top", len(records))
+    page = records[skip : skip + min(top, 400)]
+    response_json = {"d": {"results": page}}
+    if params and params.get("$inlinecount") == "allpages":
+        response_json["d"]["__count"] = str(len(records))
+    if len(page) < min(top, len(records) - skip):
+        next_query = f"{skip + len(page)},{top - len(page)}"
+        response_json["d"]["__next"] = url.split("?")[0] + "?" + next_query
+    return MockODataResponse(response_json)
+
+
+def test_to_records_parallel():
+    c4c = CloudForCustomers(
+        url="https://c4c.example.com/sap/c4c/odata/v1/c4codataapi/",
+        endpoint="ServiceRequestCollection",
+        max_workers=3,
+        page_size=1000,
+    )
+    with mock.patch.object(
+        CloudForCustomers, "get_response", side_effect=mock_odata_service
+    ) as mock_get_response:
+        records = c4c.to_records()
+
+    assert [record["ID"] for record in records] == list(range(2500))
+    # pages of 1000, 1000 and 500 records, split into responses of at most 400
+    assert mock_get_response.call_count == 3 + 3 + 2
+
+
+def test_to_arrow_batches_parallel():
+    c4c = CloudForCustomers(
+        url="https://c4c.example.com/sap/c4c/odata/v1/c4codataapi/",
+        endpoint="ServiceRequestCollection",
+        max_workers=3,
+        page_size=400,
+    )
+    with mock.patch.object(
+        CloudForCustomers, "get_response", side_effect=mock_odata_service
+    ):
+        table = c4c.to_arrow_batches(batch_size=300).read_all()
+
+    assert table.num_rows == 2500
+    assert table.column("ID").to_pylist() == list(range(2500))
+
+
+def test_to_arrow_batches_schema_drift():
+    pages = [
+        {"ID": [1, 2], "Amount": [None, None], "Status": [1, 2]},
+        {"ID": [3], "Amount": [7], "Status": ["open"], "Owner": ["Jane"]},
+        {"ID": [4], "Amount": [7.5], "Status": [None]},
+    ]
+    c4c = CloudForCustomers(
+        url="https://c4c.example.com/sap/c4c/odata/v1/c4codataapi/",
+        endpoint="ServiceRequestCollection",
+    )
+    with mock.patch.object(CloudForCustomers, "iter_pages", return_value=iter(pages)):
+        table = c4c.to_arrow_batches(batch_size=1).read_all()
+
+    assert table.column_names == ["ID", "Amount", "Status", "Owner"]
+    assert table.column("ID").to_pylist() == [1, 2, 3, 4]
+    assert table.column("Amount").to_pylist() == [None, None, 7.0, 7.5]
+    assert table.column("Status").to_pylist() == ["1", "2", "open", None]
+    assert table.column("Owner").to_pylist() == [None, None, "Jane", None]
+
+
+def test_records_to_columns():
+    records = [
+        {
+            "__metadata": {"uri": "Report('1')"},
+            "CDOC_ID": "1",
+            "KC_AMOUNT": "10.5",
+            "Details": {"__deferred": {"uri": "Report('1')/Details"}},
+        },
+        {"__metadata": {"uri": "Report('2')"}, "CDOC_ID": "2", "Details": None},
+    ]
+
+    columns = records_to_columns(
+        records,
+        exclude=["__metadata"],
+        mapping={"CDOC_ID": "Document ID"},
+        skip_nested=True,
+    )
+
+    assert columns == {"Document ID": ["1", "2"], "KC_AMOUNT": ["10.5", None]}
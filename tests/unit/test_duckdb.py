@@ -126,3 +126,40 @@ def test_run_query_with_comments(duckdb, TEST_PARQUET_FILE_PATH):
     assert isinstance(output3, pd.DataFrame)
 
     duckdb.drop_table(TABLE, schema=SCHEMA)
+
+
+def test_connection_is_reused(duckdb):
+    assert duckdb.con is duckdb.con
+
+    duckdb.close_connection()
+    assert duckdb._con is None
+
+
+def test_transaction_rollback(duckdb, TEST_PARQUET_FILE_PATH):
+    duckdb.create_table_from_parquet(
+        schema=SCHEMA, table=TABLE, path=TEST_PARQUET_FILE_PATH
+    )
+
+    with pytest.raises(ValueError):
+        with duckdb.transaction():
+            duckdb.run(f"DELETE FROM {SCHEMA}.{TABLE}")
+            raise ValueError("Something went wrong.")
+
+    df = duckdb.to_df(f"SELECT * FROM {SCHEMA}.{TABLE}")
+    assert df.shape[0] == 3
+
+    duckdb.drop_table(TABLE, schema=SCHEMA)
+    duckdb.run(f"DROP SCHEMA {SCHEMA}")
+
+
+def test_context_manager_closes_connection(TEST_PARQUET_FILE_PATH):
+    with DuckDB(credentials=dict(database=DATABASE_PATH)) as duckdb:
+        duckdb.create_table_from_parquet(
+            schema=SCHEMA, table=TABLE, path=TEST_PARQUET_FILE_PATH
+        )
+        assert duckdb._check_if_schema_exists(SCHEMA)
+        assert duckdb._check_if_table_exists(TABLE, schema=SCHEMA)
+        duckdb.drop_table(TABLE, schema=SCHEMA)
+        duckdb.run(f"DROP SCHEMA {SCHEMA}")
+
+    assert duckdb._con is None
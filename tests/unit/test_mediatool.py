@@ -0,0 +1,53 @@
+import json
+from unittest import mock
+
+import pytest
+
+from viadot.exceptions import APIError
+from viadot.sources import Mediatool
+
+CREDENTIALS = {"TOKEN": "token", "USER_ID": "user"}
+
+
+def mock_api(missing_ids=()):
+    def _handle_api_response(url, **kwargs):
+        endpoint, id = url.split("/")[-2:]
+        if id in missing_ids:
+            raise APIError(f"The API call to {url} failed.")
+        key = {"vehicles": "vehicle", "mediatypes": "mediaType"}[endpoint]
+        response = mock.MagicMock()
+        response.text = json.dumps(
+            {key: {"_id": id, "name": f"{key} {id}", "type": "tv"}}
+        )
+        return response
+
+    return mock.patch(
+        "viadot.sources.mediatool.handle_api_response",
+        side_effect=_handle_api_response,
+    )
+
+
+def test_get_vehicles_deduplicates_and_caches(caplog):
+    mediatool = Mediatool(credentials=CREDENTIALS, max_workers=4)
+
+    with mock_api(missing_ids=["404"]) as api:
+        df = mediatool.get_vehicles(vehicle_ids=["1", "2", "1", "404", "3"])
+        assert api.call_count == 4
+
+        vehicles = mediatool.get_vehicles(
+            vehicle_ids=["3", "2", "4"], return_dataframe=False
+        )
+        assert api.call_count == 5
+
+    assert df["_id_vehicles"].tolist() == ["1", "2", "3"]
+    assert df["name_vehicles"].tolist() == ["vehicle 1", "vehicle 2", "vehicle 3"]
+    assert [vehicle["_id"] for vehicle in vehicles] == ["3", "2", "4"]
+    assert "Vehicle were not found for: ['404']." in caplog.text
+
+
+def test_get_media_types_wrong_id():
+    mediatool = Mediatool(credentials=CREDENTIALS)
+
+    with mock_api(missing_ids=["404"]):
+        with pytest.raises(APIError):
+            mediatool.get_media_types(media_type_ids=["1", "404"])
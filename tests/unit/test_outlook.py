@@ -144,7 +144,11 @@ def test_outlook_mailbox_folders_exception(var_dictionary):
 @mock.patch.object(Outlook, "get_all_mails_to_df", return_value=pd.DataFrame())
 @mock.patch("viadot.sources.outlook.Account", return_value=MockClass)
 @pytest.mark.to_csv
-def test_outlook_to_csv(mock_method_Outlook, mock_api_Account, var_dictionary):
+def test_outlook_to_csv(
+    mock_method_Outlook, mock_api_Account, var_dictionary, tmp_path, monkeypatch
+):
+    # `Outlook.to_csv()` writes to the working directory.
+    monkeypatch.chdir(tmp_path)
     o = Outlook(
         mailbox_name=var_dictionary["mailbox_name"],
         start_date=var_dictionary["start_date"],
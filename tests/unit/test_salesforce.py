@@ -0,0 +1,106 @@
+from unittest import mock
+
+import pyarrow.parquet as pq
+import pytest
+
+from viadot.exceptions import APIError
+from viadot.sources import Salesforce
+
+JOB_URL = "https://test.my.salesforce.com/services/data/v52.0/jobs/query"
+
+RESULT_CHUNKS = [
+    b'"Id","Name","Amount"\n"001","Acme","10.5"\n"002","Multi\nline",""\n',
+    b'"Id","Name","Amount"\n"003","Globex","7"\n',
+]
+
+
+@pytest.fixture
+def salesforce():
+    with mock.patch("viadot.sources.salesforce.SF") as sf:
+        sf.return_value.sf_instance = "test.my.salesforce.com"
+        sf.return_value.sf_version = "52.0"
+        sf.return_value.session_id = "token"
+        yield Salesforce(credentials={"username": "user", "password": "password"})
+
+
+def mock_bulk_api(states, records_processed=3):
+    states = iter(states)
+
+    def _handle_api_response(url, params=None, method="GET", **kwargs):
+        response = mock.MagicMock()
+        if method == "POST":
+            response.json.return_value = {"id": "750", "state": "UploadComplete"}
+        elif url == f"{JOB_URL}/750":
+            response.json.return_value = {
+                "id": "750",
+                "state": next(states),
+                "numberRecordsProcessed": records_processed,
+                "errorMessage": "INVALID_FIELD",
+            }
+        elif url == f"{JOB_URL}/750/results":
+            chunk = int(params.get("locator", 0))
+            response.content = RESULT_CHUNKS[chunk]
+            is_last = chunk == len(RESULT_CHUNKS) - 1
+            response.headers = {"Sforce-Locator": "null" if is_last else str(chunk + 1)}
+        return response
+
+    return mock.patch(
+        "viadot.sources.salesforce.handle_api_response",
+        side_effect=_handle_api_response,
+    )
+
+
+def test_download_follows_next_records_url(salesforce):
+    salesforce.salesforce.query_all_iter.return_value = iter(
+        [
+            {"attributes": {"type": "Account"}, "Id": "001"},
+            {"attributes": {"type": "Account"}, "Id": "002"},
+        ]
+    )
+
+    records = salesforce.download(table="Account", columns=["Id"])
+
+    salesforce.salesforce.query_all_iter.assert_called_once_with(
+        "SELECT Id FROM Account"
+    )
+    assert records == [{"Id": "001"}, {"Id": "002"}]
+
+
+def test_to_parquet_bulk(salesforce, tmp_path):
+    path = tmp_path / "accounts.parquet"
+
+    with mock_bulk_api(["InProgress", "JobComplete"]), mock.patch("time.sleep"):
+        salesforce.to_parquet(
+            path=str(path),
+            query="SELECT Id, Name, Amount FROM Account",
+            mode="bulk",
+            max_workers=1,
+        )
+
+    table = pq.read_table(path)
+    assert table.column_names == ["Id", "Name", "Amount"]
+    assert table.column("Id").to_pylist() == ["001", "002", "003"]
+    assert table.column("Name").to_pylist() == ["Acme", "Multi\nline", "Globex"]
+    assert table.column("Amount").to_pylist() == ["10.5", None, "7"]
+
+
+def test_to_df_bulk_failed_job(salesforce):
+    with mock_bulk_api(["Failed"]):
+        with pytest.raises(APIError, match="INVALID_FIELD"):
+            salesforce.to_df(query="SELECT Id FROM Account", mode="bulk")
+
+
+def test_to_arrow_batches_rest_schema_drift(salesforce):
+    salesforce.salesforce.query_all_iter.return_value = iter(
+        [
+            {"attributes": {"type": "Account"}, "Id": "001", "Employees": None},
+            {"attributes": {"type": "Account"}, "Id": "002", "Employees": 10},
+            {"attributes": {"type": "Account"}, "Id": "003", "Region": "EMEA"},
+        ]
+    )
+
+    table = salesforce.to_arrow_batches(table="Account", batch_size=1).read_all()
+
+    assert table.column_names == ["Id", "Employees", "Region"]
+    assert table.column("Employees").to_pylist() == [None, 10, None]
+    assert table.column("Region").to_pylist() == [None, None, "EMEA"]
@@ -0,0 +1,227 @@
+import os
+
+import pandas as pd
+import pytest
+
+from viadot.sources import SAPRFCV2
+from viadot.sources.sap_rfc import (
+    cast_to_sap_types,
+    get_field_info,
+    iter_row_windows,
+    join_chunks,
+    parse_fixed_width_records,
+    parse_records,
+    write_row_windows_to_parquet,
+)
+
+
+class FakeWindowedSource:
+    def __init__(self, n_rows, query):
+        self.n_rows = n_rows
+        self._query = query
+
+    def _download_df(self):
+        start = self._query["ROWSKIPS"]
+        end = min(start + self._query["ROWCOUNT"], self.n_rows)
+        return pd.DataFrame({"a": [str(i) for i in range(start, end)]})
+
+    def _apply_client_side_filters(self, df):
+        return df
+
+
+def test_iter_row_windows():
+    source = FakeWindowedSource(n_rows=25, query={"QUERY_TABLE": "t"})
+
+    windows = list(iter_row_windows(source, window_size=10))
+
+    assert [window for window, _ in windows] == [0, 1, 2]
+    assert [len(df) for _, df in windows] == [10, 10, 5]
+    assert source._query == {"QUERY_TABLE": "t"}
+
+
+def test_iter_row_windows_limit_offset():
+    source = FakeWindowedSource(n_rows=100, query={"ROWSKIPS": 5, "ROWCOUNT": 12})
+
+    windows = list(iter_row_windows(source, window_size=10, start_window=1))
+
+    assert [df["a"].iloc[0] for _, df in windows] == ["15"]
+    assert [len(df) for _, df in windows] == [2]
+
+
+class FakeWindowedParquetSource(FakeWindowedSource):
+    def close_connection(self):
+        pass
+
+    def _handle_if_empty(self, if_empty):
+        raise ValueError("The query produced no data.")
+
+
+def test_write_row_windows_to_parquet_resume(tmp_path, caplog):
+    path = str(tmp_path / "dataset")
+    source = FakeWindowedParquetSource(n_rows=25, query={"QUERY_TABLE": "t"})
+
+    assert write_row_windows_to_parquet(source, path, window_size=10) == 3
+    os.remove(os.path.join(path, "part-000002.parquet"))
+    os.remove(os.path.join(path, "_SUCCESS"))
+    assert write_row_windows_to_parquet(source, path, 10, resume=True) == 1
+    assert len(pd.read_parquet(path)) == 25
+
+    source.n_rows = 30
+    assert write_row_windows_to_parquet(source, path, 10, resume=True) == 0
+    assert "has already completed" in caplog.text
+    assert write_row_windows_to_parquet(source, path, 10) == 3
+    assert len(pd.read_parquet(path)) == 30
+
+
+def test_get_field_info_cached(tmp_path):
+    calls = []
+
+    def fake_call(func, **kwargs):
+        calls.append((func, kwargs))
+        return {
+            "DFIES_TAB": [
+                {
+                    "FIELDNAME": "MANDT",
+                    "LENG": "000003",
+                    "OFFSET": "000000",
+                    "DECIMALS": "000000",
+                    "INTTYPE": "C",
+                    "DATATYPE": "CLNT",
+                },
+                {
+                    "FIELDNAME": "NETWR",
+                    "LENG": "000015",
+                    "OFFSET": "000003",
+                    "DECIMALS": "000002",
+                    "INTTYPE": "P",
+                    "DATATYPE": "CURR",
+                },
+            ]
+        }
+
+    fields = get_field_info(fake_call, "test_system", "/SAP/TABLE", cache_dir=tmp_path)
+    assert calls == [("DDIF_FIELDINFO_GET", {"TABNAME": "/SAP/TABLE"})]
+    assert fields["NETWR"]["length"] == 15
+    assert fields["NETWR"]["decimals"] == 2
+
+    # Served from memory.
+    get_field_info(fake_call, "test_system", "/SAP/TABLE", cache_dir=tmp_path)
+    assert len(calls) == 1
+
+    # Served from disk after the in-memory cache is gone.
+    from viadot.sources import sap_rfc
+
+    sap_rfc._FIELD_INFO_CACHE.clear()
+    assert (
+        get_field_info(fake_call, "test_system", "/SAP/TABLE", cache_dir=tmp_path)
+        == fields
+    )
+    assert len(calls) == 1
+
+    # Expired entries are refreshed.
+    get_field_info(fake_call, "test_system", "/SAP/TABLE", ttl=0, cache_dir=tmp_path)
+    assert len(calls) == 2
+
+
+def test_parse_records():
+    data = [{"WA": "0001|abc |  1.50"}, {"WA": "0002|    |  2.00-"}]
+
+    df = parse_records(data, ["ID", "NAME", "AMOUNT"], sep="|")
+
+    assert df.columns.tolist() == ["ID", "NAME", "AMOUNT"]
+    assert df.values.tolist() == [
+        ["0001", "abc ", "  1.50"],
+        ["0002", "    ", "  2.00-"],
+    ]
+
+
+def test_parse_records_wrong_separator():
+    with pytest.raises(ValueError):
+        parse_records([{"WA": "0001|abc"}], ["ID", "NAME"], sep=";")
+
+
+def test_cast_to_sap_types():
+    df = pd.DataFrame(
+        {"ID": ["0001", "0002"], "QTY": ["  3", "   "], "amount": ["  1.50", "2.00-"]}
+    )
+    field_info = {
+        "ID": {"inttype": "N"},
+        "QTY": {"inttype": "I"},
+        "AMOUNT": {"inttype": "P"},
+    }
+
+    df = cast_to_sap_types(df, field_info, columns={"amount": "AMOUNT"})
+
+    assert df["ID"].tolist() == ["0001", "0002"]
+    assert df["QTY"].dtype == "Int64"
+    assert df["QTY"].isna().tolist() == [False, True]
+    assert df["amount"].tolist() == [1.5, -2.0]
+
+
+def test_parse_records_multi_character_separator():
+    data = [{"WA": "0001/ta.c/t1|5"}, {"WA": "0002/t/t"}]
+
+    df = parse_records(data, ["ID", "NAME", "AMOUNT"], sep="/t")
+
+    assert df.values.tolist() == [["0001", "a.c", "1|5"], ["0002", "", ""]]
+    with pytest.raises(ValueError):
+        parse_records(data, ["ID", "NAME"], sep="/t")
+
+
+def test_parse_fixed_width_records():
+    data = [{"WA": "0001a|b  1.50"}, {"WA": "0002"}]
+    fields_metadata = [
+        {"FIELDNAME": "ID", "OFFSET": "000000", "LENGTH": "000004"},
+        {"FIELDNAME": "NAME", "OFFSET": "000004", "LENGTH": "000003"},
+        {"FIELDNAME": "AMOUNT", "OFFSET": "000007", "LENGTH": "000006"},
+    ]
+
+    df = parse_fixed_width_records(data, fields_metadata, ["ID", "NAME", "AMOUNT"])
+
+    assert df.values.tolist() == [["0001", "a|b", "  1.50"], ["0002", "", ""]]
+
+
+class FakeConnection:
+    def __init__(self):
+        self.delimiters = []
+
+    def call(self, func, **params):
+        self.delimiters.append(params["DELIMITER"])
+        return {"DATA": [{"WA": "1/tA"}, {"WA": "2/tB"}]}
+
+
+def test_download_df_stops_at_first_working_separator():
+    sap = SAPRFCV2(
+        credentials={"sysnr": "00", "user": "u", "passwd": "p", "ashost": "host"},
+        rfc_unique_id=["ID"],
+    )
+    sap._con = FakeConnection()
+    sap._query = {"QUERY_TABLE": "T", "FIELDS": [["ID", "NAME"]]}
+    sap.select_columns_aliased = ["ID", "NAME"]
+
+    df = sap._download_df()
+
+    assert sap._con.delimiters == ["|", "/t"]
+    assert df.values.tolist() == [["1", "A"], ["2", "B"]]
+
+
+def test_join_chunks():
+    chunk_1 = pd.DataFrame({"ID": ["1", "2", "3"], "a": ["a1", "a2", "a3"]})
+    chunk_2 = pd.DataFrame({"b": ["b3", "b1"], "ID": ["3", "1"]})
+
+    df = join_chunks([chunk_1, chunk_2], on=["ID"])
+
+    b = df.set_index("ID")["b"]
+    assert list(df.columns) == ["ID", "a", "b"]
+    assert b["1"] == "b1" and b["3"] == "b3"
+    assert pd.isna(b["2"])
+
+
+def test_join_chunks_not_unique():
+    chunk_1 = pd.DataFrame({"ID": ["1", "1"], "a": ["a1", "a2"]})
+    chunk_2 = pd.DataFrame({"ID": ["1"], "b": ["b1"]})
+
+    df = join_chunks([chunk_1, chunk_2], on=["ID"])
+
+    assert df.shape == (2, 3)
+    assert df["b"].tolist() == ["b1", "b1"]
@@ -32,7 +32,7 @@ def test_create_table(sqlite):
 def test_insert_into_sql(sqlite, DF):
     sql = sqlite.insert_into(TABLE, DF)
 
-    assert "('italy', 100)" in sql
+    assert "VALUES (?, ?)" in sql
     assert sql[-1] == ";"
 
     results = sqlite.run(f"SELECT * FROM {TABLE}")
@@ -1,8 +1,11 @@
 import os
+import shutil
 from typing import List
 from unittest import mock
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet
 import pytest
 
 from viadot.exceptions import ValidationError
@@ -22,16 +25,7 @@ from viadot.task_utils import (
     validate_df,
     write_to_json,
 )
-
-
-class MockAzureUploadClass:
-    def run(
-        from_path: str = "",
-        to_path: str = "",
-        sp_credentials_secret: str = "",
-        overwrite: bool = False,
-    ) -> None:
-        pass
+from viadot.utils import write_parquet
 
 
 def count_dtypes(dtypes_dict: dict = None, dtypes_to_count: List[str] = None) -> int:
@@ -172,6 +166,86 @@ def test_df_to_parquet():
     os.remove("test.parquet")
 
 
+def test_df_to_parquet_append():
+    df = pd.DataFrame({"a": ["a", "b"], "b": [1, 2]})
+    df_new = pd.DataFrame({"a": ["c"], "b": [3], "c": [True]})
+
+    df_to_parquet.run(df, "test.parquet")
+    df_to_parquet.run(df_new, "test.parquet", if_exists="append")
+    result = pd.read_parquet("test.parquet")
+
+    assert result["a"].tolist() == ["a", "b", "c"]
+    assert result["c"].tolist() == [None, None, True]
+    os.remove("test.parquet")
+
+
+def test_df_to_parquet_skip_only_if_exists(tmp_path):
+    path = str(tmp_path / "test.parquet")
+    df = pd.DataFrame({"a": ["a", "b"]})
+
+    df_to_parquet.run(df, path, if_exists="skip")
+    df_to_parquet.run(df.head(1), path, if_exists="skip")
+
+    assert pd.read_parquet(path).equals(df)
+
+
+def test_df_to_parquet_append_dataset():
+    df = pd.DataFrame({"a": ["a", "b"], "b": [1, 2]})
+
+    df_to_parquet.run(df, "test_dataset/")
+    df_to_parquet.run(df, "test_dataset", if_exists="append")
+    result = pd.read_parquet("test_dataset")
+
+    assert len(os.listdir("test_dataset")) == 2
+    assert result.shape == (4, 2)
+    shutil.rmtree("test_dataset")
+
+
+def test_write_parquet_replace_dataset_keeps_data_on_error(tmp_path):
+    df = pd.DataFrame({"a": ["a", "b"], "b": [1, 2]})
+    path = str(tmp_path / "dataset") + os.sep
+    df_to_parquet.run(df, path)
+
+    def _failing_batches():
+        yield pa.record_batch([pa.array(["c"]), pa.array([3])], names=["a", "b"])
+        raise ConnectionError("The source went away.")
+
+    schema = pa.schema([("a", pa.string()), ("b", pa.int64())])
+    reader = pa.RecordBatchReader.from_batches(schema, _failing_batches())
+    with pytest.raises(ConnectionError):
+        write_parquet(reader, path, if_exists="replace")
+
+    assert len(os.listdir(path)) == 1
+    assert pd.read_parquet(path).equals(df)
+
+    df_to_parquet.run(df.head(1), path)
+    assert pd.read_parquet(path).shape == (1, 2)
+
+
+def test_write_parquet_append_widens_types(tmp_path):
+    path = str(tmp_path / "test.parquet")
+    write_parquet(pa.table({"a": [1, 2], "b": [None, None]}), path)
+
+    write_parquet(pa.table({"a": [1.5], "b": ["x"]}), path, if_exists="append")
+
+    table = pyarrow.parquet.read_table(path)
+    assert table.schema.field("a").type == pa.float64()
+    assert table.schema.field("b").type == pa.string()
+    assert table.column("a").to_pylist() == [1.0, 2.0, 1.5]
+    assert table.column("b").to_pylist() == [None, None, "x"]
+
+
+def test_write_parquet_append_dataset_widens_types(tmp_path):
+    path = str(tmp_path / "dataset") + os.sep
+    write_parquet(pa.table({"a": [1, 2], "b": [None, None]}), path)
+
+    write_parquet(pa.table({"a": [1.5], "b": ["x"]}), path, if_exists="append")
+
+    df = pd.read_parquet(path)
+    assert sorted(df["a"].tolist()) == [1.0, 1.5, 2.0]
+    assert df["b"].tolist().count("x") == 1
+
+
 def test_union_dfs_task():
     df1 = pd.DataFrame(
         {
@@ -236,13 +310,30 @@ def test_df_clean_column_defined():
     assert output == expected_output
 
 
-@mock.patch("viadot.task_utils.AzureDataLakeUpload", return_value=MockAzureUploadClass)
+@mock.patch("viadot.task_utils.AzureDataLake")
 @pytest.mark.bulk
-def test_adls_bulk_upload(mock_upload):
+def test_adls_bulk_upload(mock_lake, monkeypatch):
+    for variable in [
+        "AZURE_ACCOUNT_NAME",
+        "AZURE_TENANT_ID",
+        "AZURE_CLIENT_ID",
+        "AZURE_CLIENT_SECRET",
+    ]:
+        monkeypatch.setenv(variable, "test")
     file_names = ["random_1.csv", "random_2.csv"]
 
     adls_bulk_upload.run(file_names=file_names, adls_file_path="any/at/random")
-    mock_upload.assert_called_once()
+
+    mock_lake.assert_called_once()
+    mock_lake.return_value.bulk_upload.assert_called_once_with(
+        [
+            ("random_1.csv", "any/at/random/random_1.csv"),
+            ("random_2.csv", "any/at/random/random_2.csv"),
+        ],
+        overwrite=True,
+        max_workers=8,
+        timeout=3600,
+    )
 
 
 def test_anonymize_df_all():
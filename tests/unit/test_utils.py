@@ -1,5 +1,9 @@
+import asyncio
 import logging
 import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pandas as pd
 import pytest
@@ -13,6 +17,11 @@ from viadot.utils import (
     get_nested_value,
     slugify,
     handle_api_response,
+    handle_api_response_async,
+    HTTPClient,
+    OAuthTokenManager,
+    credentials_fingerprint,
+    get_token_manager,
     union_dict,
     gen_bulk_insert_query_from_df,
 )
@@ -167,42 +176,41 @@ VALUES (1, '_suffixnan', 1, NULL, 'APPROVED', NULL),
     assert result == expected_result
 
 
-def test_check_if_empty_file_csv(caplog):
-    with open(EMPTY_CSV_PATH, "w"):
+def test_check_if_empty_file_csv(caplog, tmp_path):
+    path = str(tmp_path / EMPTY_CSV_PATH)
+    with open(path, "w"):
         pass
 
     with caplog.at_level(logging.WARNING):
-        check_if_empty_file(path=EMPTY_CSV_PATH, if_empty="warn")
-        assert f"Input file - '{EMPTY_CSV_PATH}' is empty." in caplog.text
+        check_if_empty_file(path=path, if_empty="warn")
+        assert f"Input file - '{path}' is empty." in caplog.text
     with pytest.raises(ValueError):
-        check_if_empty_file(path=EMPTY_CSV_PATH, if_empty="fail")
+        check_if_empty_file(path=path, if_empty="fail")
     with pytest.raises(SKIP):
-        check_if_empty_file(path=EMPTY_CSV_PATH, if_empty="skip")
+        check_if_empty_file(path=path, if_empty="skip")
 
-    os.remove(EMPTY_CSV_PATH)
 
-
-def test_check_if_empty_file_parquet(caplog):
-    with open(EMPTY_PARQUET_PATH, "w"):
+def test_check_if_empty_file_parquet(caplog, tmp_path):
+    path = str(tmp_path / EMPTY_PARQUET_PATH)
+    with open(path, "w"):
         pass
 
     with caplog.at_level(logging.WARNING):
-        check_if_empty_file(path=EMPTY_PARQUET_PATH, if_empty="warn")
-        assert f"Input file - '{EMPTY_PARQUET_PATH}' is empty." in caplog.text
+        check_if_empty_file(path=path, if_empty="warn")
+        assert f"Input file - '{path}' is empty." in caplog.text
     with pytest.raises(ValueError):
-        check_if_empty_file(path=EMPTY_PARQUET_PATH, if_empty="fail")
+        check_if_empty_file(path=path, if_empty="fail")
     with pytest.raises(SKIP):
-        check_if_empty_file(path=EMPTY_PARQUET_PATH, if_empty="skip")
-
-    os.remove(EMPTY_PARQUET_PATH)
+        check_if_empty_file(path=path, if_empty="skip")
 
 
-def test_check_if_empty_file_no_data(caplog):
+def test_check_if_empty_file_no_data(caplog, tmp_path):
+    path = str(tmp_path / EMPTY_PARQUET_PATH)
     df = pd.DataFrame({"col1": []})
-    df.to_parquet(EMPTY_PARQUET_PATH)
+    df.to_parquet(path)
     with caplog.at_level(logging.WARNING):
-        check_if_empty_file(path=EMPTY_PARQUET_PATH, if_empty="warn")
-        assert f"Input file - '{EMPTY_PARQUET_PATH}' is empty." not in caplog.text
+        check_if_empty_file(path=path, if_empty="warn")
+        assert f"Input file - '{path}' is empty." not in caplog.text
 
 
 def test_add_viadot_metadata_columns_base():
@@ -321,3 +329,113 @@ def test_get_nested_value_non_dict_passed():
     """Sample test checking the correctness of the function when non dict value (int) is provided."""
 
     assert get_nested_value(nested_dict=5) == None
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports = set()
+
+    def do_GET(self):
+        KeepAliveHandler.client_ports.add(self.client_address[1])
+        body = b"ok" if "Cookie" not in self.headers else b"cookie received"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "session=123")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+
+
+def test_http_client_reuses_connections(local_server, monkeypatch):
+    client = HTTPClient()
+    monkeypatch.setattr("viadot.utils._http_client", client)
+    KeepAliveHandler.client_ports.clear()
+
+    responses = [handle_api_response(url=local_server) for _ in range(3)]
+
+    assert [response.text for response in responses] == ["ok"] * 3
+    assert len(KeepAliveHandler.client_ports) == 1
+    host_metrics = client.metrics[local_server.split("/")[2]]
+    assert host_metrics["requests"] == 3
+    assert host_metrics["bytes"] == 6
+
+
+def test_handle_api_response_async(local_server, monkeypatch):
+    monkeypatch.setattr("viadot.utils._http_client", HTTPClient())
+
+    async def fetch_all():
+        return await asyncio.gather(
+            *[handle_api_response_async(url=local_server) for _ in range(5)]
+        )
+
+    responses = asyncio.run(fetch_all())
+    assert [response.status_code for response in responses] == [200] * 5
+
+
+def test_oauth_token_manager_caches_token():
+    tokens = iter(["token_1", "token_2"])
+    fetch_token = lambda: {"access_token": next(tokens), "expires_in": 3600}
+    token_manager = OAuthTokenManager(fetch_token)
+
+    assert token_manager.get_token()["access_token"] == "token_1"
+    assert token_manager.get_token()["access_token"] == "token_1"
+
+    token_manager.invalidate()
+    assert token_manager.get_token()["access_token"] == "token_2"
+
+
+def test_oauth_token_manager_refreshes_expiring_token():
+    calls = []
+
+    def fetch_token():
+        calls.append(1)
+        return {"access_token": "token", "expires_in": 30}
+
+    # the token expires within the refresh margin, so it's requested every time
+    token_manager = OAuthTokenManager(fetch_token, refresh_margin=60)
+    token_manager.get_token()
+    token_manager.get_token()
+
+    assert len(calls) == 2
+
+
+def test_oauth_token_manager_concurrent_calls():
+    calls = []
+
+    def fetch_token():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"access_token": "token", "expires_in": 3600}
+
+    token_manager = OAuthTokenManager(fetch_token)
+    threads = [threading.Thread(target=token_manager.get_token) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+
+
+def test_get_token_manager_doesnt_keep_fetch_token():
+    key = ("https://example.com/oauth/token", "client", credentials_fingerprint("1"))
+    token_manager = get_token_manager(key)
+
+    assert get_token_manager(key) is token_manager
+    assert token_manager.fetch_token is None
+    token = token_manager.get_token(lambda: {"access_token": "1", "expires_in": 3600})
+    assert token["access_token"] == "1"
+
+    rotated_key = key[:2] + (credentials_fingerprint("2"),)
+    assert get_token_manager(rotated_key) is not token_manager
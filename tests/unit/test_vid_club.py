@@ -0,0 +1,46 @@
+from unittest import mock
+
+import pytest
+
+from viadot.sources import VidClub
+
+CREDENTIALS = {"token": "token", "url": "https://vidclub.example.com/api/"}
+
+
+@pytest.mark.total_load
+def test_total_load_concurrent_intervals():
+    """
+    Checks if date intervals downloaded concurrently are concatenated in order, pages are
+    followed within each interval and list columns are converted to tuples.
+    """
+
+    def mock_response(url, **kwargs):
+        from_date = url.split("from=")[1][:10]
+        page = int(url.split("&page=")[-1]) if "&page=" in url else 1
+        response = mock.MagicMock()
+        response.json.return_value = {
+            "data": [
+                {"jobId": f"{from_date}-{page}-{i}", "tags": ["a"] if i else []}
+                for i in range(2 if page == 1 else 1)
+            ]
+        }
+        return response
+
+    with mock.patch(
+        "viadot.sources.vid_club.handle_api_response", side_effect=mock_response
+    ):
+        df = VidClub(credentials=CREDENTIALS).total_load(
+            source="jobs",
+            from_date="2022-04-01",
+            to_date="2022-04-07",
+            items_per_page=2,
+            days_interval=2,
+            max_workers=3,
+        )
+
+    assert df["jobId"].tolist() == [
+        f"{date}-{page}-{i}"
+        for date in ["2022-04-01", "2022-04-03", "2022-04-05"]
+        for page, i in [(1, 0), (1, 1), (2, 0)]
+    ]
+    assert df["tags"].tolist() == [(), ("a",), ()] * 3
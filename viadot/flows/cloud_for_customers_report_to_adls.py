@@ -26,6 +26,7 @@ class CloudForCustomersReportToADLS(Flow):
         fields: List[str] = None,
         skip: int = 0,
         top: int = 1000,
+        max_workers: int = 1,
         channels: List[str] = None,
         months: List[str] = None,
         years: List[str] = None,
@@ -57,6 +58,7 @@ class CloudForCustomersReportToADLS(Flow):
             fields (list, optional): List of columns to put in DataFrame. Defaults to None.
             skip (int, optional): Initial index value of reading row. Defaults to 0.
             top (int, optional): The value of top reading row. Defaults to 1000.
+            max_workers (int, optional): How many pages of data to download from C4C at the same time. Defaults to 1.
             channels (List[str], optional): Filtering parameters passed to the url. Defaults to None.
             months (List[str], optional): Filtering parameters passed to the url. Defaults to None.
             years (List[str], optional): Filtering parameters passed to the url. Defaults to None.
@@ -83,6 +85,7 @@ class CloudForCustomersReportToADLS(Flow):
         self.report_url = report_url
         self.skip = skip
         self.top = top
+        self.max_workers = max_workers
         self.if_empty = if_empty
         self.env = env
         self.c4c_credentials_secret = c4c_credentials_secret
@@ -165,6 +168,7 @@ class CloudForCustomersReportToADLS(Flow):
             endpoint=endpoint,
             params=params,
             env=env,
+            max_workers=self.max_workers,
             credentials_secret=credentials_secret,
             flow=flow,
         )
@@ -179,6 +183,7 @@ class CloudForCustomersReportToADLS(Flow):
             report_url=report_urls_with_filters,
             skip=self.skip,
             top=self.top,
+            max_workers=self.max_workers,
             env=self.env,
             credentials_secret=self.c4c_credentials_secret,
             flow=flow,
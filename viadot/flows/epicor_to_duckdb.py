@@ -3,7 +3,11 @@ from typing import Any, Dict, List, Literal
 from prefect import Flow
 
 from viadot.task_utils import add_ingestion_metadata_task, cast_df_to_str, df_to_parquet
-from viadot.tasks import DuckDBCreateTableFromParquet, EpicorOrdersToDF
+from viadot.tasks import (
+    DuckDBCreateTableFromParquet,
+    EpicorOrdersToDF,
+    EpicorOrdersToParquetFile,
+)
 
 
 class EpicorOrdersToDuckDB(Flow):
@@ -18,6 +22,8 @@ class EpicorOrdersToDuckDB(Flow):
         validate_date_filter: bool = True,
         start_date_field: str = "BegInvoiceDate",
         end_date_field: str = "EndInvoiceDate",
+        days_interval: int = None,
+        batch_size: int = None,
         duckdb_table: str = None,
         duckdb_schema: str = None,
         if_exists: Literal["fail", "replace", "append", "skip", "delete"] = "fail",
@@ -40,6 +46,10 @@ class EpicorOrdersToDuckDB(Flow):
             validate_date_filter (bool, optional): Whether or not validate xml date filters. Defaults to True.
             start_date_field (str, optional) The name of filters field containing start date. Defaults to "BegInvoiceDate".
             end_date_field (str, optional) The name of filters field containing end date. Defaults to "EndInvoiceDate".
+            days_interval (int, optional): If provided, the date range of the filters is downloaded in windows of
+                this many days. Defaults to None.
+            batch_size (int, optional): If provided, the orders are streamed into the Parquet file in batches of this
+                many rows, instead of being loaded into a DataFrame. Defaults to None.
             duckdb_table (str, optional): Destination table in DuckDB. Defaults to None.
             duckdb_schema (str, optional): Destination schema in DuckDB. Defaults to None.
             if_exists (Literal, optional):  What to do if the table already exists. Defaults to "fail".
@@ -55,6 +65,8 @@ class EpicorOrdersToDuckDB(Flow):
         self.filters_xml = filters_xml
         self.end_date_field = end_date_field
         self.start_date_field = start_date_field
+        self.days_interval = days_interval
+        self.batch_size = batch_size
         self.local_file_path = local_file_path
         self.duckdb_table = duckdb_table
         self.duckdb_schema = duckdb_schema
@@ -64,11 +76,18 @@ class EpicorOrdersToDuckDB(Flow):
 
         super().__init__(*args, name=name, **kwargs)
 
-        self.df_task = EpicorOrdersToDF(
-            base_url=self.base_url,
-            filters_xml=self.filters_xml,
-            timeout=timeout,
-        )
+        if self.batch_size:
+            self.parquet_task = EpicorOrdersToParquetFile(
+                base_url=self.base_url,
+                filters_xml=self.filters_xml,
+                timeout=timeout,
+            )
+        else:
+            self.df_task = EpicorOrdersToDF(
+                base_url=self.base_url,
+                filters_xml=self.filters_xml,
+                timeout=timeout,
+            )
         self.create_duckdb_table_task = DuckDBCreateTableFromParquet(
             credentials=duckdb_credentials,
             timeout=timeout,
@@ -77,22 +96,37 @@ class EpicorOrdersToDuckDB(Flow):
         self.gen_flow()
 
     def gen_flow(self) -> Flow:
-        df = self.df_task.bind(
-            flow=self,
-            credentials=self.epicor_credentials,
-            config_key=self.epicor_config_key,
-            validate_date_filter=self.validate_date_filter,
-            end_date_field=self.end_date_field,
-            start_date_field=self.start_date_field,
-        )
-        df_mapped = cast_df_to_str.bind(df, flow=self)
-        df_with_metadata = add_ingestion_metadata_task.bind(df_mapped, flow=self)
-        parquet = df_to_parquet.bind(
-            df=df_with_metadata,
-            path=self.local_file_path,
-            if_exists=self.if_exists,
-            flow=self,
-        )
+        if self.batch_size:
+            parquet = self.parquet_task.bind(
+                path=self.local_file_path,
+                credentials=self.epicor_credentials,
+                config_key=self.epicor_config_key,
+                validate_date_filter=self.validate_date_filter,
+                end_date_field=self.end_date_field,
+                start_date_field=self.start_date_field,
+                days_interval=self.days_interval,
+                if_exists=self.if_exists,
+                batch_size=self.batch_size,
+                flow=self,
+            )
+        else:
+            df = self.df_task.bind(
+                flow=self,
+                credentials=self.epicor_credentials,
+                config_key=self.epicor_config_key,
+                validate_date_filter=self.validate_date_filter,
+                end_date_field=self.end_date_field,
+                start_date_field=self.start_date_field,
+                days_interval=self.days_interval,
+            )
+            df_mapped = cast_df_to_str.bind(df, flow=self)
+            df_with_metadata = add_ingestion_metadata_task.bind(df_mapped, flow=self)
+            parquet = df_to_parquet.bind(
+                df=df_with_metadata,
+                path=self.local_file_path,
+                if_exists=self.if_exists,
+                flow=self,
+            )
         create_duckdb_table = self.create_duckdb_table_task.bind(
             path=self.local_file_path,
             schema=self.duckdb_schema,
@@ -108,7 +108,8 @@ class GenesysToADLS(Flow):
         Args:
             name (str): The name of the Flow.
             view_type (str, optional): The type of view export job to be created. Defaults to None.
-            view_type_time_sleep (int, optional): Waiting time to retrieve data from Genesys API. Defaults to 80.
+            view_type_time_sleep (int, optional): The maximum time, in seconds, to wait for the reports to be generated
+                in Genesys API. Defaults to 80.
             post_data_list (List[str], optional): List of string templates to generate json body. Defaults to None.
                 Example for only one POST:
                 >>> post_data_list = '''[{
@@ -33,6 +33,7 @@ class SalesforceToADLS(Flow):
         domain: str = "test",
         client_id: str = "viadot",
         env: str = "DEV",
+        mode: str = "rest",
         vault_name: str = None,
         credentials_secret: str = None,
         output_file_extension: str = ".parquet",
@@ -60,6 +61,8 @@ class SalesforceToADLS(Flow):
             client_id (str, optional): Client id to keep the track of API calls. Defaults to None.
             env (str, optional): Environment information, provides information about credential
                 and connection configuration. Defaults to 'DEV'.
+            mode (str, optional): Whether to page through the REST API ("rest") or to run
+                a Bulk API 2.0 query job ("bulk"), which is much faster for large tables. Defaults to "rest".
             credentials_secret (str, optional): The name of the Azure Key Vault secret for Salesforce. Defaults to None.
             vault_name (str, optional): The name of the vault from which to obtain the secrets. Defaults to None.
             output_file_extension (str, optional): Output file extension - to allow selection of CSV for data
@@ -84,6 +87,7 @@ class SalesforceToADLS(Flow):
         self.domain = domain
         self.client_id = client_id
         self.env = env
+        self.mode = mode
         self.vault_name = vault_name
         self.credentials_secret = credentials_secret
         self.validate_df_dict = validate_df_dict
@@ -132,6 +136,7 @@ class SalesforceToADLS(Flow):
             domain=self.domain,
             client_id=self.client_id,
             env=self.env,
+            mode=self.mode,
             vault_name=self.vault_name,
             credentials_secret=self.credentials_secret,
             flow=self,
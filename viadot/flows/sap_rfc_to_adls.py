@@ -16,6 +16,8 @@ class SAPRFCToADLS(Flow):
         func: str = "RFC_READ_TABLE",
         rfc_total_col_width_character_limit: int = 400,
         rfc_unique_id: List[str] = None,
+        rfc_max_workers: int = 1,
+        rfc_fixed_width: bool = False,
         sap_credentials: dict = None,
         sap_credentials_key: str = "SAP",
         env: str = "DEV",
@@ -68,6 +70,10 @@ class SAPRFCToADLS(Flow):
                     rfc_unique_id=["VBELN", "LPRIO"],
                     ...
                     )
+            rfc_max_workers (int, optional): The number of column chunks to download concurrently, each over its own
+                RFC connection. Only used with `alternative_version=True`. Defaults to 1.
+            rfc_fixed_width (bool, optional): Whether to query SAP without a delimiter and split the records by field
+                offsets instead of trying separators. Defaults to False.
             sap_credentials (dict, optional): The credentials to use to authenticate with SAP. Defaults to None.
             sap_credentials_key (str, optional): The key for sap credentials located in the local config or Azure Key Vault. Defaults to "SAP".
             env (str, optional): The key for sap_credentials_key pointing to the SAP environment. Defaults to "DEV"
@@ -94,6 +100,8 @@ class SAPRFCToADLS(Flow):
         self.func = func
         self.rfc_total_col_width_character_limit = rfc_total_col_width_character_limit
         self.rfc_unique_id = rfc_unique_id
+        self.rfc_max_workers = rfc_max_workers
+        self.rfc_fixed_width = rfc_fixed_width
         self.sap_credentials = sap_credentials
         self.sap_credentials_key = sap_credentials_key
         self.env = env
@@ -126,6 +134,8 @@ class SAPRFCToADLS(Flow):
             rfc_total_col_width_character_limit=self.rfc_total_col_width_character_limit,
             rfc_unique_id=self.rfc_unique_id,
             alternative_version=self.alternative_version,
+            max_workers=self.rfc_max_workers,
+            fixed_width=self.rfc_fixed_width,
             credentials=self.sap_credentials,
             sap_credentials_key=self.sap_credentials_key,
             env=self.env,
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Literal
 from prefect import Flow
 
 from viadot.task_utils import df_to_parquet
-from viadot.tasks import SQLServerToDF
+from viadot.tasks import SQLServerToDF, SQLServerToParquetFile
 
 
 class SQLServerToParquet(Flow):
@@ -15,6 +15,7 @@ class SQLServerToParquet(Flow):
         sqlserver_config_key: str = None,
         if_exists: Literal["fail", "replace", "append", "skip", "delete"] = "fail",
         timeout: int = 3600,
+        batch_size: int = None,
         *args: List[any],
         **kwargs: Dict[str, Any],
     ):
@@ -30,11 +31,14 @@ class SQLServerToParquet(Flow):
             if_exists (Literal, optional):  What to do if the file already exists. Defaults to "fail".
             timeout(int, optional): The amount of time (in seconds) to wait while running this task before
                 a timeout occurs. Defaults to 3600.
+            batch_size (int, optional): If provided, the query result is streamed into the Parquet file in batches
+                of this many rows instead of being loaded into a DataFrame first. Defaults to None.
         """
         # SQLServerToDF
         self.sql_query = sql_query
         self.sqlserver_config_key = sqlserver_config_key
         self.timeout = timeout
+        self.batch_size = batch_size
 
         self.local_file_path = local_file_path
         self.if_exists = if_exists
@@ -44,13 +48,24 @@ class SQLServerToParquet(Flow):
         self.gen_flow()
 
     def gen_flow(self) -> Flow:
-        df_task = SQLServerToDF(timeout=self.timeout)
-        df = df_task.bind(
-            config_key=self.sqlserver_config_key, query=self.sql_query, flow=self
-        )
-        parquet = df_to_parquet.bind(
-            df=df,
-            path=self.local_file_path,
-            if_exists=self.if_exists,
-            flow=self,
-        )
+        if self.batch_size:
+            parquet_task = SQLServerToParquetFile(timeout=self.timeout)
+            parquet = parquet_task.bind(
+                config_key=self.sqlserver_config_key,
+                query=self.sql_query,
+                path=self.local_file_path,
+                if_exists=self.if_exists,
+                batch_size=self.batch_size,
+                flow=self,
+            )
+        else:
+            df_task = SQLServerToDF(timeout=self.timeout)
+            df = df_task.bind(
+                config_key=self.sqlserver_config_key, query=self.sql_query, flow=self
+            )
+            parquet = df_to_parquet.bind(
+                df=df,
+                path=self.local_file_path,
+                if_exists=self.if_exists,
+                flow=self,
+            )
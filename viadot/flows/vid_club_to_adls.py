@@ -33,6 +33,7 @@ class VidClubToADLS(Flow):
         items_per_page: int = 100,
         region: Literal["bg", "hu", "hr", "pl", "ro", "si", "all"] = None,
         days_interval: int = 30,
+        max_workers: int = 4,
         cols_to_drop: List[str] = None,
         vid_club_credentials: Dict[str, Any] = None,
         vidclub_credentials_secret: str = "VIDCLUB",
@@ -62,6 +63,7 @@ class VidClubToADLS(Flow):
             items_per_page (int, optional): Number of entries per page. Defaults to 100.
             region (Literal["bg", "hu", "hr", "pl", "ro", "si", "all"], optional): Region filter for the query. Defaults to None (parameter is not used in url). [December 2023 status: value 'all' does not work for company and jobs]
             days_interval (int, optional): Days specified in date range per API call (test showed that 30-40 is optimal for performance). Defaults to 30.
+            max_workers (int, optional): The maximum number of date ranges downloaded concurrently. Defaults to 4.
             cols_to_drop (List[str], optional): List of columns to drop. Defaults to None.
             vid_club_credentials (Dict[str, Any], optional): Stores the credentials information. Defaults to None.
             vidclub_credentials_secret (str, optional): The name of the secret in Azure Key Vault or Prefect or local_config file. Defaults to "VIDCLUB".
@@ -88,6 +90,7 @@ class VidClubToADLS(Flow):
         self.items_per_page = items_per_page
         self.region = region
         self.days_interval = days_interval
+        self.max_workers = max_workers
         self.cols_to_drop = cols_to_drop
         self.vid_club_credentials = vid_club_credentials
         self.vidclub_credentials_secret = vidclub_credentials_secret
@@ -150,6 +153,7 @@ class VidClubToADLS(Flow):
             items_per_page=self.items_per_page,
             region=self.region,
             days_interval=self.days_interval,
+            max_workers=self.max_workers,
             cols_to_drop=self.cols_to_drop,
             flow=self,
         )
@@ -1,12 +1,18 @@
 import os
-from typing import Any, Dict, List
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Dict, List, Literal, Tuple
 
 import pandas as pd
 from adlfs import AzureBlobFileSystem, AzureDatalakeFileSystem
+from prefect.utilities import logging
 
 from ..config import local_config
 from .base import Source
 
+logger = logging.get_logger(__name__)
+
 
 class AzureDataLake(Source):
     """
@@ -223,3 +229,158 @@ class AzureDataLake(Source):
         from_path = from_path or self.path
         to_path = to_path
         self.fs.cp(from_path, to_path, recursive=recursive)
+
+    def _transfer(
+        self,
+        operation: Literal["upload", "download", "cp"],
+        from_path: str,
+        to_path: str,
+        overwrite: bool,
+    ) -> int:
+        """Transfer a single file and return its size in bytes."""
+        if operation == "upload":
+            self.upload(from_path=from_path, to_path=to_path, overwrite=overwrite)
+            return os.path.getsize(from_path)
+        elif operation == "download":
+            self.download(from_path=from_path, to_path=to_path)
+            return os.path.getsize(to_path)
+        elif operation == "cp":
+            self.cp(from_path=from_path, to_path=to_path)
+            return self.fs.size(to_path)
+        raise ValueError(f"Unsupported operation: '{operation}'.")
+
+    def bulk_transfer(
+        self,
+        operation: Literal["upload", "download", "cp"],
+        paths: List[Tuple[str, str]],
+        overwrite: bool = True,
+        max_workers: int = 8,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        timeout: float = None,
+    ) -> Dict[str, Any]:
+        """
+        Upload, download or copy many files concurrently, reusing the same filesystem client.
+
+        Each file is retried up to `max_retries` times, waiting `retry_delay` seconds
+        (doubled after every attempt) between the attempts.
+
+        Args:
+            operation (Literal["upload", "download", "cp"]): The operation to perform.
+            paths (List[Tuple[str, str]]): Pairs of (from_path, to_path).
+            overwrite (bool, optional): Whether to overwrite existing files when uploading.
+                Defaults to True.
+            max_workers (int, optional): The maximum number of concurrent transfers. Defaults to 8.
+            max_retries (int, optional): How many times to retry a failed transfer. Defaults to 3.
+            retry_delay (float, optional): The number of seconds to wait before the first retry.
+                Defaults to 1.0.
+            timeout (float, optional): The maximum number of seconds to wait for all transfers.
+                Defaults to None (no limit).
+
+        Raises:
+            IOError: If any of the files couldn't be transferred.
+            TimeoutError: If the transfers didn't finish within `timeout` seconds. Transfers
+                which haven't started yet are cancelled, but transfers already in progress
+                keep running in background threads until they complete.
+
+        Example:
+        ```python
+        from viadot.sources import AzureDataLake
+        lake = AzureDataLake()
+        lake.bulk_transfer(
+            "upload",
+            paths=[("a.csv", "sandbox/a.csv"), ("b.csv", "sandbox/b.csv")],
+        )
+        ```
+
+        Returns:
+            Dict[str, Any]: A summary with the number of `files`, total `bytes`, `seconds`
+            and `bytes_per_second`.
+        """
+
+        def transfer_with_retries(from_path: str, to_path: str) -> int:
+            delay = retry_delay
+            for attempt in range(max_retries + 1):
+                try:
+                    return self._transfer(operation, from_path, to_path, overwrite)
+                except Exception as e:
+                    if attempt == max_retries:
+                        raise
+                    logger.warning(
+                        f"Transfer of {from_path} failed ({e}). Retrying in {delay}s..."
+                    )
+                    time.sleep(delay)
+                    delay *= 2
+
+        start = time.perf_counter()
+        total_bytes = 0
+        failed = {}
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        futures = {}
+        try:
+            futures = {
+                executor.submit(transfer_with_retries, from_path, to_path): from_path
+                for from_path, to_path in paths
+            }
+            for future in as_completed(futures, timeout=timeout):
+                try:
+                    total_bytes += future.result()
+                except Exception as e:
+                    failed[futures[future]] = e
+        except FuturesTimeoutError:
+            raise TimeoutError(
+                f"The transfer of {len(paths)} file(s) didn't finish within {timeout}s."
+            )
+        finally:
+            # `Executor.shutdown(cancel_futures=True)` requires Python 3.9.
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+        elapsed = time.perf_counter() - start
+
+        summary = {
+            "files": len(paths) - len(failed),
+            "bytes": total_bytes,
+            "seconds": elapsed,
+            "bytes_per_second": total_bytes / elapsed if elapsed else 0,
+        }
+        logger.info(
+            f"Transferred {summary['files']} file(s) ({total_bytes} bytes) in {elapsed:.2f}s "
+            f"({summary['bytes_per_second'] / 1024 ** 2:.2f} MiB/s)."
+        )
+        if failed:
+            details = "\n".join(f"{path}: {error}" for path, error in failed.items())
+            raise IOError(
+                f"{len(failed)} of {len(paths)} file(s) could not be transferred:\n{details}"
+            )
+        return summary
+
+    def bulk_upload(
+        self, paths: List[Tuple[str, str]], overwrite: bool = True, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Upload many local files concurrently. See `bulk_transfer()` for the parameters.
+
+        Args:
+            paths (List[Tuple[str, str]]): Pairs of (local path, lake path).
+            overwrite (bool, optional): Whether to overwrite the files if they exist. Defaults to True.
+        """
+        return self.bulk_transfer("upload", paths, overwrite=overwrite, **kwargs)
+
+    def bulk_download(self, paths: List[Tuple[str, str]], **kwargs) -> Dict[str, Any]:
+        """
+        Download many files concurrently. See `bulk_transfer()` for the parameters.
+
+        Args:
+            paths (List[Tuple[str, str]]): Pairs of (lake path, local path).
+        """
+        return self.bulk_transfer("download", paths, **kwargs)
+
+    def bulk_cp(self, paths: List[Tuple[str, str]], **kwargs) -> Dict[str, Any]:
+        """
+        Copy many files within the lake concurrently. See `bulk_transfer()` for the parameters.
+
+        Args:
+            paths (List[Tuple[str, str]]): Pairs of (source path, destination path).
+        """
+        return self.bulk_transfer("cp", paths, **kwargs)
@@ -1,19 +1,148 @@
+import datetime
+import decimal
 import os
+import shutil
+import tempfile
 from abc import abstractmethod
-from typing import Any, Dict, List, Literal, NoReturn, Tuple, Union
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Literal, NoReturn, Tuple, Union
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pyodbc
 from prefect.utilities import logging
 
 from ..config import local_config
 from ..signals import SKIP
+from ..utils import cast_arrow_column, common_arrow_type, write_parquet
 
 logger = logging.get_logger(__name__)
 
 Record = Tuple[Any]
 
+DEFAULT_BATCH_SIZE = 100_000
+
+
+def batches_to_reader(
+    batches: Iterable[pa.RecordBatch], schema: pa.Schema = None
+) -> pa.RecordBatchReader:
+    """Wrap an iterable of record batches in a `pyarrow.RecordBatchReader`.
+
+    If `schema` is not provided, the first batch is consumed eagerly to
+    determine it. This allows sources which page natively to implement
+    `Source.to_arrow_batches()` with a plain generator.
+
+    Args:
+        batches (Iterable[pa.RecordBatch]): The batches to wrap.
+        schema (pa.Schema, optional): The schema of the batches. Defaults to None.
+
+    Returns:
+        pa.RecordBatchReader: A reader yielding the batches lazily.
+    """
+    batches = iter(batches)
+    if schema is None:
+        try:
+            first_batch = next(batches)
+        except StopIteration:
+            return pa.RecordBatchReader.from_batches(pa.schema([]), [])
+        schema = first_batch.schema
+        batches = chain([first_batch], batches)
+    return pa.RecordBatchReader.from_batches(schema, batches)
+
+
+def _column_to_array(values: List[Any]) -> pa.Array:
+    """Convert a list of values to Arrow, falling back to strings for mixed types."""
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if v is None else str(v) for v in values], pa.string())
+
+
+def columns_to_reader(
+    pages: Iterable[Dict[str, List[Any]]], batch_size: int = DEFAULT_BATCH_SIZE
+) -> pa.RecordBatchReader:
+    """Convert pages of columns to record batches with a schema shared by all pages.
+
+    APIs returning JSON don't guarantee that a column has the same type on every
+    page: a column can be empty on the first page and hold integers on the next one,
+    or appear only on later pages. Since the schema of a reader has to be known
+    before its first batch, each page is converted to Arrow as it arrives and spooled
+    to a temporary directory. Once all pages are downloaded, the schemas are unified
+    (see `viadot.utils.common_arrow_type()`) and the pages are read back one by one, cast to the
+    unified schema, with columns missing from a page filled with nulls.
+
+    Args:
+        pages (Iterable[Dict[str, List[Any]]]): The values of each column, page by page.
+        batch_size (int, optional): The maximum number of rows in a single batch.
+            Defaults to 100 000.
+
+    Returns:
+        pa.RecordBatchReader: A reader yielding the pages, or a reader with an empty
+            schema if none of the pages has any rows.
+    """
+    tmp_dir = tempfile.mkdtemp(prefix="viadot-")
+    paths = []
+    schemas = []
+    try:
+        for page in pages:
+            table = pa.table(
+                {name: _column_to_array(values) for name, values in page.items()}
+            )
+            if not table.num_rows:
+                continue
+            path = os.path.join(tmp_dir, f"{len(paths)}.arrow")
+            with pa.OSFile(path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            paths.append(path)
+            schemas.append(table.schema)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    if not paths:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return pa.RecordBatchReader.from_batches(pa.schema([]), [])
+
+    names = list(dict.fromkeys(name for schema in schemas for name in schema.names))
+    schema = pa.schema(
+        [
+            (
+                name,
+                common_arrow_type(
+                    [
+                        page_schema.field(name).type
+                        for page_schema in schemas
+                        if name in page_schema.names
+                    ]
+                ),
+            )
+            for name in names
+        ]
+    )
+
+    def _batches():
+        try:
+            for path in paths:
+                with pa.OSFile(path) as source:
+                    table = pa.ipc.open_file(source).read_all()
+                os.remove(path)
+                columns = [
+                    (
+                        cast_arrow_column(table.column(field.name), field.type)
+                        if field.name in table.column_names
+                        else pa.nulls(table.num_rows, field.type)
+                    )
+                    for field in schema
+                ]
+                table = pa.Table.from_arrays(columns, schema=schema)
+                yield from table.to_batches(max_chunksize=batch_size)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return pa.RecordBatchReader.from_batches(schema, _batches())
+
 
 class Source:
     def __init__(self, *args, credentials: Dict[str, Any] = None, **kwargs):
@@ -33,6 +162,36 @@ class Source:
     def query():
         pass
 
+    def to_arrow_batches(
+        self,
+        if_empty: str = "warn",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **kwargs,
+    ) -> pa.RecordBatchReader:
+        """
+        Stream data from source as a sequence of pyarrow record batches.
+
+        The default implementation materializes the data with `to_df()` and then
+        slices it into batches. Sources which are able to page natively should
+        override this method so that memory usage is bounded by `batch_size`
+        rather than by the size of the whole result.
+
+        Args:
+            if_empty (str, optional): What to do if the source contains no data.
+            Defaults to "warn".
+            batch_size (int, optional): The maximum number of rows in a single batch.
+            Defaults to 100 000.
+
+        Returns:
+            pa.RecordBatchReader: A reader with an explicit schema, yielding
+            `pa.RecordBatch` objects.
+        """
+        df = self.to_df(if_empty=if_empty, **kwargs)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        return pa.RecordBatchReader.from_batches(
+            table.schema, table.to_batches(max_chunksize=batch_size)
+        )
+
     def to_arrow(self, if_empty: str = "warn") -> pa.Table:
         """
         Creates a pyarrow table from source.
@@ -41,19 +200,24 @@ class Source:
         """
 
         try:
-            df = self.to_df(if_empty=if_empty)
+            reader = self.to_arrow_batches(if_empty=if_empty)
+            table = reader.read_all()
         except SKIP:
             return False
 
-        table = pa.Table.from_pandas(df)
         return table
 
+    def _streams_batches(self) -> bool:
+        """Whether the source pages natively, overriding `to_arrow_batches()`."""
+        return type(self).to_arrow_batches is not Source.to_arrow_batches
+
     def to_csv(
         self,
         path: str,
         if_exists: Literal["append", "replace"] = "replace",
         if_empty: str = "warn",
         sep="\t",
+        batch_size: int = DEFAULT_BATCH_SIZE,
         **kwargs,
     ) -> bool:
         """
@@ -63,6 +227,9 @@ class Source:
         additional parameters to pull the right resource. Hence this method
         passes kwargs to the `to_df()` method implemented by the concrete source.
 
+        If the source overrides `to_arrow_batches()` and no kwargs are passed, data
+        is written batch by batch, as returned by `to_arrow_batches()`.
+
         Args:
             path (str): The destination path.
             if_exists (Literal[, optional): What to do if the file exists.
@@ -70,6 +237,8 @@ class Source:
             if_empty (str, optional): What to do if the source contains no data.
             Defaults to "warn".
             sep (str, optional): The separator to use in the CSV. Defaults to "\t".
+            batch_size (int, optional): The maximum number of rows written at once.
+            Defaults to 100 000.
 
         Raises:
             ValueError: If the `if_exists` argument is incorrect.
@@ -78,11 +247,6 @@ class Source:
             bool: Whether the operation was successful.
         """
 
-        try:
-            df = self.to_df(if_empty=if_empty, **kwargs)
-        except SKIP:
-            return False
-
         if if_exists == "append":
             mode = "a"
         elif if_exists == "replace":
@@ -90,9 +254,33 @@ class Source:
         else:
             raise ValueError("'if_exists' must be one of ['append', 'replace']")
 
-        df.to_csv(
-            path, sep=sep, mode=mode, index=False, header=not os.path.exists(path)
-        )
+        header = not os.path.exists(path)
+
+        if kwargs or not self._streams_batches():
+            try:
+                df = self.to_df(if_empty=if_empty, **kwargs)
+            except SKIP:
+                return False
+
+            df.to_csv(path, sep=sep, mode=mode, index=False, header=header)
+            return True
+
+        try:
+            reader = self.to_arrow_batches(if_empty=if_empty, batch_size=batch_size)
+            batches_written = 0
+            for batch in reader:
+                batch.to_pandas().to_csv(
+                    path, sep=sep, mode=mode, index=False, header=header
+                )
+                mode, header = "a", False
+                batches_written += 1
+        except SKIP:
+            return False
+
+        if batches_written == 0:
+            reader.schema.empty_table().to_pandas().to_csv(
+                path, sep=sep, mode=mode, index=False, header=header
+            )
 
         return True
 
@@ -129,31 +317,47 @@ class Source:
         path: str,
         if_exists: Literal["append", "replace", "skip"] = "replace",
         if_empty: Literal["warn", "fail", "skip"] = "warn",
+        batch_size: int = DEFAULT_BATCH_SIZE,
         **kwargs,
-    ) -> None:
+    ) -> bool:
         """
         Write from source to a Parquet file.
 
+        If the source overrides `to_arrow_batches()`, data is written batch by batch,
+        and each batch becomes (at least) one row group in the output file. Otherwise,
+        the DataFrame returned by `to_df()` is written with `DataFrame.to_parquet()`.
+
+        Appends don't read the existing data into memory. If `path` is a directory,
+        it is treated as a Parquet dataset and appends are written into new part
+        files, which is the recommended way of appending. See
+        `viadot.utils.write_parquet()` for details.
+
         Args:
             path (str): The destination path.
-            if_exists (Literal["append", "replace", "skip"], optional): What to do if the file exists. Defaults to "replace".
+            if_exists (Literal["append", "replace", "skip"], optional): What to do if the file exists. With "skip",
+                nothing is written if `path` exists. Defaults to "replace".
             if_empty (Literal["warn", "fail", "skip"], optional): What to do if the source contains no data. Defaults to "warn".
+            batch_size (int, optional): The maximum number of rows written at once. Defaults to 100 000.
+            **kwargs: Keyword arguments passed to `DataFrame.to_parquet()`, or to
+                `pyarrow.parquet.ParquetWriter` for sources streaming record batches.
 
+        Returns:
+            bool: Whether the file has been written.
         """
+        if if_exists == "skip" and os.path.exists(path):
+            logger.info("Skipped.")
+            return False
+
+        if if_exists != "append":
+            if_exists = "replace"
+
         try:
-            df = self.to_df(if_empty=if_empty)
+            if self._streams_batches():
+                data = self.to_arrow_batches(if_empty=if_empty, batch_size=batch_size)
+            else:
+                data = self.to_df(if_empty=if_empty)
         except SKIP:
             return False
-        if if_exists == "append" and os.path.isfile(path):
-            parquet_df = pd.read_parquet(path)
-            out_df = pd.concat([parquet_df, df])
-        elif if_exists == "replace":
-            out_df = df
-        elif if_exists == "skip":
-            logger.info("Skipped.")
-            return
-        else:
-            out_df = df
 
         # create directories if they don't exist
         try:
@@ -164,7 +368,17 @@ class Source:
             logger.info("File not found.")
             pass
 
-        out_df.to_parquet(path, index=False, **kwargs)
+        if isinstance(data, pd.DataFrame):
+            is_new_file = if_exists == "replace" or not os.path.isfile(path)
+            if is_new_file and not os.path.isdir(path):
+                data.to_parquet(path, index=False, **kwargs)
+                return True
+            # `ParquetWriter` doesn't accept the pandas writer's kwargs.
+            data = pa.Table.from_pandas(data, preserve_index=False)
+            kwargs = {}
+
+        write_parquet(data, path, if_exists=if_exists, **kwargs)
+        return True
 
     def _handle_if_empty(
         self, if_empty: Literal["warn", "fail", "skip"] = "warn"
@@ -189,12 +403,16 @@ class Source:
 
 
 class SQL(Source):
+    # Whether the ODBC driver supports binding parameter arrays.
+    FAST_EXECUTEMANY = True
+
     def __init__(
         self,
         driver: str = None,
         config_key: str = None,
         credentials: str = None,
         query_timeout: int = 60 * 60,
+        arraysize: int = 10_000,
         *args,
         **kwargs,
     ):
@@ -207,9 +425,12 @@ class SQL(Source):
             parameter. Defaults to None.
             credentials (str, optional): Credentials for the connection. Defaults to None.
             query_timeout (int, optional): The timeout for executed queries. Defaults to 1 hour.
+            arraysize (int, optional): The number of rows fetched from the cursor at once
+            when streaming query results. Defaults to 10 000.
         """
 
         self.query_timeout = query_timeout
+        self.arraysize = arraysize
 
         if config_key:
             config_credentials = local_config.get(config_key)
@@ -293,6 +514,152 @@ class SQL(Source):
             df = pd.DataFrame()
         return df
 
+    @staticmethod
+    def _arrow_type_from_description(column_description: tuple) -> pa.DataType:
+        """Map a DB-API cursor column description to a pyarrow data type.
+
+        Args:
+            column_description (tuple): An element of `cursor.description`.
+
+        Returns:
+            pa.DataType: The Arrow type to use for the column.
+        """
+        type_code = column_description[1]
+        precision, scale = column_description[4], column_description[5]
+
+        if type_code is bool:
+            return pa.bool_()
+        if type_code is int:
+            return pa.int64()
+        if type_code is float:
+            return pa.float64()
+        if type_code is decimal.Decimal and precision and 0 < precision <= 38:
+            return pa.decimal128(precision, scale or 0)
+        if type_code is datetime.datetime:
+            return pa.timestamp("us")
+        if type_code is datetime.date:
+            return pa.date32()
+        if type_code is datetime.time:
+            return pa.time64("us")
+        if type_code in (bytes, bytearray):
+            return pa.binary()
+        return pa.string()
+
+    def _rows_to_batch(self, rows: List[Record], schema: pa.Schema) -> pa.RecordBatch:
+        """Convert rows fetched from a cursor into a columnar record batch."""
+        columns = list(zip(*rows)) if rows else [()] * len(schema)
+        arrays = []
+        for column, field in zip(columns, schema):
+            if pa.types.is_string(field.type):
+                column = [None if value is None else str(value) for value in column]
+            arrays.append(pa.array(column, type=field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def to_arrow_batches(
+        self,
+        query: str,
+        if_empty: str = "warn",
+        batch_size: int = None,
+        con: pyodbc.Connection = None,
+    ) -> pa.RecordBatchReader:
+        """Stream the result of a SQL query as pyarrow record batches.
+
+        Rows are fetched from the cursor with `fetchmany()`, so only `batch_size`
+        rows are held in memory as Python objects at any time. The schema is
+        derived from the cursor description.
+
+        Args:
+            query (str): SQL query. If it doesn't start with "SELECT" or "WITH",
+            an empty reader is returned.
+            if_empty (str, optional): What to do if the query returns no data.
+            Defaults to "warn".
+            batch_size (int, optional): The number of rows in a single batch.
+            Defaults to `self.arraysize`.
+            con (pyodbc.Connection, optional): The connection to use to pull the data.
+
+        Returns:
+            pa.RecordBatchReader: A reader yielding the query result batch by batch.
+        """
+        conn = con or self.con
+        batch_size = batch_size or self.arraysize
+
+        query_sanitized = query.strip().upper()
+        if not (
+            query_sanitized.startswith("SELECT") or query_sanitized.startswith("WITH")
+        ):
+            return pa.RecordBatchReader.from_batches(pa.schema([]), [])
+
+        cursor = conn.cursor()
+        cursor.arraysize = batch_size
+        cursor.execute(query)
+
+        schema = pa.schema(
+            [
+                pa.field(column[0], self._arrow_type_from_description(column))
+                for column in cursor.description
+            ]
+        )
+
+        first_rows = cursor.fetchmany(batch_size)
+        if not first_rows:
+            cursor.close()
+            self._handle_if_empty(if_empty=if_empty)
+            return pa.RecordBatchReader.from_batches(schema, [])
+
+        def _batches():
+            try:
+                rows = first_rows
+                while rows:
+                    yield self._rows_to_batch(rows, schema)
+                    rows = cursor.fetchmany(batch_size)
+            finally:
+                cursor.close()
+
+        return pa.RecordBatchReader.from_batches(schema, _batches())
+
+    def to_parquet(
+        self,
+        path: str,
+        query: str,
+        if_exists: Literal["append", "replace", "skip"] = "replace",
+        if_empty: Literal["warn", "fail", "skip"] = "warn",
+        batch_size: int = None,
+        **kwargs,
+    ) -> bool:
+        """Write the result of a SQL query to a Parquet file, batch by batch.
+
+        Args:
+            path (str): The destination path. If it's a directory, data is written
+            into a Parquet dataset.
+            query (str): SQL query.
+            if_exists (Literal["append", "replace", "skip"], optional): What to do if
+            the file exists. Defaults to "replace".
+            if_empty (Literal["warn", "fail", "skip"], optional): What to do if the
+            query returns no data. Defaults to "warn".
+            batch_size (int, optional): The number of rows fetched and written at once.
+            Defaults to `self.arraysize`.
+            **kwargs: Keyword arguments passed to `pyarrow.parquet.ParquetWriter`.
+
+        Returns:
+            bool: Whether the file has been written.
+        """
+        if if_exists == "skip" and os.path.exists(path):
+            logger.info("Skipped.")
+            return False
+
+        try:
+            reader = self.to_arrow_batches(
+                query=query, if_empty=if_empty, batch_size=batch_size
+            )
+        except SKIP:
+            return False
+
+        if if_exists != "append":
+            if_exists = "replace"
+
+        write_parquet(reader, path, if_exists=if_exists, **kwargs)
+        return True
+
     def _check_if_table_exists(self, table: str, schema: str = None) -> bool:
         """Checks if table exists.
         Args:
@@ -346,41 +713,135 @@ class SQL(Source):
         self.run(create_table_sql)
         return True
 
-    def insert_into(self, table: str, df: pd.DataFrame) -> str:
+    @staticmethod
+    def _get_input_sizes(df: pd.DataFrame) -> List[Tuple[int, int, int]]:
+        """Determine ODBC parameter types and sizes for the columns of a DataFrame.
+
+        Passing these to `cursor.setinputsizes()` lets the driver bind typed
+        parameter arrays instead of guessing the type of each parameter, which is
+        required for `fast_executemany` to work well with text columns.
+
+        Object columns are typed by their values (see `_get_object_input_size()`).
+
+        Args:
+            df (pd.DataFrame): The DataFrame to be inserted.
+
+        Returns:
+            List[Tuple[int, int, int]]: The (SQL type, size, decimal digits) of each column.
+        """
+        input_sizes = []
+        for column, dtype in df.dtypes.items():
+            if dtype.kind == "b":
+                input_sizes.append((pyodbc.SQL_BIT, 0, 0))
+            elif dtype.kind in "iu":
+                input_sizes.append((pyodbc.SQL_BIGINT, 0, 0))
+            elif dtype.kind == "f":
+                input_sizes.append((pyodbc.SQL_DOUBLE, 0, 0))
+            elif dtype.kind == "M":
+                input_sizes.append((pyodbc.SQL_TYPE_TIMESTAMP, 0, 6))
+            else:
+                input_sizes.append(SQL._get_object_input_size(df[column]))
+        return input_sizes
+
+    @staticmethod
+    def _get_object_input_size(column: pd.Series) -> Tuple[int, int, int]:
+        """Determine the ODBC parameter type and size of an object column.
+
+        Columns holding only dates, times, timestamps, decimals, booleans or bytes
+        are bound with the matching ODBC type. Any other column (strings, or mixed
+        types) is bound as `NVARCHAR`, and the server converts the values to the
+        type of the target column.
+
+        Args:
+            column (pd.Series): The column to be inserted.
+
+        Returns:
+            Tuple[int, int, int]: The (SQL type, size, decimal digits) of the column.
+        """
+        values = column.dropna()
+        types = set(map(type, values))
+
+        if types and all(issubclass(t, datetime.datetime) for t in types):
+            return (pyodbc.SQL_TYPE_TIMESTAMP, 0, 6)
+        if types and all(issubclass(t, datetime.date) for t in types):
+            return (pyodbc.SQL_TYPE_DATE, 0, 0)
+        if types and all(issubclass(t, datetime.time) for t in types):
+            return (pyodbc.SQL_TYPE_TIME, 0, 0)
+        if types and all(issubclass(t, bool) for t in types):
+            return (pyodbc.SQL_BIT, 0, 0)
+        if types and all(issubclass(t, (bytes, bytearray)) for t in types):
+            max_length = max(map(len, values))
+            return (pyodbc.SQL_VARBINARY, max_length if max_length <= 8000 else 0, 0)
+        if types == {decimal.Decimal}:
+            integer_digits, scale = 1, 0
+            for value in values:
+                _, digits, exponent = value.as_tuple()
+                if not isinstance(exponent, int):  # NaN or infinity
+                    break
+                integer_digits = max(integer_digits, len(digits) + exponent)
+                scale = max(scale, -exponent)
+            else:
+                if integer_digits + scale <= 38:
+                    return (pyodbc.SQL_DECIMAL, integer_digits + scale, scale)
+
+        max_length = values.astype(str).str.len().max()
+        size = 0 if pd.isna(max_length) else int(max_length)
+        # Values longer than 4000 characters must be sent as NVARCHAR(MAX).
+        return (pyodbc.SQL_WVARCHAR, size if size <= 4000 else 0, 0)
+
+    def insert_into(
+        self,
+        table: str,
+        df: pd.DataFrame,
+        batch_size: int = 10_000,
+        fast_executemany: bool = None,
+        commit_every_batch: bool = False,
+    ) -> str:
         """Insert values from a pandas DataFrame into an existing
         database table.
 
+        The rows are sent with a parameterized `INSERT` statement, using pyodbc's
+        `fast_executemany` where supported, in batches of `batch_size` rows.
+
         Args:
             table (str): table name
             df (pd.DataFrame): pandas dataframe
+            batch_size (int, optional): The number of rows sent to the database at once.
+                Defaults to 10 000.
+            fast_executemany (bool, optional): Whether to bind the parameters as arrays.
+                Defaults to the `FAST_EXECUTEMANY` attribute of the source.
+            commit_every_batch (bool, optional): Whether to commit after each batch. By
+                default, all rows are inserted in a single transaction, which is rolled
+                back in case of an error. Defaults to False.
 
         Returns:
             str: The executed SQL insert query.
         """
-
-        values = ""
-        rows_count = df.shape[0]
-        counter = 0
-        for row in df.values:
-            counter += 1
-            out_row = ", ".join(map(self._sql_column, row))
-            comma = ",\n"
-            if counter == rows_count:
-                comma = ";"
-            out_row = f"({out_row}){comma}"
-            values += out_row
+        if fast_executemany is None:
+            fast_executemany = self.FAST_EXECUTEMANY
 
         columns = ", ".join(df.columns)
+        placeholders = ", ".join("?" * df.shape[1])
+        sql = f"INSERT INTO {table} ({columns})\n VALUES ({placeholders});"
 
-        sql = f"INSERT INTO {table} ({columns})\n VALUES {values}"
-        self.run(sql)
+        # Convert numpy scalars and missing values to native Python objects.
+        df_native = df.astype(object).where(df.notna(), None)
 
-        return sql
+        cursor = self.con.cursor()
+        if fast_executemany:
+            cursor.fast_executemany = True
+            cursor.setinputsizes(self._get_input_sizes(df))
+        try:
+            for batch_start in range(0, df.shape[0], batch_size):
+                batch = df_native.iloc[batch_start : batch_start + batch_size]
+                cursor.executemany(sql, list(batch.itertuples(index=False, name=None)))
+                if commit_every_batch:
+                    self.con.commit()
+            self.con.commit()
+        except Exception:
+            self.con.rollback()
+            raise
+        finally:
+            cursor.close()
 
-    def _sql_column(self, column_name: str) -> str:
-        """Returns the name of a column"""
-        if isinstance(column_name, str):
-            out_name = f"'{column_name}'"
-        else:
-            out_name = str(column_name)
-        return out_name
+        return sql
@@ -1,15 +1,204 @@
-import re
+import hashlib
+import json
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from typing import Any, Dict, List
-from urllib.parse import urljoin
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urljoin, urlparse
 
 import pandas as pd
+import pyarrow as pa
 import requests
+from prefect.utilities import logging
 
 from ..config import local_config
-from ..exceptions import CredentialError
+from ..exceptions import APIError, CredentialError
 from ..utils import handle_api_response
-from .base import Source
+from .base import DEFAULT_BATCH_SIZE, Source, columns_to_reader
+
+logger = logging.get_logger()
+
+SAP_LABEL = "{http://www.sap.com/Protocols/SAPData}label"
+
+# Column mappings shared by all sources in the process, keyed by the `$metadata` URL
+# and stored together with the time they were fetched.
+_COLUMN_MAPPING_CACHE: Dict[str, Tuple[float, Dict[str, str]]] = {}
+_COLUMN_MAPPING_CACHE_LOCK = threading.Lock()
+
+
+def parse_column_mapping(metadata: str) -> Dict[str, str]:
+    """Map the property names of an OData `$metadata` document to their SAP labels.
+
+    Args:
+        metadata (str): The `$metadata` XML document.
+
+    Returns:
+        Dict[str, str]: Property name as key mapped to the value of its SAP label.
+    """
+    column_mapping = {}
+    for element in ET.fromstring(metadata).iter():
+        # the EDM namespace depends on the OData version, so only the tag is compared
+        if element.tag.rsplit("}", 1)[-1] != "Property":
+            continue
+        name = element.get("Name")
+        label = element.get(SAP_LABEL)
+        if name and label:
+            column_mapping[name] = label
+    return column_mapping
+
+
+def get_column_mapping(
+    url: str,
+    auth: Tuple[str, str] = None,
+    ttl: int = 24 * 60 * 60,
+    cache_dir: str = None,
+) -> Dict[str, str]:
+    """Get the mapping of property names to SAP labels of an entity set.
+
+    The `$metadata` document is downloaded and parsed once per URL and cached in
+    memory for the lifetime of the process. If `cache_dir` is provided, the mapping is
+    also cached on disk, so that subsequent runs don't need to download it at all.
+
+    Args:
+        url (str): The URL of the `$metadata` document.
+        auth (Tuple[str, str], optional): The username and password. Defaults to None.
+        ttl (int, optional): For how many seconds a cached mapping is valid.
+            Defaults to 24 hours.
+        cache_dir (str, optional): The directory in which to cache the mapping on disk.
+            Defaults to None (no on-disk cache).
+
+    Returns:
+        Dict[str, str]: Property name as key mapped to the value of its SAP label.
+    """
+    now = time.time()
+
+    with _COLUMN_MAPPING_CACHE_LOCK:
+        cached = _COLUMN_MAPPING_CACHE.get(url)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+
+    cache_path = None
+    if cache_dir:
+        file_name = hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json"
+        cache_path = os.path.join(cache_dir, file_name)
+        if os.path.isfile(cache_path):
+            with open(cache_path) as f:
+                cached_on_disk = json.load(f)
+            if now - cached_on_disk["fetched_at"] < ttl:
+                column_mapping = cached_on_disk["column_mapping"]
+                with _COLUMN_MAPPING_CACHE_LOCK:
+                    _COLUMN_MAPPING_CACHE[url] = (
+                        cached_on_disk["fetched_at"],
+                        column_mapping,
+                    )
+                return column_mapping
+
+    logger.debug(f"Retrieving metadata from {url}...")
+    try:
+        response = handle_api_response(url=url, auth=auth)
+        column_mapping = parse_column_mapping(response.text)
+    except (APIError, ET.ParseError) as e:
+        # the data can still be downloaded, only with the original column names
+        logger.warning(f"Could not retrieve the column mapping from {url}: {e}")
+        return {}
+
+    with _COLUMN_MAPPING_CACHE_LOCK:
+        _COLUMN_MAPPING_CACHE[url] = (now, column_mapping)
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump({"fetched_at": now, "column_mapping": column_mapping}, f)
+
+    return column_mapping
+
+
+EXCLUDED_COLUMNS = ["__metadata", "Photo", "", "Picture"]
+
+
+def _is_nested(records: List[Dict[str, Any]], key: str) -> bool:
+    """Whether a property holds objects, judging by its first non-null value."""
+    value = next(
+        (record[key] for record in records if record.get(key) is not None), None
+    )
+    if isinstance(value, list):
+        return any(isinstance(item, dict) for item in value)
+    return isinstance(value, dict)
+
+
+def records_to_columns(
+    records: List[Dict[str, Any]],
+    exclude: List[str] = None,
+    mapping: Dict[str, str] = None,
+    skip_nested: bool = False,
+) -> Dict[str, List[Any]]:
+    """Transpose a page of OData entities into columns.
+
+    Which columns to keep is decided once per page, rather than for every value.
+
+    Args:
+        records (List[Dict[str, Any]]): The entities.
+        exclude (List[str], optional): Properties to skip. Defaults to None.
+        mapping (Dict[str, str], optional): New names of the properties. Defaults to None.
+        skip_nested (bool, optional): Whether to skip properties with object values.
+            Defaults to False.
+
+    Returns:
+        Dict[str, List[Any]]: The values of each column, with None for missing values.
+    """
+    if not records:
+        return {}
+    mapping = mapping or {}
+    exclude = set(exclude or [])
+
+    keys = list(records[0])
+    if any(len(record) != len(keys) for record in records):
+        keys = list(dict.fromkeys(key for record in records for key in record))
+    keys = [key for key in keys if key not in exclude]
+    if skip_nested:
+        keys = [key for key in keys if not _is_nested(records, key)]
+    if not keys:
+        return {}
+
+    try:
+        rows = map(itemgetter(*keys), records)
+        values = list(zip(*rows)) if len(keys) > 1 else [list(rows)]
+    except KeyError:
+        # some entities are missing properties
+        values = [[record.get(key) for record in records] for key in keys]
+
+    return {mapping.get(key) or key: list(column) for key, column in zip(keys, values)}
+
+
+def count_rows(columns: Dict[str, List[Any]]) -> int:
+    """The number of rows in a page of columns."""
+    return len(next(iter(columns.values()), []))
+
+
+def concat_columns(pages: Iterable[Dict[str, List[Any]]]) -> Dict[str, List[Any]]:
+    """Concatenate pages of columns, filling columns missing from a page with None."""
+    columns = {}
+    n_rows = 0
+    for page in pages:
+        page_rows = count_rows(page)
+        for name in page:
+            if name not in columns:
+                columns[name] = [None] * n_rows
+        for name, values in columns.items():
+            values.extend(page.get(name) or [None] * page_rows)
+        n_rows += page_rows
+    return columns
+
+
+def columns_to_records(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Transpose columns back into records."""
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
 
 
 class CloudForCustomers(Source):
@@ -24,6 +213,10 @@ class CloudForCustomers(Source):
         params: Dict[str, Any] = None,
         env: str = "QA",
         credentials: Dict[str, Any] = None,
+        metadata_cache_ttl: int = 24 * 60 * 60,
+        metadata_cache_dir: str = None,
+        max_workers: int = 1,
+        page_size: int = 1000,
         **kwargs,
     ):
         """Cloud for Customers connector build for fetching Odata source.
@@ -39,6 +232,15 @@ class CloudForCustomers(Source):
             env (str, optional): The credentials environments. Defaults to 'QA'.
             credentials (Dict[str, Any], optional): The credentials are populated with values from config file or this
             parameter. Defaults to None than use credentials from local_config.
+            metadata_cache_ttl (int, optional): For how many seconds the column mapping retrieved from `$metadata`
+            is cached. Defaults to 24 hours.
+            metadata_cache_dir (str, optional): The directory in which to cache the column mapping on disk, so that
+            it's reused between runs. Defaults to None (only cached in memory).
+            max_workers (int, optional): How many pages to download at the same time. If greater than 1 and the query
+            doesn't use `$top` or `$skip`, pages are requested with `$top` and `$skip` instead of following `__next`
+            links. Defaults to 1.
+            page_size (int, optional): The number of records in a single page when downloading pages concurrently.
+            Defaults to 1000.
         """
         super().__init__(*args, **kwargs)
 
@@ -55,6 +257,10 @@ class CloudForCustomers(Source):
             raise CredentialError("One of: ('url', 'report_url') is required.")
 
         self.is_report = bool(report_url)
+        self.metadata_cache_ttl = metadata_cache_ttl
+        self.metadata_cache_dir = metadata_cache_dir
+        self.max_workers = max_workers
+        self.page_size = page_size
         self.query_endpoint = endpoint
 
         if params:
@@ -78,56 +284,209 @@ class CloudForCustomers(Source):
         meta_url = start + ".svc/$metadata?entityset=" + end
         return meta_url
 
-    def _to_records_report(self, url: str) -> List[Dict[str, Any]]:
-        """Fetches the data from source with report_url.
+    def _iter_pages_report(self, url: str) -> Iterator[Dict[str, List[Any]]]:
+        """Fetches the data from source with report_url, page by page.
         At first enter url is from function parameter. At next is generated automaticaly.
         """
-        records = []
         while url:
             response = self.get_response(url, params=self.params)
             response_json = response.json()
-            new_records = self.response_to_entity_list(response_json, url)
-            records.extend(new_records)
+            yield self.response_to_columns(response_json, url)
 
             url = response_json["d"].get("__next")
 
-        return records
-
-    def _to_records_other(self, url: str) -> List[Dict[str, Any]]:
-        """Fetches the data from source with url.
+    def _iter_pages_other(self, url: str) -> Iterator[Dict[str, List[Any]]]:
+        """Fetches the data from source with url, page by page.
         At first enter url is a join of url and endpoint passed into this function.
         At any other entering it bring `__next_url` adress, generated automatically, but without params.
         """
         tmp_full_url = deepcopy(url)
         tmp_params = deepcopy(self.params)
-        records = []
         while url:
             response = self.get_response(tmp_full_url, params=tmp_params)
             response_json = response.json()
+            new_columns = self._page_to_columns(response_json, tmp_full_url)
             if isinstance(response_json["d"], dict):
                 # ODATA v2+ API
-                new_records = response_json["d"].get("results")
                 url = response_json["d"].get("__next", None)
             else:
                 # ODATA v1
-                new_records = response_json["d"]
                 url = response_json.get("__next", None)
             # prevents concatenation of previous url's with params with the same params
             tmp_params = None
             tmp_full_url = url
-            records.extend(new_records)
-        return records
+            yield new_columns
+
+    def _to_records_report(self, url: str) -> List[Dict[str, Any]]:
+        """Fetches the data from source with report_url.
+        At first enter url is from function parameter. At next is generated automaticaly.
+        """
+        return columns_to_records(concat_columns(self._iter_pages_report(url)))
+
+    def _to_records_other(self, url: str) -> List[Dict[str, Any]]:
+        """Fetches the data from source with url.
+        At first enter url is a join of url and endpoint passed into this function.
+        At any other entering it bring `__next_url` adress, generated automatically, but without params.
+        """
+        return columns_to_records(concat_columns(self._iter_pages_other(url)))
+
+    def _page_to_columns(
+        self, response_json: Dict[str, Any], url: str
+    ) -> Dict[str, List[Any]]:
+        """Extract the columns from a single page of the response."""
+        if self.is_report:
+            return self.response_to_columns(response_json, url)
+        if isinstance(response_json["d"], dict):
+            return records_to_columns(response_json["d"].get("results"))
+        return records_to_columns(response_json["d"])
+
+    def _get_page(
+        self, url: str, params: Dict[str, Any], skip: int, top: int
+    ) -> Tuple[Dict[str, List[Any]], Optional[int]]:
+        """Fetch `top` records starting from the `skip`-th one.
+
+        If the service returns fewer records than requested (eg. because of a
+        server-side page size limit), the `__next` links are followed until the page is complete.
+
+        Returns:
+            Tuple[Dict[str, List[Any]], Optional[int]]: The columns and the total number of
+            records, if returned by the service (see `$inlinecount`).
+        """
+        params = {**params, "$skip": skip, "$top": top}
+        response_json = self.get_response(url, params=params).json()
+        pages = [self._page_to_columns(response_json, url)]
+        total_count = None
+        next_url = None
+        if isinstance(response_json["d"], dict):
+            total_count = response_json["d"].get("__count")
+            next_url = response_json["d"].get("__next")
+        while count_rows(pages[-1]) and sum(map(count_rows, pages)) < top and next_url:
+            response_json = self.get_response(next_url).json()
+            pages.append(self._page_to_columns(response_json, url))
+            next_url = response_json["d"].get("__next")
+        columns = concat_columns(pages)
+        return {name: values[:top] for name, values in columns.items()}, total_count
+
+    def _iter_pages_parallel(self, url: str) -> Iterator[Dict[str, List[Any]]]:
+        """Fetches the data from source in pages of `self.page_size` records using
+        `$top` and `$skip`, downloading up to `self.max_workers` pages at the same time.
+
+        The total number of records is retrieved together with the first page with
+        `$inlinecount=allpages`. If the service doesn't return it, the following pages
+        are downloaded one by one, until a page is not full. Pages are yielded in order.
+        """
+        params = dict(self.params or {})
+        columns, total_count = self._get_page(
+            url, {**params, "$inlinecount": "allpages"}, skip=0, top=self.page_size
+        )
+        yield columns
+
+        if total_count is None:
+            skip = self.page_size
+            while count_rows(columns) == self.page_size:
+                columns, _ = self._get_page(url, params, skip=skip, top=self.page_size)
+                yield columns
+                skip += self.page_size
+            return
+
+        offsets = iter(range(self.page_size, int(total_count), self.page_size))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # only a limited number of pages is downloaded ahead of the consumer
+            futures = deque(
+                executor.submit(
+                    self._get_page, url, params, skip=skip, top=self.page_size
+                )
+                for skip in islice(offsets, self.max_workers * 2)
+            )
+            while futures:
+                columns, _ = futures.popleft().result()
+                skip = next(offsets, None)
+                if skip is not None:
+                    futures.append(
+                        executor.submit(
+                            self._get_page, url, params, skip=skip, top=self.page_size
+                        )
+                    )
+                yield columns
+
+    def _is_paged_by_user(self, url: str) -> bool:
+        """Whether the query already uses `$top` or `$skip`, which rules out parallel paging."""
+        query = parse_qs(urlparse(url).query)
+        params = self.params or {}
+        return any(key in query or key in params for key in ["$top", "$skip"])
+
+    def iter_pages(self) -> Iterator[Dict[str, List[Any]]]:
+        """
+        Download entities page by page.
+
+        If `max_workers` is greater than 1 and the query doesn't specify `$top` or
+        `$skip` itself, pages are downloaded concurrently, see `_iter_pages_parallel()`.
+        Otherwise, the `__next` links are followed one by one.
+
+        Returns:
+            Iterator[Dict[str, List[Any]]]: The columns of each page, in order.
+        """
+        url = self.report_url if self.is_report else self.full_url
+        if self.max_workers > 1 and not self._is_paged_by_user(url):
+            return self._iter_pages_parallel(url)
+        if self.is_report:
+            return self._iter_pages_report(url)
+        return self._iter_pages_other(url)
 
     def to_records(self) -> List[Dict[str, Any]]:
         """
         Download a list of entities in the records format
         """
-        if self.is_report:
-            url = self.report_url
-            return self._to_records_report(url=url)
-        else:
-            url = self.full_url
-            return self._to_records_other(url=url)
+        return columns_to_records(concat_columns(self.iter_pages()))
+
+    def to_arrow_batches(
+        self,
+        if_empty: str = "warn",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> pa.RecordBatchReader:
+        """
+        Stream the entities as Arrow record batches, page by page, so that only the
+        page being downloaded is held in memory as Python objects.
+
+        The schema is unified across all pages, see `columns_to_reader()`.
+
+        Args:
+            if_empty (str, optional): What to do if the source contains no data.
+                Defaults to "warn".
+            batch_size (int, optional): The maximum number of rows in a single batch.
+                Defaults to 100 000.
+
+        Returns:
+            pa.RecordBatchReader: A reader yielding at least one batch per page.
+        """
+        reader = columns_to_reader(self.iter_pages(), batch_size=batch_size)
+        if not reader.schema.names:
+            self._handle_if_empty(if_empty)
+        return reader
+
+    def response_to_columns(
+        self, dirty_json: Dict[str, Any], url: str
+    ) -> Dict[str, List[Any]]:
+        """Changing request json response to columns.
+
+        Columns with nested values (eg. deferred navigation properties) and binary
+        columns are skipped, and the remaining ones are renamed to their SAP labels.
+
+        Args:
+            dirty_json (Dict[str, Any]): json from response.
+            url (str): the URL which trying to fetch metadata.
+
+        Returns:
+            Dict[str, List[Any]]: The values of each column.
+        """
+        metadata_url = self.change_to_meta_url(url)
+        column_maper_dict = self.map_columns(metadata_url)
+        return records_to_columns(
+            dirty_json["d"]["results"],
+            exclude=EXCLUDED_COLUMNS,
+            mapping=column_maper_dict,
+            skip_nested=True,
+        )
 
     def response_to_entity_list(self, dirty_json: Dict[str, Any], url: str) -> List:
         """Changing request json response to list.
@@ -139,46 +498,29 @@ class CloudForCustomers(Source):
         Returns:
             List: List of dictionaries.
         """
-
-        metadata_url = self.change_to_meta_url(url)
-        column_maper_dict = self.map_columns(metadata_url)
-        entity_list = []
-        for element in dirty_json["d"]["results"]:
-            new_entity = {}
-            for key, object_of_interest in element.items():
-                if key not in ["__metadata", "Photo", "", "Picture"]:
-                    if "{" not in str(object_of_interest):
-                        new_key = column_maper_dict.get(key)
-                        if new_key:
-                            new_entity[new_key] = object_of_interest
-                        else:
-                            new_entity[key] = object_of_interest
-            entity_list.append(new_entity)
-        return entity_list
+        return columns_to_records(self.response_to_columns(dirty_json, url))
 
     def map_columns(self, url: str = None) -> Dict[str, str]:
         """Fetch metadata from url used to column name map.
 
+        The metadata is only downloaded once per URL, see `get_column_mapping()`.
+
         Args:
             url (str, optional): the URL which trying to fetch metadata. Defaults to None.
 
         Returns:
             Dict[str, str]: Property Name as key mapped to the value of sap label.
         """
-        column_mapping = {}
-        if url:
-            username = self.credentials.get("username")
-            pw = self.credentials.get("password")
-            response = requests.get(url, auth=(username, pw))
-            for sentence in response.text.split("/>"):
-                result = re.search(
-                    r'(?<=Name=")([^"]+).+(sap:label=")([^"]+)+', sentence
-                )
-                if result:
-                    key = result.groups(0)[0]
-                    val = result.groups(0)[2]
-                    column_mapping[key] = val
-        return column_mapping
+        if not url:
+            return {}
+        username = self.credentials.get("username")
+        pw = self.credentials.get("password")
+        return get_column_mapping(
+            url,
+            auth=(username, pw),
+            ttl=self.metadata_cache_ttl,
+            cache_dir=self.metadata_cache_dir,
+        )
 
     def get_response(
         self, url: str, params: Dict[str, Any] = None, timeout: tuple = (3.05, 60 * 30)
@@ -220,8 +562,8 @@ class CloudForCustomers(Source):
             pandas doesn't support passing dtypes (eg. as a dict) to the constructor.
             kwargs: The parameters to pass to DataFrame constructor.
         """
-        records = self.to_records()
-        df = pd.DataFrame(data=records, **kwargs)
+        columns = concat_columns(self.iter_pages())
+        df = pd.DataFrame(data=columns, **kwargs)
         if dtype:
             df = df.astype(dtype)
         if fields:
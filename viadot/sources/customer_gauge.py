@@ -7,13 +7,18 @@ from prefect.utilities import logging
 from viadot.config import local_config
 from viadot.exceptions import APIError, CredentialError
 from viadot.sources.base import Source
-from viadot.utils import handle_api_response
+from viadot.utils import (
+    credentials_fingerprint,
+    get_token_manager,
+    handle_api_response,
+)
 
 logger = logging.get_logger()
 
 
 class CustomerGauge(Source):
     API_URL = "https://api.eu.customergauge.com/v7/rest/sync/"
+    TOKEN_URL = "https://auth.EU.customergauge.com/oauth2/token"
 
     def __init__(
         self,
@@ -63,17 +68,16 @@ class CustomerGauge(Source):
 
         super().__init__(credentials=self.credentials)
 
-    def get_token(self) -> str:
+    def _request_token(self) -> Dict[str, Any]:
         """
-        Gets Bearer Token using POST request method.
+        Request a new OAuth token with the client credentials.
 
         Raises:
             APIError: If token is not returned.
 
         Returns:
-            str: Bearer Token value.
+            Dict[str, Any]: The token response.
         """
-        url = "https://auth.EU.customergauge.com/oauth2/token"
         client_id = self.credentials.get("client_id", None)
         client_secret = self.credentials.get("client_secret", None)
 
@@ -84,15 +88,37 @@ class CustomerGauge(Source):
             "client_secret": client_secret,
         }
         api_response = handle_api_response(
-            url=url, params=body, headers=headers, method="POST"
+            url=self.TOKEN_URL, params=body, headers=headers, method="POST"
         )
-        token = api_response.json().get("access_token")
+        token = api_response.json()
 
-        if token is None:
+        if token.get("access_token") is None:
             raise APIError("The token could not be generated. Check your credentials.")
 
         return token
 
+    def get_token(self) -> str:
+        """
+        Gets Bearer Token using POST request method.
+
+        The token is cached and shared by all `CustomerGauge` instances using the same
+        client, and it's only requested again shortly before it expires.
+
+        Raises:
+            APIError: If token is not returned.
+
+        Returns:
+            str: Bearer Token value.
+        """
+        token_manager = get_token_manager(
+            key=(
+                self.TOKEN_URL,
+                self.credentials.get("client_id"),
+                credentials_fingerprint(self.credentials.get("client_secret")),
+            )
+        )
+        return token_manager.get_token(self._request_token)["access_token"]
+
     def get_json_response(
         self,
         cursor: int = None,
@@ -1,5 +1,6 @@
 import re
-from typing import Any, List, Literal, NoReturn, Tuple, Union
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Literal, NoReturn, Tuple, Union
 
 import duckdb
 import pandas as pd
@@ -27,6 +28,10 @@ class DuckDB(Source):
     ):
         """A class for interacting with DuckDB.
 
+        A single connection is opened on first use and reused for all queries run by
+        the instance. It can be closed with `close_connection()` or by using the
+        instance as a context manager.
+
         Args:
             config_key (str, optional): The key inside local config containing the config.
             User can choose to use this or pass credentials directly to the `credentials`
@@ -43,20 +48,83 @@ class DuckDB(Source):
 
         super().__init__(*args, credentials=credentials, **kwargs)
 
+        self._con = None
+        self._in_transaction = False
+
+    def __enter__(self) -> "DuckDB":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._in_transaction:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        self.close_connection()
+
     @property
     def con(self) -> duckdb.DuckDBPyConnection:
-        """Return a new connection to the database. As the views are highly isolated,
-        we need a new connection for each query in order to see the changes from
-        previous queries (eg. if we create a new table and then we want to list
-        tables from INFORMATION_SCHEMA, we need to create a new DuckDB connection).
+        """Return the connection to the database, opening it on first use.
+
+        All queries are executed directly on this connection (rather than on separate
+        cursors), so each query sees the changes made by the previous ones, including
+        uncommitted changes within a transaction.
 
         Returns:
             duckdb.DuckDBPyConnection: database connection.
         """
-        return duckdb.connect(
-            database=self.credentials.get("database"),
-            read_only=self.credentials.get("read_only", False),
-        )
+        if self._con is None:
+            self._con = duckdb.connect(
+                database=self.credentials.get("database"),
+                read_only=self.credentials.get("read_only", False),
+            )
+        return self._con
+
+    def close_connection(self) -> None:
+        """Close the connection to the database, if it's open."""
+        if self._con is not None:
+            self._con.close()
+            self._con = None
+            self._in_transaction = False
+
+    def begin(self) -> None:
+        """Begin a transaction. Queries are auto-committed outside of transactions."""
+        self.con.begin()
+        self._in_transaction = True
+
+    def commit(self) -> None:
+        """Commit the current transaction."""
+        self.con.commit()
+        self._in_transaction = False
+
+    def rollback(self) -> None:
+        """Roll back the current transaction."""
+        self.con.rollback()
+        self._in_transaction = False
+
+    @contextmanager
+    def transaction(self) -> Iterator["DuckDB"]:
+        """Run the queries inside the block in a single transaction.
+
+        The transaction is committed when the block exits and rolled back if it raises.
+        If a transaction is already in progress, the block becomes a part of it.
+
+        Example:
+            >>> with duckdb.transaction():
+            ...     duckdb.run("DELETE FROM my_table")
+            ...     duckdb.run("INSERT INTO my_table SELECT * FROM 'data.parquet'")
+        """
+        if self._in_transaction:
+            yield self
+            return
+
+        self.begin()
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+        self.commit()
 
     @property
     def tables(self) -> List[str]:
@@ -65,8 +133,10 @@ class DuckDB(Source):
         Returns:
             List[str]: The list of tables in the format '{SCHEMA}.{TABLE}'.
         """
-        tables_meta: List[Tuple] = self.run("SELECT * FROM information_schema.tables")
-        tables = [table_meta[1] + "." + table_meta[2] for table_meta in tables_meta]
+        tables_meta: List[Tuple] = self.run(
+            "SELECT table_schema, table_name FROM information_schema.tables"
+        )
+        tables = [table_meta[0] + "." + table_meta[1] for table_meta in tables_meta]
         return tables
 
     @property
@@ -112,8 +182,7 @@ class DuckDB(Source):
             raise ValueError(
                 f"Only the values {allowed_fetch_type_values} are allowed for 'fetch_type'"
             )
-        cursor = self.con.cursor()
-        cursor.execute(query)
+        cursor = self.con.execute(query)
 
         query_clean = query.upper().strip()
         regex = r"^\s*[--;].*"
@@ -135,7 +204,6 @@ class DuckDB(Source):
         else:
             result = True
 
-        cursor.close()
         return result
 
     def _handle_if_empty(self, if_empty: str = "warn") -> NoReturn:
@@ -170,36 +238,38 @@ class DuckDB(Source):
         """
         schema = schema or DuckDB.DEFAULT_SCHEMA
         fqn = schema + "." + table
-        exists = self._check_if_table_exists(schema=schema, table=table)
-
-        if exists:
-            if if_exists == "replace":
-                self.run(f"DROP TABLE {fqn}")
-            elif if_exists == "append":
-                self.logger.info(f"Appending to table {fqn}...")
-                ingest_query = f"COPY {fqn} FROM '{path}' (FORMAT 'parquet')"
-                self.run(ingest_query)
-                self.logger.info(f"Successfully appended data to table '{fqn}'.")
-                return True
-            elif if_exists == "delete":
-                self.run(f"DELETE FROM {fqn}")
-                self.logger.info(f"Successfully deleted data from table '{fqn}'.")
-                self.run(f"INSERT INTO {fqn} SELECT * FROM read_parquet('{path}')")
-                self.logger.info(f"Successfully inserted data into table '{fqn}'.")
-                return True
-            elif if_exists == "fail":
-                raise ValueError(
-                    "The table already exists and 'if_exists' is set to 'fail'."
-                )
-            elif if_exists == "skip":
-                return False
-
-        self.run(f"CREATE SCHEMA IF NOT EXISTS {schema}")
-
-        self.logger.info(f"Creating table {fqn}...")
-        ingest_query = f"CREATE TABLE {fqn} AS SELECT * FROM '{path}';"
-        self.run(ingest_query)
-        self.logger.info(f"Table {fqn} has been created successfully.")
+
+        with self.transaction():
+            exists = self._check_if_table_exists(schema=schema, table=table)
+
+            if exists:
+                if if_exists == "replace":
+                    self.run(f"DROP TABLE {fqn}")
+                elif if_exists == "append":
+                    self.logger.info(f"Appending to table {fqn}...")
+                    ingest_query = f"COPY {fqn} FROM '{path}' (FORMAT 'parquet')"
+                    self.run(ingest_query)
+                    self.logger.info(f"Successfully appended data to table '{fqn}'.")
+                    return True
+                elif if_exists == "delete":
+                    self.run(f"DELETE FROM {fqn}")
+                    self.logger.info(f"Successfully deleted data from table '{fqn}'.")
+                    self.run(f"INSERT INTO {fqn} SELECT * FROM read_parquet('{path}')")
+                    self.logger.info(f"Successfully inserted data into table '{fqn}'.")
+                    return True
+                elif if_exists == "fail":
+                    raise ValueError(
+                        "The table already exists and 'if_exists' is set to 'fail'."
+                    )
+                elif if_exists == "skip":
+                    return False
+
+            self.run(f"CREATE SCHEMA IF NOT EXISTS {schema}")
+
+            self.logger.info(f"Creating table {fqn}...")
+            ingest_query = f"CREATE TABLE {fqn} AS SELECT * FROM '{path}';"
+            self.run(ingest_query)
+            self.logger.info(f"Table {fqn} has been created successfully.")
 
     def drop_table(self, table: str, schema: str = None) -> bool:
         """
@@ -229,11 +299,17 @@ class DuckDB(Source):
 
     def _check_if_table_exists(self, table: str, schema: str = None) -> bool:
         schema = schema or DuckDB.DEFAULT_SCHEMA
-        fqn = schema + "." + table
-        return fqn in self.tables
+        exists = self.con.execute(
+            "SELECT 1 FROM information_schema.tables WHERE table_schema = ? AND table_name = ?",
+            [schema, table],
+        ).fetchone()
+        return exists is not None
 
     def _check_if_schema_exists(self, schema: str) -> bool:
         if schema == self.DEFAULT_SCHEMA:
             return True
-        fqns = self.tables
-        return any((fqn.split(".")[0] == schema for fqn in fqns))
+        exists = self.con.execute(
+            "SELECT 1 FROM information_schema.schemata WHERE schema_name = ?",
+            [schema],
+        ).fetchone()
+        return exists is not None
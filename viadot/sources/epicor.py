@@ -1,13 +1,18 @@
+import io
+import itertools
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import IO, Any, Dict, Iterator, List, Optional, Union
 
 import pandas as pd
+import pyarrow as pa
+import requests
 from pydantic import BaseModel
 
 from ..config import local_config
 from ..exceptions import CredentialError, DataRangeError
 from ..utils import handle_api_response
-from .base import Source
+from .base import DEFAULT_BATCH_SIZE, Source
 
 """ 
 The official documentation does not specify the list of required 
@@ -98,83 +103,117 @@ class Order(BaseModel):
     LineItemDetail: Optional[LineItemDetail]
 
 
-def parse_orders_xml(xml_data: str) -> pd.DataFrame:
+# Sections of `HeaderInformation` which are flattened into their own columns.
+HEADER_SECTIONS = {
+    "ShipToAddress": ShipToAddress,
+    "TrackingNumbers": TrackingNumbers,
+    "InvoiceTotals": InvoiceTotals,
+}
+HEADER_FIELDS = [
+    field for field in HeaderInformation.__annotations__ if field not in HEADER_SECTIONS
+]
+LINE_ITEM_FIELDS = list(LineItemDetail.__annotations__)
+
+# The columns of the parsed orders, in the order produced by flattening `Order` models.
+ORDER_COLUMNS = (
+    [f"HeaderInformation.{field}" for field in HEADER_FIELDS]
+    + [
+        f"HeaderInformation.{section}.{field}"
+        for section, model in HEADER_SECTIONS.items()
+        for field in model.__annotations__
+    ]
+    + [f"LineItemDetail.{field}" for field in LINE_ITEM_FIELDS]
+)
+
+
+def _children_text(element: ET.Element, fields: List[str]) -> List[Optional[str]]:
+    """Return the text of the first child element with each of the given tags."""
+    texts = {}
+    for child in element:
+        texts.setdefault(child.tag, child.text)
+    return [texts.get(field) for field in fields]
+
+
+def _parse_header(header: ET.Element) -> List[Optional[str]]:
+    """Return the values of an order's `HeaderInformation`, ordered as in `ORDER_COLUMNS`."""
+    values = _children_text(header, HEADER_FIELDS)
+    for section, model in HEADER_SECTIONS.items():
+        element = header.find(section)
+        if element is None:
+            values.extend([None] * len(model.__annotations__))
+        elif section == "TrackingNumbers":
+            numbers = "".join(
+                f"'{number.text}'" for number in element.findall("TrackingNumber")
+            )
+            values.append(numbers)
+        else:
+            values.extend(_children_text(element, list(model.__annotations__)))
+    return values
+
+
+def iter_orders(xml_data: Union[str, bytes, IO]) -> Iterator[List[Optional[str]]]:
+    """
+    Incrementally parse XML containing Epicor Orders Data.
+
+    The XML is parsed with `iterparse()` and each order is cleared from the tree once
+    its rows are emitted, so memory usage doesn't grow with the number of orders.
+
+    Args:
+        xml_data (Union[str, bytes, IO], required): The XML, or a file-like object to read it from.
+
+    Yields:
+        List[Optional[str]]: A row for each line item, with the values of `ORDER_COLUMNS`.
+    """
+    if isinstance(xml_data, str):
+        xml_data = xml_data.encode("utf-8")
+    if isinstance(xml_data, bytes):
+        xml_data = io.BytesIO(xml_data)
+
+    events = ET.iterparse(xml_data, events=("start", "end"))
+    _, root = next(events)
+    depth = 1
+    header = None
+    line_items = []
+    for event, element in events:
+        if event == "start":
+            depth += 1
+            continue
+        # The depth is 2 for orders, 3 for their headers and 4 for their line items.
+        if depth == 3 and element.tag == "HeaderInformation":
+            header = _parse_header(element)
+        elif depth == 4 and element.tag == "LineItemDetail":
+            line_items.append(_children_text(element, LINE_ITEM_FIELDS))
+        elif depth == 2 and element.tag == "Order":
+            if header is None:
+                header = [None] * (len(ORDER_COLUMNS) - len(LINE_ITEM_FIELDS))
+            for line_item in line_items:
+                yield header + line_item
+            header = None
+            line_items = []
+            root.clear()
+        depth -= 1
+
+
+def parse_orders_xml(xml_data: Union[str, bytes, requests.Response]) -> pd.DataFrame:
     """
     Function to parse xml containing Epicor Orders Data.
 
     Args:
-        xml_data (str, required): Response from Epicor API in form of xml
+        xml_data (Union[str, bytes, requests.Response], required): Response from Epicor API in form of xml
 
     Returns:
         pd.DataFrame: DataFrame containing parsed orders data.
     """
-    final_df = pd.DataFrame()
-    ship_dict = {}
-    invoice_dict = {}
-    header_params_dict = {}
-    item_params_dict = {}
-
-    root = ET.fromstring(xml_data.text)
-
-    for order in root.findall("Order"):
-        for header in order.findall("HeaderInformation"):
-            for tracking_numbers in header.findall("TrackingNumbers"):
-                numbers = ""
-                for tracking_number in tracking_numbers.findall("TrackingNumber"):
-                    numbers = numbers + "'" + tracking_number.text + "'"
-                result_numbers = TrackingNumbers(TrackingNumber=numbers)
-
-            for shipto in header.findall("ShipToAddress"):
-                for ship_param in ShipToAddress.__dict__.get("__annotations__"):
-                    try:
-                        ship_value = shipto.find(ship_param).text
-                    except:
-                        ship_value = None
-                    ship_parameter = {ship_param: ship_value}
-                    ship_dict.update(ship_parameter)
-                ship_address = ShipToAddress(**ship_dict)
-
-            for invoice in header.findall("InvoiceTotals"):
-                for invoice_param in InvoiceTotals.__dict__.get("__annotations__"):
-                    try:
-                        invoice_value = invoice.find(invoice_param).text
-                    except:
-                        invoice_value = None
-                    invoice_parameter = {invoice_param: invoice_value}
-                    invoice_dict.update(invoice_parameter)
-                invoice_total = InvoiceTotals(**invoice_dict)
-
-            for header_param in HeaderInformation.__dict__.get("__annotations__"):
-                try:
-                    header_value = header.find(header_param).text
-                except:
-                    header_value = None
-                if header_param == "TrackingNumbers":
-                    header_parameter = {header_param: result_numbers}
-                elif header_param == "ShipToAddress":
-                    header_parameter = {header_param: ship_address}
-                elif header_param == "InvoiceTotals":
-                    header_parameter = {header_param: invoice_total}
-                else:
-                    header_parameter = {header_param: header_value}
-                header_params_dict.update(header_parameter)
-            header_info = HeaderInformation(**header_params_dict)
-        for items in order.findall("LineItemDetails"):
-            for item in items.findall("LineItemDetail"):
-                for item_param in LineItemDetail.__dict__.get("__annotations__"):
-                    try:
-                        item_value = item.find(item_param).text
-                    except:
-                        item_value = None
-                    item_parameter = {item_param: item_value}
-                    item_params_dict.update(item_parameter)
-                line_item = LineItemDetail(**item_params_dict)
-                row = Order(HeaderInformation=header_info, LineItemDetail=line_item)
-                my_dict = row.dict()
-                final_df = final_df.append(
-                    pd.json_normalize(my_dict, max_level=2), ignore_index=True
-                )
-    return final_df
+    if isinstance(xml_data, requests.Response):
+        xml_data = xml_data.content
+    return _orders_to_df(iter_orders(xml_data))
+
+
+def _orders_to_df(rows: Iterator[List[Optional[str]]]) -> pd.DataFrame:
+    rows = list(rows)
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame(rows, columns=ORDER_COLUMNS)
 
 
 class Epicor(Source):
@@ -187,6 +226,7 @@ class Epicor(Source):
         validate_date_filter: bool = True,
         start_date_field: str = "BegInvoiceDate",
         end_date_field: str = "EndInvoiceDate",
+        days_interval: int = None,
         *args,
         **kwargs,
     ):
@@ -202,6 +242,8 @@ class Epicor(Source):
             validate_date_filter (bool, optional): Whether or not validate xml date filters. Defaults to True.
             start_date_field (str, optional) The name of filters field containing start date. Defaults to "BegInvoiceDate".
             end_date_field (str, optional) The name of filters field containing end date. Defaults to "EndInvoiceDate".
+            days_interval (int, optional): If provided, the date range of the filters is split into windows of
+                this many days, which are requested one by one. Defaults to None.
         """
         DEFAULT_CREDENTIALS = local_config.get(config_key)
         credentials = credentials or DEFAULT_CREDENTIALS
@@ -218,6 +260,8 @@ class Epicor(Source):
         self.validate_date_filter = validate_date_filter
         self.start_date_field = start_date_field
         self.end_date_field = end_date_field
+        self.days_interval = days_interval
+        self._token = None
 
         super().__init__(*args, credentials=credentials, **kwargs)
 
@@ -276,27 +320,122 @@ class Epicor(Source):
                         "Too much data. Please provide a date range filter."
                     )
 
-    def get_xml_response(self):
-        "Function for getting response from Epicor API"
+    def iter_filters(self) -> Iterator[str]:
+        """
+        Split the date range of the filters into windows of `days_interval` days
+        (both ends included). If `days_interval` is not provided, or the filters
+        don't specify a date range, the filters are returned as they are.
+
+        Yields:
+            str: Filters in form of XML, one for each window.
+        """
+        root = ET.fromstring(self.filters_xml)
+        start_element = root.find(f".//{self.start_date_field}")
+        end_element = root.find(f".//{self.end_date_field}")
+        if (
+            not self.days_interval
+            or start_element is None
+            or end_element is None
+            or not start_element.text
+            or not end_element.text
+        ):
+            yield self.filters_xml
+            return
+
+        window_start = date.fromisoformat(start_element.text.strip())
+        end_date = date.fromisoformat(end_element.text.strip())
+        while window_start <= end_date:
+            window_end = min(
+                window_start + timedelta(days=self.days_interval - 1), end_date
+            )
+            start_element.text = window_start.isoformat()
+            end_element.text = window_end.isoformat()
+            yield ET.tostring(root, encoding="unicode")
+            window_start = window_end + timedelta(days=1)
+
+    def get_xml_response(self, filters_xml: str = None):
+        """Function for getting response from Epicor API
+
+        Args:
+            filters_xml (str, optional): Filters in form of XML. Defaults to None (`self.filters_xml`).
+        """
         if self.validate_date_filter == True:
             self.validate_filter()
-        payload = self.filters_xml
+        payload = filters_xml or self.filters_xml
         url = self.generate_url()
+        # The token is valid for 24 hours, so it's reused for all requests.
+        if self._token is None:
+            self._token = self.generate_token()
         headers = {
             "Content-Type": "application/xml",
-            "Authorization": "Bearer " + self.generate_token(),
+            "Authorization": "Bearer " + self._token,
         }
         response = handle_api_response(
             url=url, headers=headers, body=payload, method="POST"
         )
         return response
 
+    def iter_rows(self) -> Iterator[List[Optional[str]]]:
+        """
+        Download and parse the orders, one date window (see `iter_filters()`) at a time.
+
+        Yields:
+            List[Optional[str]]: A row for each line item, with the values of `ORDER_COLUMNS`.
+        """
+        for filters_xml in self.iter_filters():
+            response = self.get_xml_response(filters_xml)
+            yield from iter_orders(response.content)
+
     def to_df(self) -> pd.DataFrame:
         """Function for creating pandas DataFrame from Epicor API response
 
         Returns:
             pd.DataFrame: Output DataFrame.
         """
-        data = self.get_xml_response()
-        df = parse_orders_xml(data)
-        return df
+        return _orders_to_df(self.iter_rows())
+
+    def to_arrow_batches(
+        self,
+        if_empty: str = "warn",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> pa.RecordBatchReader:
+        """
+        Stream the orders as pyarrow record batches, with `ORDER_COLUMNS` as string columns.
+
+        Like the data frames loaded by `EpicorOrdersToDuckDB` (see
+        `add_ingestion_metadata_task`), the batches end with the
+        `_viadot_downloaded_at_utc` column.
+
+        Args:
+            if_empty (str, optional): What to do if there are no orders. Defaults to "warn".
+            batch_size (int, optional): The number of rows in a single batch. Defaults to 100 000.
+
+        Returns:
+            pa.RecordBatchReader: A reader yielding the orders batch by batch.
+        """
+        downloaded_at_type = pa.timestamp("us", tz="UTC")
+        schema = pa.schema(
+            [(column, pa.string()) for column in ORDER_COLUMNS]
+            + [("_viadot_downloaded_at_utc", downloaded_at_type)]
+        )
+        downloaded_at = datetime.now(timezone.utc).replace(microsecond=0)
+        rows = self.iter_rows()
+
+        def _batches():
+            batch = list(itertools.islice(rows, batch_size))
+            while batch:
+                yield pa.RecordBatch.from_arrays(
+                    [pa.array(column, pa.string()) for column in zip(*batch)]
+                    + [pa.array([downloaded_at] * len(batch), downloaded_at_type)],
+                    schema=schema,
+                )
+                batch = list(itertools.islice(rows, batch_size))
+
+        batches = _batches()
+        first_batch = next(batches, None)
+        if first_batch is None:
+            self._handle_if_empty(if_empty=if_empty)
+            return pa.RecordBatchReader.from_batches(schema, [])
+        return pa.RecordBatchReader.from_batches(
+            schema, itertools.chain([first_batch], batches)
+        )
@@ -1,3 +1,6 @@
+from typing import Any, Dict, List
+
+import numpy as np
 import pandas as pd
 
 from viadot.utils import APIError, handle_api_response
@@ -5,6 +8,72 @@ from viadot.utils import APIError, handle_api_response
 from .base import Source
 
 
+def _category_labels(dimension: Dict[str, Any], size: int) -> List[str]:
+    """Return the labels of a JSON-stat dimension's categories, ordered by their position."""
+    category = dimension["category"]
+    label = category.get("label", {})
+    index = category.get("index", list(label))
+    if isinstance(index, list):
+        index = {code: position for position, code in enumerate(index)}
+
+    labels = [None] * size
+    for code, position in index.items():
+        labels[position] = label.get(code, code)
+    return labels
+
+
+def jsonstat_to_df(data: Dict[str, Any], dimensions: List[str] = None) -> pd.DataFrame:
+    """
+    Decode a JSON-stat dataset into a DataFrame with one row per value.
+
+    The position of each value in the cube (the key of the sparse `value` object,
+    or the position in the `value` array) is unraveled against the dimensions' sizes
+    all at once, so there are no Python loops over the cells.
+
+    Args:
+        data (Dict[str, Any]): The JSON-stat dataset, with the `id`, `size`, `dimension`
+            and `value` keys.
+        dimensions (List[str], optional): The dimensions to include, in this order.
+            Defaults to None (all dimensions, in the order of `id`).
+
+    Returns:
+        pd.DataFrame: A categorical column with the category labels for each dimension,
+            and the `indicator` column with the values, ordered by position in the cube.
+    """
+    ids = data["id"]
+    sizes = data["size"]
+    dimensions = ids if dimensions is None else dimensions
+
+    values = data.get("value", {})
+    if isinstance(values, dict):
+        positions = np.fromiter(map(int, values), dtype=np.int64, count=len(values))
+        values = list(values.values())
+    else:
+        positions = np.array(
+            [position for position, value in enumerate(values) if value is not None],
+            dtype=np.int64,
+        )
+        values = [values[position] for position in positions]
+
+    order = np.argsort(positions, kind="stable")
+    positions = positions[order]
+    codes = np.unravel_index(positions, sizes)
+
+    columns = {}
+    for dimension in dimensions:
+        axis = ids.index(dimension)
+        labels = _category_labels(data["dimension"][dimension], sizes[axis])
+        if len(set(labels)) == len(labels):
+            columns[dimension] = pd.Categorical.from_codes(codes[axis], labels)
+        else:
+            columns[dimension] = pd.Categorical(
+                np.array(labels, dtype=object)[codes[axis]]
+            )
+    columns["indicator"] = np.array(values)[order] if values else []
+
+    return pd.DataFrame(columns)
+
+
 class Eurostat(Source):
     """
     Class for creating instance of Eurostat connector to REST API by HTTPS response (no credentials required).
@@ -147,66 +216,14 @@ class Eurostat(Source):
     def eurostat_dictionary_to_df(self, *signals: list) -> pd.DataFrame:
         """Function for creating DataFrame from JSON pulled from Eurostat.
 
+        The JSON-stat data is decoded with `jsonstat_to_df()`.
+
         Returns:
-            pd.DataFrame: With 4 columns: index, geo, time, indicator.
+            pd.DataFrame: With a column for each of the provided dimensions (e.g. geo, time) and indicator.
         """
-
-        class T_SIGNAL:
-            signal_keys_list: list
-            signal_index_list: list
-            signal_label_list: list
-            signal_name: str
-
-        # Dataframe creation
-        columns0 = signals[0].copy()
-        columns0.append("indicator")
-        df = pd.DataFrame(columns=columns0)
-        indicator_list = []
-        index_list = []
-        signal_lists = []
-
-        # get the dictionary from the inputs
         eurostat_dictionary = signals[-1]
-
-        for signal in signals[0]:
-            signal_struct = T_SIGNAL()
-            signal_struct.signal_name = signal
-            signal_struct.signal_keys_list = list(
-                eurostat_dictionary["dimension"][signal]["category"]["index"].keys()
-            )
-            signal_struct.signal_index_list = list(
-                eurostat_dictionary["dimension"][signal]["category"]["index"].values()
-            )
-            signal_label_dict = eurostat_dictionary["dimension"][signal]["category"][
-                "label"
-            ]
-            signal_struct.signal_label_list = [
-                signal_label_dict[i] for i in signal_struct.signal_keys_list
-            ]
-            signal_lists.append(signal_struct)
-
-        col_signal_temp = []
-        row_signal_temp = []
-        for row_index, row_label in zip(
-            signal_lists[0].signal_index_list, signal_lists[0].signal_label_list
-        ):  # rows
-            for col_index, col_label in zip(
-                signal_lists[1].signal_index_list, signal_lists[1].signal_label_list
-            ):  # cols
-                index = str(
-                    col_index + row_index * len(signal_lists[1].signal_label_list)
-                )
-                if index in eurostat_dictionary["value"].keys():
-                    index_list.append(index)
-                    col_signal_temp.append(col_label)
-                    row_signal_temp.append(row_label)
-
-        indicator_list = [eurostat_dictionary["value"][i] for i in index_list]
-        df.indicator = indicator_list
-        df[signal_lists[1].signal_name] = col_signal_temp
-        df[signal_lists[0].signal_name] = row_signal_temp
-
-        return df
+        df = jsonstat_to_df(eurostat_dictionary, dimensions=signals[0])
+        return df.astype({dimension: object for dimension in signals[0]})
 
     def get_data_frame_from_response(self) -> pd.DataFrame:
         """Function responsible for getting response, creating DataFrame using method 'eurostat_dictionary_to_df'
@@ -2,7 +2,9 @@ import asyncio
 import base64
 import json
 import os
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 from typing import Any, Dict, List, Literal, Optional
 
@@ -15,7 +17,11 @@ from prefect.engine import signals
 from viadot.config import local_config
 from viadot.exceptions import APIError, CredentialError
 from viadot.sources.base import Source
-from viadot.utils import handle_api_response
+from viadot.utils import (
+    credentials_fingerprint,
+    get_token_manager,
+    handle_api_response,
+)
 
 warnings.simplefilter("ignore")
 
@@ -90,18 +96,17 @@ class Genesys(Source):
             self.environment = self.credentials.get("ENVIRONMENT", None)
 
         self.report_data = []
+        self.report_ids = []
 
-    @property
-    def authorization_token(self, verbose: bool = False):
+    def _request_token(self, verbose: bool = False) -> Dict[str, Any]:
         """
-        Get authorization token with request headers.
+        Request a new OAuth token with the client credentials.
 
         Args:
-            CLIENT_SECRET, SCHEDULE_ID and host server. Defaults to None.
             verbose (bool, optional): Switch on/off for logging messages. Defaults to False.
 
         Returns:
-            Dict: request headers with token.
+            Dict[str, Any]: The token response.
         """
         CLIENT_ID = self.credentials.get("CLIENT_ID", None)
         CLIENT_SECRET = self.credentials_genesys.get("CLIENT_SECRET", None)
@@ -127,7 +132,33 @@ class Genesys(Source):
                 self.logger.info(
                     f"Failure: { str(response.status_code) } - { response.reason }"
                 )
-        response_json = response.json()
+        return response.json()
+
+    @property
+    def authorization_token(self, verbose: bool = False):
+        """
+        Get authorization token with request headers.
+
+        The token is cached and shared by all `Genesys` instances using the same
+        environment and client, and it's only requested again shortly before it expires.
+
+        Args:
+            CLIENT_SECRET, SCHEDULE_ID and host server. Defaults to None.
+            verbose (bool, optional): Switch on/off for logging messages. Defaults to False.
+
+        Returns:
+            Dict: request headers with token.
+        """
+        token_manager = get_token_manager(
+            key=(
+                f"https://login.{self.environment}/oauth/token",
+                self.credentials.get("CLIENT_ID"),
+                credentials_fingerprint(self.credentials_genesys.get("CLIENT_SECRET")),
+            )
+        )
+        response_json = token_manager.get_token(
+            lambda: self._request_token(verbose=verbose)
+        )
         request_headers = {
             "Authorization": f"{ response_json['token_type'] } { response_json['access_token']}",
             "Content-Type": "application/json",
@@ -142,57 +173,71 @@ class Genesys(Source):
         params: Dict[str, Any] = None,
         method: Literal["POST", "GET"] = "POST",
         sleep_time: int = 0.5,
+        max_retries: int = 3,
     ) -> Optional[dict]:
         """Function that make POST request method to Genesys API given and endpoint.
 
+        All the requests are sent concurrently over a single session, within the API's
+        rate limit. Requests rejected with `429 Too Many Requests` are retried after the
+        time given in the `Retry-After` header or with an exponential backoff.
+
         Args:
             post_data_list (List[str], optional): List of string templates to generate json body. Defaults to None.
             end_point (str, optional): Final end point for Genesys connection. Defaults to "analytics/reporting/exports".
             params (Dict[str, Any], optional): Parameters to be passed into the POST call. Defaults to None.
             method (Literal["POST", "GET"], optional): Type of connection to the API. Defaults to "POST".
-            sleep_time (int, optional): The time, in seconds, to sleep the script between calls to the API. Defaults to 0.5
+            sleep_time (int, optional): The initial time, in seconds, to wait before retrying a rate limited
+                request. Defaults to 0.5
+            max_retries (int, optional): How many times to retry a rate limited request. Defaults to 3.
 
         Returns:
             Optional[dict]: Dict when the "conversations" endpoint is called, otherwise returns None.
         """
 
         limiter = AsyncLimiter(2, 15)
-        semaphore = asyncio.Semaphore(value=1)
         url = f"https://api.{self.environment}/api/v2/{end_point}"
+        # a GET request doesn't depend on the body, so it's only sent once
+        if method == "GET":
+            post_data_list = post_data_list[-1:] or [None]
+
+        async def send_request(session: aiohttp.ClientSession, data_to_post: Any):
+            payload = json.dumps(data_to_post) if method == "POST" else None
+            for attempt in range(max_retries + 1):
+                async with limiter:
+                    async with session.request(
+                        method,
+                        url,
+                        headers=self.authorization_token,
+                        data=payload,
+                        params=params,
+                    ) as resp:
+                        response = await resp.read()
+                        retry_after = resp.headers.get("Retry-After")
+                        status = resp.status
+                if status != 429 or attempt == max_retries:
+                    break
+                delay = float(retry_after or sleep_time * 2**attempt)
+                self.logger.warning(f"Rate limit exceeded, retrying in {delay}s.")
+                await asyncio.sleep(delay)
+
+            if method == "POST":
+                self.logger.info(f"Generated report export --- \n {payload}.")
+            return json.loads(response.decode("utf-8"))
+
+        async def send_all():
+            async with aiohttp.ClientSession() as session:
+                return await asyncio.gather(
+                    *[send_request(session, data) for data in post_data_list]
+                )
 
-        async def generate_post():
-            for data_to_post in post_data_list:
-                payload = json.dumps(data_to_post)
-                async with aiohttp.ClientSession() as session:
-                    await semaphore.acquire()
-                    async with limiter:
-                        if method == "POST":
-                            async with session.post(
-                                url,
-                                headers=self.authorization_token,
-                                data=payload,
-                            ) as resp:
-                                global new_report
-                                new_report = await resp.read()
-                                self.logger.info(
-                                    f"Generated report export --- \n {payload}."
-                                )
-                                semaphore.release()
-                        elif method == "GET":
-                            async with session.get(
-                                url,
-                                headers=self.authorization_token,
-                                params=params,
-                            ) as resp:
-                                new_report = await resp.read()
-                                semaphore.release()
-                await asyncio.sleep(sleep_time)
-
-        loop = asyncio.get_event_loop()
-        coroutine = generate_post()
-        loop.run_until_complete(coroutine)
-
-        return json.loads(new_report.decode("utf-8"))
+        responses = asyncio.run(send_all())
+
+        if method == "POST" and end_point == "analytics/reporting/exports":
+            self.report_ids.extend(
+                response["id"] for response in responses if "id" in response
+            )
+
+        return responses[-1]
 
     def load_reporting_exports(self, page_size: int = 100, verbose: bool = False):
         """
@@ -220,6 +265,19 @@ class Genesys(Source):
             self.logger.error(f"Failed to loaded all exports. - {new_report.content}")
             raise APIError("Failed to loaded all exports.")
 
+    @staticmethod
+    def _get_report_metadata(entity: Dict[str, Any]) -> List[Any]:
+        """Extract the metadata of a reporting export used to download and delete it."""
+        return [
+            entity.get("id"),
+            entity.get("downloadUrl"),
+            entity.get("filter").get("queueIds", [-1])[0],
+            entity.get("filter").get("mediaTypes", [-1])[0],
+            entity.get("viewType"),
+            entity.get("interval"),
+            entity.get("status"),
+        ]
+
     def get_reporting_exports_data(self) -> None:
         """
         Function that generate list of reports metadata for further processing steps.
@@ -231,16 +289,7 @@ class Genesys(Source):
             assert type(entities) == list
             if len(entities) != 0:
                 for entity in entities:
-                    tmp = [
-                        entity.get("id"),
-                        entity.get("downloadUrl"),
-                        entity.get("filter").get("queueIds", [-1])[0],
-                        entity.get("filter").get("mediaTypes", [-1])[0],
-                        entity.get("viewType"),
-                        entity.get("interval"),
-                        entity.get("status"),
-                    ]
-                    self.report_data.append(tmp)
+                    self.report_data.append(self._get_report_metadata(entity))
             assert len(self.report_data) > 0
         self.logger.info("Generated list of reports entities.")
 
@@ -278,16 +327,66 @@ class Genesys(Source):
             df.drop_duplicates(inplace=True, ignore_index=True)
         df.to_csv(os.path.join(path, final_file_name), index=False, sep=sep)
 
+    def _get_report_file_name(self, single_report: List[Any]) -> Optional[str]:
+        """
+        Get the name of the file to download a report to.
+
+        Args:
+            single_report (List[Any]): The report metadata, from `self.report_data`.
+
+        Returns:
+            Optional[str]: The file name, without the extension, or None if the report
+                shouldn't be downloaded.
+        """
+        self.logger.info(single_report)
+        if single_report[-1] == "RUNNING":
+            self.logger.warning(
+                "The request is still in progress and will be deleted, consider add more seconds in `view_type_time_sleep` parameter."
+            )
+            return None
+        elif single_report[-1] == "FAILED":
+            self.logger.warning(
+                "This message 'FAILED_GETTING_DATA_FROM_SERVICE' raised during script execution."
+            )
+            return None
+        elif self.start_date not in single_report[5]:
+            self.logger.warning(
+                f"The report with ID {single_report[0]} doesn't match with the interval date that you have already defined. \
+                    The report won't be downloaded but will be deleted."
+            )
+            return None
+
+        date = self.start_date.replace("-", "")
+        if single_report[4].lower() in [
+            "queue_performance_detail_view",
+            "queue_interaction_detail_view",
+            "agent_status_detail_view",
+            "agent_interaction_detail_view",
+            "agent_timeline_summary_view",
+        ]:
+            return f"{self.view_type.upper()}_{next(self.count)}_{date}"
+        elif single_report[4].lower() in [
+            "agent_performance_summary_view",
+            "agent_status_summary_view",
+        ]:
+            return self.view_type.upper() + "_" + f"{date}"
+        else:
+            raise signals.SKIP(
+                message=f"View type {self.view_type} not defined in viadot, yet..."
+            )
+
     def download_all_reporting_exports(
-        self, store_file_names: bool = True, path: str = ""
+        self, store_file_names: bool = True, path: str = "", max_workers: int = 8
     ) -> List[str]:
         """
-        Get information form data report and download all files.
+        Get information form data report and download all files concurrently.
 
         Args:
             ids_mapping (Dict[str, Any], optional): relationship between id and file name. Defaults to None.
             file_extension (Literal[xls, xlsx, csv;], optional): file extensions for downloaded files. Defaults to "csv".
             store_file_names (bool, optional): decide whether to store list of names.
+            path (str, optional): Path to the folder where the files are downloaded. Defaults to empty string.
+            max_workers (int, optional): The maximum number of reports downloaded at the same time. Defaults to 8.
         Returns:
             List[str]: all file names of downloaded files
         """
@@ -298,59 +397,124 @@ class Genesys(Source):
         else:
             self.logger.info("IDS_MAPPING loaded from local credential.")
 
-        for single_report in self.report_data:
-            self.logger.info(single_report)
-            if single_report[-1] == "RUNNING":
-                self.logger.warning(
-                    "The request is still in progress and will be deleted, consider add more seconds in `view_type_time_sleep` parameter."
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = []
+            for single_report in self.report_data:
+                file_name = self._get_report_file_name(single_report)
+                if file_name is None:
+                    continue
+                futures.append(
+                    executor.submit(
+                        self.download_report,
+                        report_url=single_report[1],
+                        path=path,
+                        output_file_name=file_name,
+                        file_extension=self.file_extension,
+                    )
                 )
-                continue
-            elif single_report[-1] == "FAILED":
-                self.logger.warning(
-                    "This message 'FAILED_GETTING_DATA_FROM_SERVICE' raised during script execution."
-                )
-                continue
-            elif self.start_date not in single_report[5]:
-                self.logger.warning(
-                    f"The report with ID {single_report[0]} doesn't match with the interval date that you have already defined. \
-                        The report won't be downloaded but will be deleted."
-                )
-                continue
-
-            date = self.start_date.replace("-", "")
-            if single_report[4].lower() in [
-                "queue_performance_detail_view",
-                "queue_interaction_detail_view",
-                "agent_status_detail_view",
-                "agent_interaction_detail_view",
-                "agent_timeline_summary_view",
-            ]:
-                file_name = f"{self.view_type.upper()}_{next(self.count)}_{date}"
-            elif single_report[4].lower() in [
-                "agent_performance_summary_view",
-                "agent_status_summary_view",
-            ]:
-                file_name = self.view_type.upper() + "_" + f"{date}"
-            else:
-                raise signals.SKIP(
-                    message=f"View type {self.view_type} not defined in viadot, yet..."
-                )
-
-            self.download_report(
-                report_url=single_report[1],
-                path=path,
-                output_file_name=file_name,
-                file_extension=self.file_extension,
-            )
-            if store_file_names is True:
                 file_name_list.append(file_name + "." + self.file_extension)
 
+            for future in futures:
+                future.result()
+
         self.logger.info("All reports were successfully downloaded.")
 
         if store_file_names is True:
             self.logger.info("Successfully genetared file names list.")
             return file_name_list
 
+    def download_reporting_exports_when_ready(
+        self,
+        report_ids: List[str] = None,
+        path: str = "",
+        timeout: float = 600,
+        poll_interval: float = 1,
+        max_poll_interval: float = 30,
+        max_workers: int = 8,
+    ) -> List[str]:
+        """
+        Wait for the reporting exports to be generated and download each of them as
+        soon as it's ready, while the others are still being generated.
+
+        The exports' status is polled with an exponential backoff, starting from
+        `poll_interval` seconds. The metadata of all the exports, including the ones
+        which failed or didn't finish within `timeout`, is stored in `self.report_data`,
+        so that they can be deleted with `delete_all_reporting_exports()`.
+
+        Args:
+            report_ids (List[str], optional): IDs of the exports to download. Defaults to None (the
+                exports created with `genesys_api_connection()`, or all the existing exports if none were).
+            path (str, optional): Path to the folder where the files are downloaded. Defaults to empty string.
+            timeout (float, optional): The maximum time, in seconds, to wait for the exports. Defaults to 600.
+            poll_interval (float, optional): The initial time, in seconds, between status checks. Defaults to 1.
+            max_poll_interval (float, optional): The maximum time, in seconds, between status checks. Defaults to 30.
+            max_workers (int, optional): The maximum number of reports downloaded at the same time. Defaults to 8.
+
+        Returns:
+            List[str]: All file names of downloaded files.
+        """
+        pending = set(report_ids or self.report_ids)
+        wait_for_all = len(pending) == 0
+        deadline = time.monotonic() + timeout
+        delay = poll_interval
+        file_name_list = []
+        last_seen = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = []
+            while True:
+                entities = self.load_reporting_exports().get("entities", [])
+                for entity in entities:
+                    report_id = entity.get("id")
+                    if wait_for_all and report_id not in last_seen:
+                        pending.add(report_id)
+                    if report_id not in pending:
+                        continue
+                    last_seen[report_id] = entity
+                    status = entity.get("status")
+                    if status in ("SUBMITTED", "RUNNING", "CANCELLING") or (
+                        status == "COMPLETED" and entity.get("downloadUrl") is None
+                    ):
+                        continue
+
+                    pending.discard(report_id)
+                    single_report = self._get_report_metadata(entity)
+                    self.report_data.append(single_report)
+                    file_name = self._get_report_file_name(single_report)
+                    if file_name is None:
+                        continue
+                    futures.append(
+                        executor.submit(
+                            self.download_report,
+                            report_url=single_report[1],
+                            path=path,
+                            output_file_name=file_name,
+                            file_extension=self.file_extension,
+                        )
+                    )
+                    file_name_list.append(file_name + "." + self.file_extension)
+
+                if not pending:
+                    break
+                if time.monotonic() + delay > deadline:
+                    self.logger.warning(
+                        f"{len(pending)} report(s) were not generated within {timeout} seconds."
+                    )
+                    for report_id in pending:
+                        if report_id in last_seen:
+                            self.report_data.append(
+                                self._get_report_metadata(last_seen[report_id])
+                            )
+                    break
+                time.sleep(delay)
+                delay = min(delay * 2, max_poll_interval)
+
+            for future in futures:
+                future.result()
+
+        self.logger.info("All reports were successfully downloaded.")
+        return file_name_list
+
     def delete_reporting_exports(self, report_id) -> int:
         """DELETE method for deleting particular reporting exports.
 
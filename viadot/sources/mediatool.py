@@ -1,7 +1,8 @@
 import inspect
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
-from typing import List, Union
+from typing import Dict, List, Tuple, Union
 
 import pandas as pd
 from prefect.utilities import logging
@@ -24,6 +25,7 @@ class Mediatool(Source):
         credentials: dict,
         organization_id: str = None,
         user_id: str = None,
+        max_workers: int = 8,
         *args,
         **kwargs,
     ):
@@ -34,6 +36,8 @@ class Mediatool(Source):
             credentials (dict): Mediatool credentials. Credentials have to contain authorization 'TOKEN'.
             organization_id (str, optional): Organization ID. Defaults to None.
             user_id (str, optional): User ID. Defaults to None.
+            max_workers (int, optional): The maximum number of entities (e.g. vehicles) requested
+                concurrently. Defaults to 8.
         """
         if any([rq not in credentials for rq in ["TOKEN", "USER_ID"]]):
             raise CredentialError(
@@ -47,6 +51,10 @@ class Mediatool(Source):
             "ORGANIZATION_ID"
         )
         self.user_id = user_id or self.credentials.get("USER_ID")
+        self.max_workers = max_workers
+
+        # Entities already downloaded by this instance, by endpoint and ID.
+        self._entities: Dict[Tuple[str, str], dict] = {}
 
     def rename_columns(
         self, df: pd.DataFrame = None, column_suffix: str = "rename"
@@ -166,54 +174,90 @@ class Mediatool(Source):
 
         return response_dict["campaigns"]
 
-    def get_vehicles(
-        self,
-        vehicle_ids: List[str],
-        return_dataframe: bool = True,
-    ) -> Union[pd.DataFrame, dict]:
+    def get_entities(
+        self, endpoint: str, key: str, ids: List[str]
+    ) -> Tuple[Dict[str, dict], Dict[str, Exception]]:
         """
-        Get vehicles data based on the organization IDs. Returns DataFrame or Dict.
+        Get the entities with the given IDs from an endpoint, e.g. `vehicles/{id}`.
+
+        Repeated IDs are requested once and entities already downloaded by this instance
+        are reused. The remaining IDs are requested concurrently, up to `max_workers` at a time.
 
         Args:
-            vehicle_ids (List[str]): List of organization IDs.
-            return_dataframe (bool, optional): Return a dataframe if True. If set to False, return the data as a dict.
-                Defaults to True.
+            endpoint (str): The endpoint, e.g. "vehicles".
+            key (str): The key of the entity in the response, e.g. "vehicle".
+            ids (List[str]): List of entity IDs.
 
         Returns:
-            Union[pd.DataFrame, dict]: Default return dataframe. If 'return_daframe=False' then return dictionary.
+            Tuple[Dict[str, dict], Dict[str, Exception]]: The entities and the errors, by ID,
+                in the order of `ids`.
         """
-        response_dict = {}
-        dfs = []
-        missing_vehicles = []
+        ids = list(dict.fromkeys(ids))
+        missing_ids = [id for id in ids if (endpoint, id) not in self._entities]
 
-        for id in vehicle_ids:
-            url = f"https://api.mediatool.com/vehicles/{id}"
+        def _get_entity(id: str) -> Union[dict, Exception]:
             try:
                 response = handle_api_response(
-                    url=url,
+                    url=f"https://api.mediatool.com/{endpoint}/{id}",
                     headers=self.header,
                     method="GET",
                 )
-            except Exception:
-                missing_vehicles.append(id)
+            except Exception as e:
+                return e
+            return json.loads(response.text)[key]
+
+        errors = {}
+        if missing_ids:
+            max_workers = min(self.max_workers, len(missing_ids))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for id, result in zip(
+                    missing_ids, executor.map(_get_entity, missing_ids)
+                ):
+                    if isinstance(result, Exception):
+                        errors[id] = result
+                    else:
+                        self._entities[(endpoint, id)] = result
+
+        entities = {
+            id: self._entities[(endpoint, id)]
+            for id in ids
+            if (endpoint, id) in self._entities
+        }
+        return entities, errors
+
+    def get_vehicles(
+        self,
+        vehicle_ids: List[str],
+        return_dataframe: bool = True,
+    ) -> Union[pd.DataFrame, List[dict]]:
+        """
+        Get vehicles data based on the organization IDs. Returns DataFrame or a list of dicts.
 
-            else:
-                response_dict = json.loads(response.text)
-                df_single = pd.DataFrame(response_dict["vehicle"], index=[0])
-                dfs.append(df_single)
+        Args:
+            vehicle_ids (List[str]): List of organization IDs.
+            return_dataframe (bool, optional): Return a dataframe if True. If set to False, return the data as a list
+                of dicts. Defaults to True.
+
+        Returns:
+            Union[pd.DataFrame, List[dict]]: Default return dataframe. If 'return_daframe=False' then return list of dicts.
+        """
+        vehicles, errors = self.get_entities(
+            endpoint="vehicles", key="vehicle", ids=vehicle_ids
+        )
+        missing_vehicles = list(errors)
 
         if missing_vehicles:
             logger.error(f"Vehicle were not found for: {missing_vehicles}.")
 
         if return_dataframe is True:
-            if len(dfs) > 0:
-                df = pd.concat(dfs)
+            if len(vehicles) > 0:
+                df = pd.DataFrame.from_records(list(vehicles.values()))
                 function_name = inspect.stack()[0][3]
                 df_updated = self.rename_columns(df=df, column_suffix=function_name)
                 return df_updated
             return None
 
-        return response_dict["vehicle"]
+        return list(vehicles.values())
 
     def get_organizations(
         self, user_id: str = None, return_dataframe: bool = True
@@ -273,21 +317,20 @@ class Mediatool(Source):
         Returns:
             Union[pd.DataFrame, List[dict]]: Default return dataframe. If 'return_daframe=False' then return list of dicts.
         """
-        list_media_types = []
-        for id_media_type in media_type_ids:
-            response = handle_api_response(
-                url=f"https://api.mediatool.com/mediatypes/{id_media_type}",
-                headers=self.header,
-                method="GET",
-            )
-            response_dict = json.loads(response.text)
-            list_media_types.append(
-                {
-                    "_id": response_dict.get("mediaType").get("_id"),
-                    "name": response_dict.get("mediaType").get("name"),
-                    "type": response_dict.get("mediaType").get("type"),
-                }
-            )
+        media_types, errors = self.get_entities(
+            endpoint="mediatypes", key="mediaType", ids=media_type_ids
+        )
+        if errors:
+            raise next(iter(errors.values()))
+
+        list_media_types = [
+            {
+                "_id": media_type.get("_id"),
+                "name": media_type.get("name"),
+                "type": media_type.get("type"),
+            }
+            for media_type in media_types.values()
+        ]
 
         if return_dataframe is True:
             df = pd.DataFrame.from_dict(list_media_types)
@@ -1,13 +1,26 @@
-from typing import Any, Dict, List, Literal, OrderedDict
+import csv
+import io
+import itertools
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Literal, OrderedDict
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import requests
+from prefect.engine.signals import SKIP
 from prefect.utilities import logging
 from simple_salesforce import Salesforce as SF
 from simple_salesforce.exceptions import SalesforceMalformedRequest
 
 from ..config import local_config
-from ..exceptions import CredentialError
-from .base import Source
+from ..exceptions import APIError, CredentialError
+from ..utils import handle_api_response, write_parquet
+from .base import DEFAULT_BATCH_SIZE, Source, columns_to_reader
 
 logger = logging.get_logger(__name__)
 
@@ -169,19 +182,244 @@ class Salesforce(Source):
             f"Successfully upserted {len(records)} records into table '{table}'."
         )
 
+    @staticmethod
+    def _build_query(
+        query: str = None, table: str = None, columns: List[str] = None
+    ) -> str:
+        if query:
+            return query
+        if columns:
+            columns_str = ", ".join(columns)
+        else:
+            columns_str = "FIELDS(STANDARD)"
+        return f"SELECT {columns_str} FROM {table}"
+
+    def iter_records(
+        self, query: str = None, table: str = None, columns: List[str] = None
+    ) -> Iterator[OrderedDict]:
+        """
+        Lazily iterate over the records returned by a query over the REST API.
+
+        Following pages are requested (using `nextRecordsUrl`) only once the
+        records of the previous page have been consumed.
+
+        Args:
+            query (str, optional): The SOQL query. Defaults to None.
+            table (str, optional): Table name. Can be used instead of query. Defaults to None.
+            columns (List[str], optional): List of columns which are needed - table argument is needed.
+                Defaults to None.
+        """
+        query = self._build_query(query=query, table=table, columns=columns)
+        for record in self.salesforce.query_all_iter(query):
+            # Take trash out.
+            record.pop("attributes", None)
+            yield record
+
+    def _bulk_request(
+        self,
+        path: str = "",
+        method: str = "GET",
+        params: Dict[str, Any] = None,
+        **kwargs,
+    ) -> requests.Response:
+        url = (
+            f"https://{self.salesforce.sf_instance}"
+            f"/services/data/v{self.salesforce.sf_version}/jobs/query{path}"
+        )
+        headers = {
+            "Authorization": f"Bearer {self.salesforce.session_id}",
+            "Content-Type": "application/json",
+        }
+        return handle_api_response(
+            url=url, params=params, headers=headers, method=method, **kwargs
+        )
+
+    def create_bulk_query_job(self, query: str) -> str:
+        """
+        Create a Bulk API 2.0 query job.
+
+        Salesforce splits the job into chunks of primary keys (PK chunking) on its side.
+
+        Args:
+            query (str): The SOQL query.
+
+        Returns:
+            str: The ID of the job.
+        """
+        body = json.dumps({"operation": "query", "query": query})
+        response = self._bulk_request(method="POST", body=body)
+        return response.json()["id"]
+
+    def wait_for_bulk_query_job(
+        self,
+        job_id: str,
+        timeout: int = 3600,
+        poll_interval: float = 1,
+        max_poll_interval: float = 30,
+    ) -> Dict[str, Any]:
+        """
+        Wait until a Bulk API 2.0 query job is complete. The interval between
+        status checks is doubled after each check, up to `max_poll_interval`.
+
+        Args:
+            job_id (str): The ID of the job.
+            timeout (int, optional): The maximum time to wait, in seconds. Defaults to 3600.
+            poll_interval (float, optional): The initial interval between status checks,
+                in seconds. Defaults to 1.
+            max_poll_interval (float, optional): The maximum interval between status
+                checks, in seconds. Defaults to 30.
+
+        Raises:
+            APIError: If the job has failed, was aborted, or didn't complete in time.
+
+        Returns:
+            Dict[str, Any]: The job information.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self._bulk_request(path=f"/{job_id}").json()
+            state = job["state"]
+            if state == "JobComplete":
+                return job
+            if state in ("Failed", "Aborted"):
+                raise APIError(
+                    f"Bulk query job {job_id} {state.lower()}: {job.get('errorMessage')}"
+                )
+            if time.monotonic() + poll_interval > deadline:
+                raise APIError(
+                    f"Bulk query job {job_id} did not complete within {timeout} seconds."
+                )
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, max_poll_interval)
+
+    @staticmethod
+    def _parse_bulk_csv(content: bytes) -> pa.Table:
+        """Parse a Bulk API result chunk. All columns are read as strings."""
+        header = content.split(b"\n", 1)[0].decode("utf-8").rstrip("\r")
+        column_names = next(csv.reader([header]))
+        return pa_csv.read_csv(
+            io.BytesIO(content),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in column_names},
+                strings_can_be_null=True,
+            ),
+        )
+
+    def iter_bulk_query_results(
+        self, job_id: str, max_records: int = None, max_workers: int = 4
+    ) -> Iterator[pa.Table]:
+        """
+        Download the results of a completed Bulk API 2.0 query job, chunk by chunk.
+
+        Chunks have to be requested one after the other, as the locator of the next
+        chunk is only known once the previous one has been received, so they are
+        parsed into Arrow in a thread pool while the following chunks are being
+        downloaded. At most `max_workers` chunks are held in memory at any time.
+
+        Args:
+            job_id (str): The ID of the job.
+            max_records (int, optional): The maximum number of records in a chunk.
+                Defaults to None (decided by Salesforce).
+            max_workers (int, optional): The number of threads parsing the chunks.
+                Defaults to 4.
+
+        Yields:
+            pa.Table: The chunks, in order.
+        """
+        pending = deque()
+        locator = None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                params = {}
+                if max_records:
+                    params["maxRecords"] = max_records
+                if locator:
+                    params["locator"] = locator
+                response = self._bulk_request(path=f"/{job_id}/results", params=params)
+                pending.append(executor.submit(self._parse_bulk_csv, response.content))
+                locator = response.headers.get("Sforce-Locator")
+                if not locator or locator == "null":
+                    break
+                if len(pending) >= max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def to_arrow_batches(
+        self,
+        query: str = None,
+        table: str = None,
+        columns: List[str] = None,
+        if_empty: str = "warn",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        mode: Literal["rest", "bulk"] = "rest",
+        max_workers: int = 4,
+        timeout: int = 3600,
+    ) -> pa.RecordBatchReader:
+        """
+        Stream the result of a query as pyarrow record batches.
+
+        Args:
+            query (str, optional): The SOQL query. Defaults to None.
+            table (str, optional): Table name. Can be used instead of query. Defaults to None.
+            columns (List[str], optional): List of columns which are needed - table argument is needed.
+                Defaults to None.
+            if_empty (str, optional): What to do if the query returns no data. Defaults to "warn".
+            batch_size (int, optional): The maximum number of rows in a single batch.
+                Defaults to 100 000.
+            mode (Literal["rest", "bulk"], optional): Whether to page through the REST API
+                or to run a Bulk API 2.0 query job. The bulk mode is much faster for large
+                tables, but it returns all values as strings. In the REST mode, the
+                schema is unified across all pages, see `columns_to_reader()`.
+                Defaults to "rest".
+            max_workers (int, optional): The number of threads parsing bulk result chunks.
+                Defaults to 4.
+            timeout (int, optional): The maximum time to wait for a bulk query job to
+                complete, in seconds. Defaults to 3600.
+
+        Returns:
+            pa.RecordBatchReader: A reader yielding the query result batch by batch.
+        """
+        query = self._build_query(query=query, table=table, columns=columns)
+
+        if mode == "bulk":
+            job_id = self.create_bulk_query_job(query)
+            job = self.wait_for_bulk_query_job(job_id, timeout=timeout)
+            if not job.get("numberRecordsProcessed"):
+                self._handle_if_empty(if_empty=if_empty)
+                return pa.RecordBatchReader.from_batches(pa.schema([]), [])
+            tables = self.iter_bulk_query_results(
+                job_id, max_records=batch_size, max_workers=max_workers
+            )
+            batches = (
+                batch
+                for chunk in tables
+                for batch in chunk.to_batches(max_chunksize=batch_size)
+            )
+            first_batch = next(batches)
+            return pa.RecordBatchReader.from_batches(
+                first_batch.schema, itertools.chain([first_batch], batches)
+            )
+
+        records = self.iter_records(query=query)
+
+        def _rest_pages():
+            batch = list(itertools.islice(records, batch_size))
+            while batch:
+                keys = dict.fromkeys(key for record in batch for key in record)
+                yield {key: [record.get(key) for record in batch] for key in keys}
+                batch = list(itertools.islice(records, batch_size))
+
+        reader = columns_to_reader(_rest_pages(), batch_size=batch_size)
+        if not reader.schema.names:
+            self._handle_if_empty(if_empty=if_empty)
+        return reader
+
     def download(
         self, query: str = None, table: str = None, columns: List[str] = None
     ) -> List[OrderedDict]:
-        if not query:
-            if columns:
-                columns_str = ", ".join(columns)
-            else:
-                columns_str = "FIELDS(STANDARD)"
-            query = f"SELECT {columns_str} FROM {table}"
-        records = self.salesforce.query(query).get("records")
-        # Take trash out.
-        _ = [record.pop("attributes") for record in records]
-        return records
+        return list(self.iter_records(query=query, table=table, columns=columns))
 
     def to_df(
         self,
@@ -189,11 +427,89 @@ class Salesforce(Source):
         table: str = None,
         columns: List[str] = None,
         if_empty: str = None,
+        mode: Literal["rest", "bulk"] = "rest",
+        max_workers: int = 4,
     ) -> pd.DataFrame:
         # TODO: handle if_empty, add typing (should be Literal)
+        if mode == "bulk":
+            df = (
+                self.to_arrow_batches(
+                    query=query,
+                    table=table,
+                    columns=columns,
+                    if_empty="fail",
+                    mode=mode,
+                    max_workers=max_workers,
+                )
+                .read_all()
+                .to_pandas()
+            )
+            return df
+
         records = self.download(query=query, table=table, columns=columns)
 
         if not records:
             raise ValueError(f"Query produced no data.")
 
         return pd.DataFrame(records)
+
+    def to_parquet(
+        self,
+        path: str,
+        query: str = None,
+        table: str = None,
+        columns: List[str] = None,
+        if_exists: Literal["append", "replace", "skip"] = "replace",
+        if_empty: Literal["warn", "fail", "skip"] = "warn",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        mode: Literal["rest", "bulk"] = "rest",
+        max_workers: int = 4,
+        **kwargs,
+    ) -> bool:
+        """
+        Write the result of a query to a Parquet file, batch by batch.
+
+        Args:
+            path (str): The destination path. If it's a directory, data is written
+                into a Parquet dataset.
+            query (str, optional): The SOQL query. Defaults to None.
+            table (str, optional): Table name. Can be used instead of query. Defaults to None.
+            columns (List[str], optional): List of columns which are needed - table argument is needed.
+                Defaults to None.
+            if_exists (Literal["append", "replace", "skip"], optional): What to do if
+                the file exists. Defaults to "replace".
+            if_empty (Literal["warn", "fail", "skip"], optional): What to do if the
+                query returns no data. Defaults to "warn".
+            batch_size (int, optional): The maximum number of rows in a single batch.
+                Defaults to 100 000.
+            mode (Literal["rest", "bulk"], optional): Whether to page through the REST API
+                or to run a Bulk API 2.0 query job. Defaults to "rest".
+            max_workers (int, optional): The number of threads parsing bulk result chunks.
+                Defaults to 4.
+            **kwargs: Keyword arguments passed to `pyarrow.parquet.ParquetWriter`.
+
+        Returns:
+            bool: Whether the file has been written.
+        """
+        if if_exists == "skip" and os.path.exists(path):
+            logger.info("Skipped.")
+            return False
+
+        try:
+            reader = self.to_arrow_batches(
+                query=query,
+                table=table,
+                columns=columns,
+                if_empty=if_empty,
+                batch_size=batch_size,
+                mode=mode,
+                max_workers=max_workers,
+            )
+        except SKIP:
+            return False
+
+        if if_exists != "append":
+            if_exists = "replace"
+
+        write_parquet(reader, path, if_exists=if_exists, **kwargs)
+        return True
@@ -1,11 +1,26 @@
+import glob
+import io
+import json
+import os
+import queue
 import re
+import threading
+import time
 from collections import OrderedDict
-from typing import List, Literal
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import reduce
+from itertools import chain
+from typing import Any, Callable, Dict, Iterator, List, Literal
 from typing import OrderedDict as OrderedDictType
 from typing import Tuple, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 from prefect.utilities import logging
 
 try:
@@ -17,7 +32,7 @@ from sql_metadata import Parser
 
 from viadot.config import local_config
 from viadot.exceptions import CredentialError, DataBufferExceeded
-from viadot.sources.base import Source
+from viadot.sources.base import DEFAULT_BATCH_SIZE, Source
 
 logger = logging.get_logger()
 
@@ -177,31 +192,30 @@ def catch_extra_separators(
     """
 
     # remove scape characters from data_raw ("\t")
-    for n, r in enumerate(data_raw):
-        if "\t" in r[record_key]:
-            data_raw[n][record_key] = r[record_key].replace("\t", " ")
+    lines = pd.Series([row[record_key] for row in data_raw], dtype=object)
+    for n in np.flatnonzero(lines.str.contains("\t", regex=False).to_numpy()):
+        data_raw[n][record_key] = data_raw[n][record_key].replace("\t", " ")
+        lines[n] = data_raw[n][record_key]
 
     # first it is identified where the data has an extra separator in text columns.
-    sep_counts = np.array([], dtype=int)
-    for row in data_raw:
-        sep_counts = np.append(sep_counts, row[record_key].count(f"{sep}"))
+    sep_counts = lines.str.count(re.escape(sep)).to_numpy()
+    no_sep_index = np.flatnonzero(sep_counts != len(fields) - 1)
+    if len(no_sep_index) == 0:
+        return data_raw
 
-    no_sep_index = np.argwhere(sep_counts != len(fields) - 1)
-    no_sep_index = no_sep_index.reshape(
-        len(no_sep_index),
-    )
-    sep_index = np.argwhere(sep_counts == len(fields) - 1)
-    sep_index = sep_index.reshape(
-        len(sep_index),
-    )
     # indentifying "good" rows we obtain the index of separator positions.
-    pos_sep_index = np.array([], dtype=int)
-    for data in data_raw[sep_index]:
-        pos_sep_index = np.append(
-            pos_sep_index,
-            np.where(np.array([*data[record_key]]) == f"{sep}"),
-        )
-    pos_sep_index = np.unique(pos_sep_index)
+    sep_index = np.flatnonzero(sep_counts == len(fields) - 1)
+    pos_sep_index = np.array(
+        sorted(
+            {
+                position
+                for line in lines.iloc[sep_index].unique()
+                for position, char in enumerate(line)
+                if char == sep
+            }
+        ),
+        dtype=int,
+    )
 
     # in rows with an extra separator, we replace them by another character: "-" by default
     data_raw = replace_separator_in_data(
@@ -216,6 +230,427 @@ def catch_extra_separators(
     return data_raw
 
 
+def parse_records(
+    data_raw: List[Dict[str, str]],
+    fields: List[str],
+    sep: str,
+    record_key: str = "WA",
+) -> pd.DataFrame:
+    """Split the delimited records returned by `RFC_READ_TABLE` into columns.
+
+    The records are parsed in bulk with Arrow's CSV reader (quoting disabled), which
+    is considerably faster than splitting each record in Python. Multi-character
+    separators and records containing line breaks fall back to `str.split()`.
+
+    Args:
+        data_raw (List[Dict[str, str]]): The `DATA` part of the response.
+        fields (List[str]): The names of the columns in the records.
+        sep (str): The separator used in the query.
+        record_key (str, optional): The key holding the record. Defaults to "WA".
+
+    Raises:
+        ValueError: If the records can't be split into `len(fields)` columns.
+
+    Returns:
+        pd.DataFrame: A DataFrame of string columns named after `fields`.
+    """
+    lines = [row[record_key] for row in data_raw]
+    if not lines:
+        return pd.DataFrame(columns=fields, dtype=object)
+
+    buffer = "\n".join(lines)
+    if len(sep) == 1 and buffer.count("\n") == len(lines) - 1 and "\r" not in buffer:
+        try:
+            table = pa_csv.read_csv(
+                io.BytesIO(buffer.encode()),
+                read_options=pa_csv.ReadOptions(column_names=fields),
+                parse_options=pa_csv.ParseOptions(
+                    delimiter=sep,
+                    quote_char=False,
+                    escape_char=False,
+                    ignore_empty_lines=False,
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={field: pa.string() for field in fields},
+                    strings_can_be_null=False,
+                ),
+            )
+        except pa.ArrowInvalid as e:
+            raise ValueError(
+                f"The records can't be split into {len(fields)} columns with separator '{sep}'."
+            ) from e
+        return table.to_pandas()
+
+    # `Series.str.split()` only has `regex=False` from pandas 1.4 on, and treats
+    # multi-character separators as regular expressions before that.
+    df = pd.DataFrame([line.split(sep) for line in lines], dtype=object)
+    if df.shape[1] != len(fields):
+        raise ValueError(
+            f"The records can't be split into {len(fields)} columns with separator '{sep}'."
+        )
+    df.columns = fields
+    return df
+
+
+def parse_fixed_width_records(
+    data_raw: List[Dict[str, str]],
+    fields_metadata: List[Dict[str, str]],
+    fields: List[str],
+    record_key: str = "WA",
+) -> pd.DataFrame:
+    """Slice the undelimited records returned by `RFC_READ_TABLE` into columns.
+
+    Args:
+        data_raw (List[Dict[str, str]]): The `DATA` part of the response.
+        fields_metadata (List[Dict[str, str]]): The `FIELDS` part of the response, with
+            the `OFFSET` and `LENGTH` of each field in the records.
+        fields (List[str]): The names of the columns in the records.
+        record_key (str, optional): The key holding the record. Defaults to "WA".
+
+    Returns:
+        pd.DataFrame: A DataFrame of string columns named after `fields`.
+    """
+    lines = pa.array([row[record_key] for row in data_raw], type=pa.string())
+    columns = {}
+    for name, field in zip(fields, fields_metadata):
+        offset = int(field["OFFSET"])
+        columns[name] = pc.utf8_slice_codeunits(
+            lines, start=offset, stop=offset + int(field["LENGTH"])
+        )
+    return pa.table(columns).to_pandas()
+
+
+def cast_to_sap_types(
+    df: pd.DataFrame,
+    field_info: Dict[str, Dict[str, Any]],
+    columns: Dict[str, str] = None,
+) -> pd.DataFrame:
+    """Cast the numeric columns of a DataFrame downloaded from SAP to their SAP types.
+
+    Integer fields (ABAP types I, b, s and 8) are cast to `int64` and packed numbers
+    and floats (P and F) to `float64`, handling SAP's trailing minus sign. Blank
+    values become nulls. Other columns are left as strings.
+
+    Args:
+        df (pd.DataFrame): The DataFrame with string columns.
+        field_info (Dict[str, Dict[str, Any]]): The field metadata, as returned by
+            `get_field_info()`.
+        columns (Dict[str, str], optional): A mapping of the DataFrame's column names to
+            the SAP field names, for aliased columns. Defaults to None.
+
+    Returns:
+        pd.DataFrame: The DataFrame with numeric columns cast.
+    """
+    columns = columns or {}
+    for column in df.columns:
+        field = field_info.get(columns.get(column, column))
+        if field is None or field["inttype"] not in "Ibs8PF":
+            continue
+        values = pc.utf8_trim_whitespace(pa.array(df[column], type=pa.string()))
+        values = pc.replace_substring_regex(
+            values, pattern=r"^(.*)-$", replacement=r"-\1"
+        )
+        values = pc.if_else(pc.equal(values, ""), None, values)
+        if field["inttype"] in "PF":
+            df[column] = values.cast(pa.float64()).to_pandas()
+        else:
+            df[column] = values.cast(pa.int64()).to_pandas(integer_object_nulls=False)
+            if df[column].isna().any():
+                df[column] = df[column].astype("Int64")
+    return df
+
+
+def join_chunks(chunk_dfs: List[pd.DataFrame], on: List[str]) -> pd.DataFrame:
+    """Join the DataFrames of column chunks on their unique key columns.
+
+    If the keys are unique within each chunk, all chunks are joined at once by
+    aligning them on a shared index (a single hash join). Otherwise, the chunks are
+    outer-merged one by one.
+
+    Args:
+        chunk_dfs (List[pd.DataFrame]): The DataFrames of each column chunk.
+        on (List[str]): The unique key columns, present in each chunk.
+
+    Returns:
+        pd.DataFrame: The joined DataFrame, with columns in the order of the chunks.
+    """
+    columns = list(
+        dict.fromkeys(col for chunk_df in chunk_dfs for col in chunk_df.columns)
+    )
+    indexed = [chunk_df.set_index(on) for chunk_df in chunk_dfs]
+    if all(chunk_df.index.is_unique for chunk_df in indexed):
+        df = pd.concat(indexed, axis=1, join="outer").reset_index()
+    else:
+        logger.warning(
+            "The 'rfc_unique_id' columns are not unique. Falling back to merging chunks one by one."
+        )
+        df = reduce(
+            lambda left, right: pd.merge(left, right, on=on, how="outer"), chunk_dfs
+        )
+    return df[columns]
+
+
+# Field metadata of SAP tables shared by all sources in the process,
+# keyed by (system, table) and stored together with the time it was fetched.
+_FIELD_INFO_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, Dict[str, Any]]]] = {}
+_FIELD_INFO_CACHE_LOCK = threading.Lock()
+
+
+def get_system_id(credentials: dict) -> str:
+    """Identify a SAP system (and client) based on the connection credentials."""
+    return "_".join(
+        str(credentials.get(key, "")) for key in ("ashost", "sysnr", "client")
+    )
+
+
+def get_field_info(
+    call: Callable,
+    system: str,
+    table_name: str,
+    ttl: int = 24 * 60 * 60,
+    cache_dir: str = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Get the metadata of all fields of a SAP table.
+
+    The metadata is retrieved with a single `DDIF_FIELDINFO_GET` call per table and
+    cached in memory for the lifetime of the process. If `cache_dir` is provided, it's
+    also cached on disk, so that subsequent runs don't need to call SAP at all.
+
+    Args:
+        call (Callable): The function used to call SAP RFC functions.
+        system (str): The identifier of the SAP system, used as part of the cache key.
+        table_name (str): The name of the table.
+        ttl (int, optional): For how many seconds cached metadata is valid.
+            Defaults to 24 hours.
+        cache_dir (str, optional): The directory in which to cache the metadata on disk.
+            Defaults to None (no on-disk cache).
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The metadata of each field, keyed by the field name.
+        Each field has the keys `length`, `offset`, `decimals`, `inttype` and `datatype`.
+    """
+    key = (system, table_name)
+    now = time.time()
+
+    with _FIELD_INFO_CACHE_LOCK:
+        cached = _FIELD_INFO_CACHE.get(key)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+
+    cache_path = None
+    if cache_dir:
+        file_name = re.sub(r"[^\w.-]", "_", f"{system}_{table_name}") + ".json"
+        cache_path = os.path.join(cache_dir, file_name)
+        if os.path.isfile(cache_path):
+            with open(cache_path) as f:
+                cached_on_disk = json.load(f)
+            if now - cached_on_disk["fetched_at"] < ttl:
+                fields = cached_on_disk["fields"]
+                with _FIELD_INFO_CACHE_LOCK:
+                    _FIELD_INFO_CACHE[key] = (cached_on_disk["fetched_at"], fields)
+                return fields
+
+    logger.debug(f"Retrieving field metadata for table {table_name}...")
+    response = call("DDIF_FIELDINFO_GET", TABNAME=table_name)
+    fields = {
+        field["FIELDNAME"]: {
+            "length": int(field["LENG"]),
+            "offset": int(field["OFFSET"]),
+            "decimals": int(field["DECIMALS"]),
+            "inttype": field["INTTYPE"],
+            "datatype": field["DATATYPE"],
+        }
+        for field in response["DFIES_TAB"]
+    }
+
+    with _FIELD_INFO_CACHE_LOCK:
+        _FIELD_INFO_CACHE[key] = (now, fields)
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump({"fetched_at": now, "fields": fields}, f)
+
+    return fields
+
+
+def iter_row_windows(
+    source: Union["SAPRFC", "SAPRFCV2"], window_size: int, start_window: int = 0
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """Download the results of the query prepared with `source.query()` in windows
+    of `window_size` rows, using the `ROWSKIPS` and `ROWCOUNT` parameters.
+
+    The LIMIT and OFFSET of the query are respected. Iteration stops at the first
+    window returning fewer rows than requested.
+
+    Args:
+        source (Union[SAPRFC, SAPRFCV2]): The source with a prepared query.
+        window_size (int): The number of rows in a single window.
+        start_window (int, optional): The index of the window to start from. Defaults to 0.
+
+    Yields:
+        Tuple[int, pd.DataFrame]: The index of the window and its data, with
+        client-side filters applied. Windows without any rows are not yielded.
+    """
+    query = source._query
+    original_query = query.copy()
+    offset = query.get("ROWSKIPS", 0)
+    limit = query.get("ROWCOUNT")
+
+    window = start_window
+    try:
+        while True:
+            rowskips = offset + window * window_size
+            rowcount = window_size
+            if limit is not None:
+                rowcount = min(window_size, offset + limit - rowskips)
+                if rowcount <= 0:
+                    break
+
+            # `_download_df()` modifies the query (eg. the delimiter), so each
+            # window starts from the original one.
+            query.clear()
+            query.update(original_query, ROWSKIPS=rowskips, ROWCOUNT=rowcount)
+            logger.info(
+                f"Downloading window {window} (rows {rowskips}-{rowskips + rowcount})..."
+            )
+            df = source._download_df()
+            rows_downloaded = len(df)
+            if rows_downloaded == 0:
+                break
+
+            yield window, source._apply_client_side_filters(df)
+
+            if rows_downloaded < rowcount:
+                break
+            window += 1
+    finally:
+        query.clear()
+        query.update(original_query)
+
+
+def _window_to_batch(df: pd.DataFrame, schema: pa.Schema) -> pa.RecordBatch:
+    df = df.astype(object).where(df.notna(), None)
+    return pa.RecordBatch.from_pandas(df, schema=schema, preserve_index=False)
+
+
+def row_windows_to_reader(
+    source: Union["SAPRFC", "SAPRFCV2"],
+    window_size: int,
+    start_window: int = 0,
+    if_empty: str = "warn",
+) -> pa.RecordBatchReader:
+    """Stream the windows produced by `iter_row_windows()` as Arrow record batches.
+
+    Args:
+        source (Union[SAPRFC, SAPRFCV2]): The source with a prepared query.
+        window_size (int): The number of rows in a single window.
+        start_window (int, optional): The index of the window to start from. Defaults to 0.
+        if_empty (str, optional): What to do if the query returns no data. Defaults to "warn".
+
+    Returns:
+        pa.RecordBatchReader: A reader yielding one batch per window.
+    """
+    windows = iter_row_windows(source, window_size, start_window=start_window)
+    first_window = next(windows, None)
+    if first_window is None:
+        source.close_connection()
+        source._handle_if_empty(if_empty)
+        return pa.RecordBatchReader.from_batches(pa.schema([]), [])
+
+    _, first_df = first_window
+    schema = pa.schema([(col, pa.string()) for col in first_df.columns])
+
+    def _batches():
+        try:
+            for _, df in chain([first_window], windows):
+                yield _window_to_batch(df, schema)
+        finally:
+            source.close_connection()
+
+    return pa.RecordBatchReader.from_batches(schema, _batches())
+
+
+def write_row_windows_to_parquet(
+    source: Union["SAPRFC", "SAPRFCV2"],
+    path: str,
+    window_size: int,
+    resume: bool = False,
+    if_empty: str = "warn",
+) -> int:
+    """Write each window produced by `iter_row_windows()` to a separate file of
+    the Parquet dataset directory `path`, as soon as it's downloaded.
+
+    Files are named after the index of the window and only appear once fully
+    written, so after a failure, the download can be resumed from the first
+    window without a file. Once all windows are written, a `_SUCCESS` marker
+    file is created, and resuming a completed download doesn't download anything.
+
+    Args:
+        source (Union[SAPRFC, SAPRFCV2]): The source with a prepared query.
+        path (str): The path to the dataset directory.
+        window_size (int): The number of rows in a single window.
+        resume (bool, optional): Whether to skip windows already written by an
+            interrupted run. If False, existing files are removed. Defaults to False.
+        if_empty (str, optional): What to do if the query returns no data. Defaults to "warn".
+
+    Returns:
+        int: The number of windows written.
+    """
+
+    def _window_path(window: int) -> str:
+        return os.path.join(path, f"part-{window:06d}.parquet")
+
+    success_path = os.path.join(path, "_SUCCESS")
+
+    os.makedirs(path, exist_ok=True)
+    start_window = 0
+    if resume:
+        if os.path.isfile(success_path):
+            logger.warning(
+                f"The download into {path} has already completed, so there is nothing to resume. "
+                "Use `resume=False` to download the data again."
+            )
+            source.close_connection()
+            return 0
+        while os.path.isfile(_window_path(start_window)):
+            start_window += 1
+        if start_window > 0:
+            logger.info(f"Resuming the download from window {start_window}.")
+    else:
+        for file in glob.glob(os.path.join(path, "part-*.parquet")):
+            os.remove(file)
+        if os.path.isfile(success_path):
+            os.remove(success_path)
+
+    windows_written = 0
+    schema = None
+    try:
+        for window, df in iter_row_windows(
+            source, window_size, start_window=start_window
+        ):
+            if schema is None:
+                schema = pa.schema([(col, pa.string()) for col in df.columns])
+            table = pa.Table.from_batches([_window_to_batch(df, schema)])
+            tmp_path = _window_path(window) + ".tmp"
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, _window_path(window))
+            windows_written += 1
+    finally:
+        source.close_connection()
+
+    if windows_written == 0:
+        if start_window == 0:
+            source._handle_if_empty(if_empty)
+        else:
+            logger.warning(
+                f"Resumed the download from window {start_window}, but the query "
+                "returned no more rows."
+            )
+
+    open(success_path, "w").close()
+    return windows_written
+
+
 class SAPRFC(Source):
     """
     A class for querying SAP with SQL using the RFC protocol.
@@ -240,6 +675,9 @@ class SAPRFC(Source):
         credentials: dict = None,
         sap_credentials_key: str = "SAP",
         env: str = "DEV",
+        field_info_cache_ttl: int = 24 * 60 * 60,
+        field_info_cache_dir: str = None,
+        fixed_width: bool = False,
         *args,
         **kwargs,
     ):
@@ -256,6 +694,12 @@ class SAPRFC(Source):
             credentials (dict, optional): The credentials to use to authenticate with SAP. Defaults to None.
             sap_credentials_key (str, optional): The key for sap credentials located in the local config or Azure Key Vault. Defaults to "SAP".
             env (str, optional): The key for sap_credentials_key pointing to the SAP environment. Defaults to "DEV".
+            field_info_cache_ttl (int, optional): For how many seconds the metadata of table fields is cached.
+            Defaults to 24 hours.
+            field_info_cache_dir (str, optional): The directory in which to cache the metadata of table fields
+            between runs. Defaults to None (metadata is only cached in memory).
+            fixed_width (bool, optional): Whether to query SAP without a delimiter and split the records
+            by the field offsets returned by SAP, instead of trying `sep` or multiple separators. Defaults to False.
 
         Raises:
             CredentialError: If provided credentials are incorrect.
@@ -298,6 +742,10 @@ class SAPRFC(Source):
         self.client_side_filters = None
         self.func = func
         self.rfc_total_col_width_character_limit = rfc_total_col_width_character_limit
+        self.field_info_cache_ttl = field_info_cache_ttl
+        self.field_info_cache_dir = field_info_cache_dir
+        self.field_info = None
+        self.fixed_width = fixed_width
 
     @property
     def con(self) -> pyrfc.Connection:
@@ -541,6 +989,8 @@ class SAPRFC(Source):
         self.extract_values(sql)
 
         table_name = self._get_table_name(sql)
+        self._query_table_name = table_name
+        self.field_info = self.get_field_info(table_name)
         # this has to be called before checking client_side_filters
         where = self.where
         columns = self.select_columns
@@ -550,9 +1000,8 @@ class SAPRFC(Source):
         cols = []
         col_length_total = 0
         for col in columns:
-            info = self.call("DDIF_FIELDINFO_GET", TABNAME=table_name, FIELDNAME=col)
-            col_length = info["DFIES_TAB"][0]["LENG"]
-            col_length_total += int(col_length)
+            col_length = self._get_field_length(col)
+            col_length_total += col_length
             if col_length_total <= character_limit:
                 cols.append(col)
             else:
@@ -583,29 +1032,43 @@ class SAPRFC(Source):
         """Call a SAP RFC function"""
         return self.con.call(func, *args, **kwargs)
 
+    def get_field_info(self, table_name: str) -> Dict[str, Dict[str, Any]]:
+        """Get the (cached) metadata of all fields of a table.
+
+        Args:
+            table_name (str): The name of the table.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The metadata of each field, keyed by the field name.
+            See `get_field_info()` for details.
+        """
+        return get_field_info(
+            self.call,
+            system=get_system_id(self.credentials),
+            table_name=table_name,
+            ttl=self.field_info_cache_ttl,
+            cache_dir=self.field_info_cache_dir,
+        )
+
+    def _get_field_length(self, column: str) -> int:
+        """Get the length of a field of the queried table."""
+        field = self.field_info.get(column) or self.field_info.get(column.upper())
+        if field is None:
+            raise ValueError(
+                f"Field '{column}' not found in table {self._query_table_name}."
+            )
+        return field["length"]
+
     def _get_alias(self, column: str) -> str:
         return self.aliases_keyed_by_columns.get(column, column)
 
     def _get_client_side_filter_cols(self):
         return [f[1].split()[0] for f in self.client_side_filters.items()]
 
-    def to_df(self):
+    def _download_df(self) -> pd.DataFrame:
         """
-        Load the results of a query into a pandas DataFrame.
-
-        Due to SAP limitations, if the length of the WHERE clause is longer than 75
-        characters, we trim whe WHERE clause and perform the rest of the filtering
-        on the resulting DataFrame. Eg. if the WHERE clause contains 4 conditions
-        and has 80 characters, we only perform 3 filters in the query, and perform
-        the last filter on the DataFrame. If characters per row limit will be exceeded,
-        data will be downloaded in chunks.
-
-        Source: https://success.jitterbit.com/display/DOC/Guide+to+Using+RFC_READ_TABLE+to+Query+SAP+Tables#GuidetoUsingRFC_READ_TABLEtoQuerySAPTables-create-the-operation
-        - WHERE clause: 75 character limit
-        - SELECT: 512 character row limit
-
-        Returns:
-            pd.DataFrame: A DataFrame representing the result of the query provided in `PyRFC.query()`.
+        Download the results of a query into a pandas DataFrame, without applying
+        client-side filters or closing the connection.
         """
         params = self._query
         columns = self.select_columns_aliased
@@ -614,7 +1077,9 @@ class SAPRFC(Source):
         if len(fields_lists) > 1:
             logger.info(f"Data will be downloaded in {len(fields_lists)} chunks.")
         func = self.func
-        if sep is None:
+        if self.fixed_width:
+            SEPARATORS = [""]
+        elif sep is None:
             # automatically find a working separator
             SEPARATORS = [
                 "|",
@@ -635,10 +1100,12 @@ class SAPRFC(Source):
 
         records = None
         for sep in SEPARATORS:
-            logger.info(f"Checking if separator '{sep}' works.")
+            if not self.fixed_width:
+                logger.info(f"Checking if separator '{sep}' works.")
             df = pd.DataFrame()
             self._query["DELIMITER"] = sep
             chunk = 1
+            failed = False
             for fields in fields_lists:
                 logger.info(f"Downloading {chunk} data chunk...")
                 try:
@@ -652,19 +1119,31 @@ class SAPRFC(Source):
                             )
                         else:
                             raise e
-                    record_key = "WA"
-                    data_raw = response["DATA"]
-                    records = [row[record_key].split(sep) for row in data_raw]
-                    df[fields] = records
+                    if self.fixed_width:
+                        records = parse_fixed_width_records(
+                            response["DATA"], response["FIELDS"], fields
+                        )
+                    else:
+                        records = parse_records(response["DATA"], fields, sep)
+                    if not records.empty:
+                        df[fields] = records.to_numpy()
                     chunk += 1
                 except ValueError:
+                    # The separator doesn't work, so don't download the remaining
+                    # chunks with it.
                     df = pd.DataFrame()
-                    continue
-        if not records:
+                    failed = True
+                    break
+            if not failed:
+                break
+        if records is None or records.empty:
             logger.warning("Empty output was generated.")
             columns = []
         df.columns = columns
+        return df
 
+    def _apply_client_side_filters(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply the WHERE conditions trimmed from the query to the downloaded data."""
         if self.client_side_filters:
             filter_query = self._build_pandas_filter_query(self.client_side_filters)
             df.query(filter_query, inplace=True)
@@ -677,9 +1156,99 @@ class SAPRFC(Source):
                 if col not in self.select_columns_aliased
             ]
             df.drop(cols_to_drop, axis=1, inplace=True)
+        return df
+
+    def to_df(self, typed: bool = False):
+        """
+        Load the results of a query into a pandas DataFrame.
+
+        Due to SAP limitations, if the length of the WHERE clause is longer than 75
+        characters, we trim whe WHERE clause and perform the rest of the filtering
+        on the resulting DataFrame. Eg. if the WHERE clause contains 4 conditions
+        and has 80 characters, we only perform 3 filters in the query, and perform
+        the last filter on the DataFrame. If characters per row limit will be exceeded,
+        data will be downloaded in chunks.
+
+        Source: https://success.jitterbit.com/display/DOC/Guide+to+Using+RFC_READ_TABLE+to+Query+SAP+Tables#GuidetoUsingRFC_READ_TABLEtoQuerySAPTables-create-the-operation
+        - WHERE clause: 75 character limit
+        - SELECT: 512 character row limit
+
+        Args:
+            typed (bool, optional): Whether to cast numeric columns to their SAP types
+                instead of returning all columns as strings. Defaults to False.
+
+        Returns:
+            pd.DataFrame: A DataFrame representing the result of the query provided in `PyRFC.query()`.
+        """
+        df = self._download_df()
+        df = self._apply_client_side_filters(df)
         self.close_connection()
+        if typed:
+            df = cast_to_sap_types(
+                df,
+                self.field_info,
+                columns={self._get_alias(col): col for col in self.select_columns},
+            )
         return df
 
+    def to_arrow_batches(
+        self,
+        if_empty: str = "warn",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        start_window: int = 0,
+    ) -> pa.RecordBatchReader:
+        """
+        Stream the results of a query in windows of `batch_size` rows.
+
+        Each window is downloaded with a separate call using the `ROWSKIPS` and
+        `ROWCOUNT` parameters, so neither SAP nor the client need to hold the whole
+        result at once. Note that this relies on SAP returning the rows in the same
+        order in each call.
+
+        Args:
+            if_empty (str, optional): What to do if the query returns no data.
+                Defaults to "warn".
+            batch_size (int, optional): The number of rows in a single window.
+                Defaults to 100 000.
+            start_window (int, optional): The index of the window to start from.
+                Defaults to 0.
+
+        Returns:
+            pa.RecordBatchReader: A reader yielding one batch per window.
+        """
+        return row_windows_to_reader(
+            self, window_size=batch_size, start_window=start_window, if_empty=if_empty
+        )
+
+    def to_parquet_windows(
+        self,
+        path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        resume: bool = False,
+        if_empty: str = "warn",
+    ) -> int:
+        """
+        Download the results of a query in windows of `batch_size` rows, writing each
+        window into a separate file of the Parquet dataset directory `path` as soon as
+        it's downloaded.
+
+        Args:
+            path (str): The path to the dataset directory.
+            batch_size (int, optional): The number of rows in a single window.
+                Defaults to 100 000.
+            resume (bool, optional): Whether to resume from the window following the
+                last one written by a previous, interrupted run. A completed download
+                is not resumed. If False, existing files are removed. Defaults to False.
+            if_empty (str, optional): What to do if the query returns no data.
+                Defaults to "warn".
+
+        Returns:
+            int: The number of windows written in this run.
+        """
+        return write_row_windows_to_parquet(
+            self, path=path, window_size=batch_size, resume=resume, if_empty=if_empty
+        )
+
 
 class SAPRFCV2(Source):
     """
@@ -707,6 +1276,10 @@ class SAPRFCV2(Source):
         credentials: dict = None,
         sap_credentials_key: str = "SAP",
         env: str = "DEV",
+        field_info_cache_ttl: int = 24 * 60 * 60,
+        field_info_cache_dir: str = None,
+        fixed_width: bool = False,
+        max_workers: int = 1,
         *args,
         **kwargs,
     ):
@@ -726,6 +1299,14 @@ class SAPRFCV2(Source):
             credentials (dict, optional): The credentials to use to authenticate with SAP. Defaults to None.
             sap_credentials_key (str, optional): The key for sap credentials located in the local config or Azure Key Vault. Defaults to "SAP".
             env (str, optional): The key for sap_credentials_key pointing to the SAP environment. Defaults to "DEV".
+            field_info_cache_ttl (int, optional): For how many seconds the metadata of table fields is cached.
+            Defaults to 24 hours.
+            field_info_cache_dir (str, optional): The directory in which to cache the metadata of table fields
+            between runs. Defaults to None (metadata is only cached in memory).
+            fixed_width (bool, optional): Whether to query SAP without a delimiter and split the records
+            by the field offsets returned by SAP, instead of trying `sep` or multiple separators. Defaults to False.
+            max_workers (int, optional): The number of column chunks to download concurrently, each over
+            its own RFC connection. Defaults to 1.
 
         Raises:
             CredentialError: If provided credentials are incorrect.
@@ -766,6 +1347,11 @@ class SAPRFCV2(Source):
         self.client_side_filters = None
         self.func = func
         self.rfc_total_col_width_character_limit = rfc_total_col_width_character_limit
+        self.field_info_cache_ttl = field_info_cache_ttl
+        self.field_info_cache_dir = field_info_cache_dir
+        self.field_info = None
+        self.fixed_width = fixed_width
+        self.max_workers = max_workers
         # remove repeated reference columns
         if rfc_unique_id is not None:
             self.rfc_unique_id = list(set(rfc_unique_id))
@@ -790,6 +1376,45 @@ class SAPRFCV2(Source):
         self.con.close()
         self.logger.info("Connection has been closed successfully.")
 
+    @contextmanager
+    def _connection_pool(self, size: int) -> Iterator[queue.Queue]:
+        """Provide a pool of `size` RFC connections, including `self.con`.
+
+        pyRFC connections must not be shared between threads, so each concurrent
+        call takes a connection from the pool and returns it afterwards. The extra
+        connections are closed on exit.
+
+        Args:
+            size (int): The number of connections in the pool.
+        """
+        pool = queue.Queue()
+        pool.put(self.con)
+        extra_connections = [
+            pyrfc.Connection(**self.credentials) for _ in range(size - 1)
+        ]
+        for con in extra_connections:
+            pool.put(con)
+        try:
+            yield pool
+        finally:
+            for con in extra_connections:
+                con.close()
+
+    def _call_from_pool(self, pool: queue.Queue, params: Dict[str, Any]) -> dict:
+        """Call `self.func` using a connection taken from `pool`."""
+        con = pool.get()
+        try:
+            return con.call(self.func, **params)
+        except ABAPApplicationError as e:
+            if e.key == "DATA_BUFFER_EXCEEDED":
+                raise DataBufferExceeded(
+                    "Character limit per row exceeded. Please select fewer columns."
+                )
+            else:
+                raise e
+        finally:
+            pool.put(con)
+
     def get_function_parameters(
         self,
         function_name: str,
@@ -1014,6 +1639,8 @@ class SAPRFCV2(Source):
         self.extract_values(sql)
 
         table_name = self._get_table_name(sql)
+        self._query_table_name = table_name
+        self.field_info = self.get_field_info(table_name)
         # this has to be called before checking client_side_filters
         where = self.where
         columns = self.select_columns
@@ -1023,13 +1650,7 @@ class SAPRFCV2(Source):
         if isinstance(self.rfc_unique_id[0], str):
             character_limit = self.rfc_total_col_width_character_limit
             for ref_column in self.rfc_unique_id:
-                col_length_reference_column = int(
-                    self.call(
-                        "DDIF_FIELDINFO_GET",
-                        TABNAME=table_name,
-                        FIELDNAME=ref_column,
-                    )["DFIES_TAB"][0]["LENG"]
-                )
+                col_length_reference_column = self._get_field_length(ref_column)
                 if col_length_reference_column > int(
                     self.rfc_total_col_width_character_limit / 4
                 ):
@@ -1046,9 +1667,8 @@ class SAPRFCV2(Source):
             character_limit = self.rfc_total_col_width_character_limit
 
         for col in columns:
-            info = self.call("DDIF_FIELDINFO_GET", TABNAME=table_name, FIELDNAME=col)
-            col_length = info["DFIES_TAB"][0]["LENG"]
-            col_length_total += int(col_length)
+            col_length = self._get_field_length(col)
+            col_length_total += col_length
             if col_length_total <= character_limit:
                 cols.append(col)
             else:
@@ -1060,7 +1680,7 @@ class SAPRFCV2(Source):
                             cols.append(rfc_col)
                 lists_of_columns.append(cols)
                 cols = [col]
-                col_length_total = int(col_length)
+                col_length_total = col_length
         else:
             if isinstance(self.rfc_unique_id[0], str) and all(
                 [rfc_col not in cols for rfc_col in self.rfc_unique_id]
@@ -1092,29 +1712,43 @@ class SAPRFCV2(Source):
         """Call a SAP RFC function"""
         return self.con.call(func, *args, **kwargs)
 
+    def get_field_info(self, table_name: str) -> Dict[str, Dict[str, Any]]:
+        """Get the (cached) metadata of all fields of a table.
+
+        Args:
+            table_name (str): The name of the table.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The metadata of each field, keyed by the field name.
+            See `get_field_info()` for details.
+        """
+        return get_field_info(
+            self.call,
+            system=get_system_id(self.credentials),
+            table_name=table_name,
+            ttl=self.field_info_cache_ttl,
+            cache_dir=self.field_info_cache_dir,
+        )
+
+    def _get_field_length(self, column: str) -> int:
+        """Get the length of a field of the queried table."""
+        field = self.field_info.get(column) or self.field_info.get(column.upper())
+        if field is None:
+            raise ValueError(
+                f"Field '{column}' not found in table {self._query_table_name}."
+            )
+        return field["length"]
+
     def _get_alias(self, column: str) -> str:
         return self.aliases_keyed_by_columns.get(column, column)
 
     def _get_client_side_filter_cols(self):
         return [f[1].split()[0] for f in self.client_side_filters.items()]
 
-    def to_df(self):
+    def _download_df(self) -> pd.DataFrame:
         """
-        Load the results of a query into a pandas DataFrame.
-
-        Due to SAP limitations, if the length of the WHERE clause is longer than 75
-        characters, we trim whe WHERE clause and perform the rest of the filtering
-        on the resulting DataFrame. Eg. if the WHERE clause contains 4 conditions
-        and has 80 characters, we only perform 3 filters in the query, and perform
-        the last filter on the DataFrame. If characters per row limit will be exceeded,
-        data will be downloaded in chunks.
-
-        Source: https://success.jitterbit.com/display/DOC/Guide+to+Using+RFC_READ_TABLE+to+Query+SAP+Tables#GuidetoUsingRFC_READ_TABLEtoQuerySAPTables-create-the-operation
-        - WHERE clause: 75 character limit
-        - SELECT: 512 character row limit
-
-        Returns:
-            pd.DataFrame: A DataFrame representing the result of the query provided in `PyRFC.query()`.
+        Download the results of a query into a pandas DataFrame, without applying
+        client-side filters or closing the connection.
         """
         params = self._query
         columns = self.select_columns_aliased
@@ -1122,8 +1756,9 @@ class SAPRFCV2(Source):
         fields_lists = self._query.get("FIELDS")
         if len(fields_lists) > 1:
             logger.info(f"Data will be downloaded in {len(fields_lists)} chunks.")
-        func = self.func
-        if sep is None:
+        if self.fixed_width:
+            SEPARATORS = [""]
+        elif sep is None:
             # automatically find a working separator
             SEPARATORS = [
                 "|",
@@ -1142,60 +1777,84 @@ class SAPRFCV2(Source):
         else:
             SEPARATORS = [sep]
 
-        for sep in SEPARATORS:
-            logger.info(f"Checking if separator '{sep}' works.")
-            if isinstance(self.rfc_unique_id[0], str):
-                # columns only for the first chunk and we add the rest later to avoid name conflicts
-                df = pd.DataFrame(columns=fields_lists[0])
-            else:
+        record_key = "WA"
+        use_unique_id = isinstance(self.rfc_unique_id[0], str)
+        max_workers = max(1, min(self.max_workers, len(fields_lists)))
+        if max_workers > 1:
+            logger.info(f"Downloading up to {max_workers} chunks concurrently.")
+
+        with self._connection_pool(max_workers) as pool, ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            for sep in SEPARATORS:
+                if not self.fixed_width:
+                    logger.info(f"Checking if separator '{sep}' works.")
+                self._query["DELIMITER"] = sep
+                responses = executor.map(
+                    lambda fields: self._call_from_pool(
+                        pool, {**params, "FIELDS": fields, "DELIMITER": sep}
+                    ),
+                    fields_lists,
+                )
+
                 df = pd.DataFrame()
-            self._query["DELIMITER"] = sep
-            chunk = 1
-            row_index = 0
-            for fields in fields_lists:
-                logger.info(f"Downloading {chunk} data chunk...")
-                self._query["FIELDS"] = fields
-                try:
-                    response = self.call(func, **params)
-                except ABAPApplicationError as e:
-                    if e.key == "DATA_BUFFER_EXCEEDED":
-                        raise DataBufferExceeded(
-                            "Character limit per row exceeded. Please select fewer columns."
+                chunk_dfs = []
+                row_index = 0
+                failed = False
+                for chunk, (fields, response) in enumerate(
+                    zip(fields_lists, responses), start=1
+                ):
+                    logger.info(f"Downloaded {chunk} data chunk.")
+                    data_raw = np.array(response["DATA"])
+
+                    # if the reference columns are provided not necessary to remove any extra row.
+                    if not use_unique_id:
+                        row_index, data_raw, start = detect_extra_rows(
+                            row_index, data_raw, chunk, fields
                         )
                     else:
-                        raise e
-                record_key = "WA"
-                data_raw = np.array(response["DATA"])
-
-                # if the reference columns are provided not necessary to remove any extra row.
-                if not isinstance(self.rfc_unique_id[0], str):
-                    row_index, data_raw, start = detect_extra_rows(
-                        row_index, data_raw, chunk, fields
-                    )
-                else:
-                    start = False
+                        start = False
 
-                data_raw = catch_extra_separators(
-                    data_raw, record_key, sep, fields, self.replacement
-                )
+                    if self.fixed_width:
+                        records = parse_fixed_width_records(
+                            data_raw, response["FIELDS"], fields, record_key
+                        )
+                    else:
+                        data_raw = catch_extra_separators(
+                            data_raw, record_key, sep, fields, self.replacement
+                        )
+                        try:
+                            records = parse_records(data_raw, fields, sep, record_key)
+                        except ValueError:
+                            # The separator doesn't work, so don't download the
+                            # remaining chunks with it.
+                            if sep == SEPARATORS[-1]:
+                                raise
+                            failed = True
+                            break
+
+                    if use_unique_id:
+                        chunk_dfs.append(records)
+                    else:
+                        if not start:
+                            df[fields] = records.to_numpy()
+                        else:
+                            df[fields] = np.nan
 
-                records = np.array([row[record_key].split(sep) for row in data_raw])
+                if failed:
+                    # Cancel the requests for the chunks which haven't been sent yet.
+                    responses.close()
+                    continue
+                if use_unique_id:
+                    df = join_chunks(chunk_dfs, on=self.rfc_unique_id)
+                break
+            self._query["FIELDS"] = fields_lists
 
-                if (
-                    isinstance(self.rfc_unique_id[0], str)
-                    and not list(df.columns) == fields
-                ):
-                    df_tmp = pd.DataFrame(columns=fields)
-                    df_tmp[fields] = records
-                    df = pd.merge(df, df_tmp, on=self.rfc_unique_id, how="outer")
-                else:
-                    if not start:
-                        df[fields] = records
-                    else:
-                        df[fields] = np.nan
-                chunk += 1
         df.columns = columns
+        return df
 
+    def _apply_client_side_filters(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply the WHERE conditions trimmed from the query to the downloaded data."""
         if self.client_side_filters:
             filter_query = self._build_pandas_filter_query(self.client_side_filters)
             df.query(filter_query, inplace=True)
@@ -1208,5 +1867,95 @@ class SAPRFCV2(Source):
                 if col not in self.select_columns_aliased
             ]
             df.drop(cols_to_drop, axis=1, inplace=True)
+        return df
+
+    def to_df(self, typed: bool = False):
+        """
+        Load the results of a query into a pandas DataFrame.
+
+        Due to SAP limitations, if the length of the WHERE clause is longer than 75
+        characters, we trim whe WHERE clause and perform the rest of the filtering
+        on the resulting DataFrame. Eg. if the WHERE clause contains 4 conditions
+        and has 80 characters, we only perform 3 filters in the query, and perform
+        the last filter on the DataFrame. If characters per row limit will be exceeded,
+        data will be downloaded in chunks.
+
+        Source: https://success.jitterbit.com/display/DOC/Guide+to+Using+RFC_READ_TABLE+to+Query+SAP+Tables#GuidetoUsingRFC_READ_TABLEtoQuerySAPTables-create-the-operation
+        - WHERE clause: 75 character limit
+        - SELECT: 512 character row limit
+
+        Args:
+            typed (bool, optional): Whether to cast numeric columns to their SAP types
+                instead of returning all columns as strings. Defaults to False.
+
+        Returns:
+            pd.DataFrame: A DataFrame representing the result of the query provided in `PyRFC.query()`.
+        """
+        df = self._download_df()
+        df = self._apply_client_side_filters(df)
         self.close_connection()
+        if typed:
+            df = cast_to_sap_types(
+                df,
+                self.field_info,
+                columns={self._get_alias(col): col for col in self.select_columns},
+            )
         return df
+
+    def to_arrow_batches(
+        self,
+        if_empty: str = "warn",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        start_window: int = 0,
+    ) -> pa.RecordBatchReader:
+        """
+        Stream the results of a query in windows of `batch_size` rows.
+
+        Each window is downloaded with a separate call using the `ROWSKIPS` and
+        `ROWCOUNT` parameters, so neither SAP nor the client need to hold the whole
+        result at once. Note that this relies on SAP returning the rows in the same
+        order in each call.
+
+        Args:
+            if_empty (str, optional): What to do if the query returns no data.
+                Defaults to "warn".
+            batch_size (int, optional): The number of rows in a single window.
+                Defaults to 100 000.
+            start_window (int, optional): The index of the window to start from.
+                Defaults to 0.
+
+        Returns:
+            pa.RecordBatchReader: A reader yielding one batch per window.
+        """
+        return row_windows_to_reader(
+            self, window_size=batch_size, start_window=start_window, if_empty=if_empty
+        )
+
+    def to_parquet_windows(
+        self,
+        path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        resume: bool = False,
+        if_empty: str = "warn",
+    ) -> int:
+        """
+        Download the results of a query in windows of `batch_size` rows, writing each
+        window into a separate file of the Parquet dataset directory `path` as soon as
+        it's downloaded.
+
+        Args:
+            path (str): The path to the dataset directory.
+            batch_size (int, optional): The number of rows in a single window.
+                Defaults to 100 000.
+            resume (bool, optional): Whether to resume from the window following the
+                last one written by a previous, interrupted run. A completed download
+                is not resumed. If False, existing files are removed. Defaults to False.
+            if_empty (str, optional): What to do if the query returns no data.
+                Defaults to "warn".
+
+        Returns:
+            int: The number of windows written in this run.
+        """
+        return write_row_windows_to_parquet(
+            self, path=path, window_size=batch_size, resume=resume, if_empty=if_empty
+        )
@@ -9,6 +9,8 @@ class SQLite(SQL):
         db (str): the file path to the db e.g. /home/somedb.sqlite
     """
 
+    FAST_EXECUTEMANY = False
+
     def __init__(
         self,
         query_timeout: int = 60,
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Literal, Tuple
 
@@ -226,9 +227,10 @@ class VidClub(Source):
             ind = False
 
         if "data" in keys_list:
-            df = pd.json_normalize(response["data"])
-            df = pd.DataFrame(df)
-            length = df.shape[0]
+            records = self._page_records(response["data"])
+            # Further pages of products are transposed, so they are kept as data frames.
+            transposed_pages = []
+            length = len(records)
             page = 1
 
             while length == items_per_page:
@@ -242,17 +244,45 @@ class VidClub(Source):
                     url=url, headers=headers, method="GET", verify=False
                 )
                 response = r.json()
-                df_page = pd.json_normalize(response["data"])
-                df_page = pd.DataFrame(df_page)
                 if source == "product":
-                    df_page = df_page.transpose()
-                length = df_page.shape[0]
-                df = pd.concat((df, df_page), axis=0)
+                    df_page = pd.json_normalize(response["data"]).transpose()
+                    transposed_pages.append(df_page)
+                    length = df_page.shape[0]
+                else:
+                    page_records = self._page_records(response["data"])
+                    records.extend(page_records)
+                    length = len(page_records)
+
+            df = pd.json_normalize(records)
+            if transposed_pages:
+                df = pd.concat([df, *transposed_pages], axis=0)
         else:
             df = pd.DataFrame(response)
 
         return df
 
+    @staticmethod
+    def _page_records(data: Any) -> List[Dict[str, Any]]:
+        """Return the records of a page, treating a single object as one record."""
+        if isinstance(data, dict):
+            return [data]
+        return list(data)
+
+    @staticmethod
+    def _list_columns_to_tuples(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert lists into tuples, so that the data frame can be deduplicated. Only
+        the columns with the object data type are checked, up to the first list found.
+        """
+        for column in df.columns[df.dtypes == object]:
+            values = df[column].values
+            if any(isinstance(value, list) for value in values):
+                df[column] = [
+                    tuple(value) if isinstance(value, list) else value
+                    for value in values
+                ]
+        return df
+
     def total_load(
         self,
         source: Literal["jobs", "product", "company", "survey"] = None,
@@ -261,9 +291,10 @@ class VidClub(Source):
         items_per_page: int = 100,
         region: Literal["bg", "hu", "hr", "pl", "ro", "si", "all"] = None,
         days_interval: int = 30,
+        max_workers: int = 4,
     ) -> pd.DataFrame:
         """
-        Looping get_response and iterating by date ranges defined in intervals. Stores outputs as DataFrames in a list.
+        Calling get_response concurrently for date ranges defined in intervals. Stores outputs as DataFrames in a list.
         At the end, daframes are concatenated in one and dropped duplicates that would appear when quering.
 
         Args:
@@ -273,6 +304,7 @@ class VidClub(Source):
             items_per_page (int, optional): Number of entries per page. 100 entries by default.
             region (Literal["bg", "hu", "hr", "pl", "ro", "si", "all"], optional): Region filter for the query. Defaults to None (parameter is not used in url). [December 2023 status: value 'all' does not work for company and jobs]
             days_interval (int, optional): Days specified in date range per api call (test showed that 30-40 is optimal for performance). Defaults to 30.
+            max_workers (int, optional): The maximum number of date ranges downloaded concurrently. Defaults to 4.
 
         Returns:
             pd.DataFrame: Dataframe of the concatanated data carried in the responses.
@@ -282,22 +314,27 @@ class VidClub(Source):
             from_date=from_date, to_date=to_date, days_interval=days_interval
         )
 
-        dfs_list = []
         if len(starts) > 0 and len(ends) > 0:
-            for start, end in zip(starts, ends):
+
+            def _get_interval(dates: Tuple[str, str]) -> pd.DataFrame:
+                start, end = dates
                 logger.info(f"ingesting data for dates [{start}]-[{end}]...")
-                df = self.get_response(
+                return self.get_response(
                     source=source,
                     from_date=start,
                     to_date=end,
                     items_per_page=items_per_page,
                     region=region,
                 )
-                dfs_list.append(df)
-                if len(dfs_list) > 1:
-                    df = pd.concat(dfs_list, axis=0, ignore_index=True)
-                else:
-                    df = pd.DataFrame(dfs_list[0])
+
+            max_workers = max(1, min(max_workers, len(starts)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                dfs_list = list(executor.map(_get_interval, zip(starts, ends)))
+
+            if len(dfs_list) > 1:
+                df = pd.concat(dfs_list, axis=0, ignore_index=True)
+            else:
+                df = pd.DataFrame(dfs_list[0])
         else:
             df = self.get_response(
                 source=source,
@@ -306,11 +343,7 @@ class VidClub(Source):
                 items_per_page=items_per_page,
                 region=region,
             )
-        list_columns = df.columns[
-            df.applymap(lambda x: isinstance(x, list)).any()
-        ].tolist()
-        for i in list_columns:
-            df[i] = df[i].apply(lambda x: tuple(x) if isinstance(x, list) else x)
+        df = self._list_columns_to_tuples(df)
         df.drop_duplicates(inplace=True)
 
         if df.empty:
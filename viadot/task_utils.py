@@ -27,8 +27,10 @@ from visions.typesets.complete_set import CompleteSet
 
 from viadot.config import local_config
 from viadot.exceptions import CredentialError, ValidationError
-from viadot.tasks import AzureDataLakeUpload, AzureKeyVaultSecret
-
+from viadot.sources import AzureDataLake
+from viadot.tasks import AzureKeyVaultSecret
+from viadot.tasks.azure_data_lake import get_adls_credentials
+from viadot.utils import write_parquet
 
 logger = logging.get_logger()
 METADATA_COLUMNS = {"_viadot_downloaded_at_utc": "DATETIME"}
@@ -253,31 +255,25 @@ def df_to_parquet(
 ) -> None:
     """
     Task to create parquet file based on pandas DataFrame.
+    If `path` is a directory, it is treated as a Parquet dataset and appended data is
+    written into a new part file, which is the recommended way of appending. Otherwise,
+    the existing file is rewritten row group by row group, without loading it into
+    memory, so each append costs as much as copying the file.
     Args:
     df (pd.DataFrame): Input pandas DataFrame.
-    path (str): Path to output parquet file.
-    if_exists (Literal["append", "replace", "skip"], optional): What to do if the table exists. Defaults to "replace".
+    path (str): Path to output parquet file or dataset directory.
+    if_exists (Literal["append", "replace", "skip"], optional): What to do if the file exists. With "skip",
+        nothing is written if `path` exists. Defaults to "replace".
     """
-    if if_exists == "append" and os.path.isfile(path):
-        parquet_df = pd.read_parquet(path)
-        out_df = pd.concat([parquet_df, df])
-    elif if_exists == "replace":
-        out_df = df
-    elif if_exists == "skip":
+    if if_exists == "skip" and os.path.exists(path):
         logger.info("Skipped.")
         return
-    else:
-        out_df = df
 
-    # create directories if they don't exist
-    try:
-        if not os.path.isfile(path):
-            directory = os.path.dirname(path)
-            os.makedirs(directory, exist_ok=True)
-    except:
-        pass
+    if if_exists != "append":
+        if_exists = "replace"
 
-    out_df.to_parquet(path, index=False, **kwargs)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    write_parquet(table, path, if_exists=if_exists, **kwargs)
 
 
 @task(timeout=3600)
@@ -577,6 +573,7 @@ def adls_bulk_upload(
     adls_sp_credentials_secret: str = None,
     adls_overwrite: bool = True,
     timeout: int = 3600,
+    max_workers: int = 8,
 ) -> None:
     """Function that upload files to defined path in ADLS.
     Args:
@@ -586,19 +583,25 @@ def adls_bulk_upload(
         adls_sp_credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary with
             ACCOUNT_NAME and Service Principal credentials (TENANT_ID, CLIENT_ID, CLIENT_SECRET). Defaults to None.
         adls_overwrite (bool, optional): Whether to overwrite files in the data lake. Defaults to True.
-        timeout (int, optional): The amount of time (in seconds) to wait while running this task before
+        timeout (int, optional): The amount of time (in seconds) to wait for the upload of all files before
             a timeout occurs. Defaults to 3600.
+        max_workers (int, optional): The maximum number of files to upload concurrently. Defaults to 8.
     """
 
-    file_to_adls_task = AzureDataLakeUpload(timeout=timeout)
+    credentials = get_adls_credentials(sp_credentials_secret=adls_sp_credentials_secret)
+    lake = AzureDataLake(credentials=credentials)
 
-    for file in file_names:
-        file_to_adls_task.run(
-            from_path=os.path.join(file_name_relative_path, file),
-            to_path=os.path.join(adls_file_path, file),
-            sp_credentials_secret=adls_sp_credentials_secret,
-            overwrite=adls_overwrite,
+    paths = [
+        (
+            os.path.join(file_name_relative_path, file),
+            os.path.join(adls_file_path, file),
         )
+        for file in file_names
+    ]
+    logger.info(f"Uploading {len(paths)} file(s) to {adls_file_path}...")
+    lake.bulk_upload(
+        paths, overwrite=adls_overwrite, max_workers=max_workers, timeout=timeout
+    )
 
 
 @task(timeout=3600)
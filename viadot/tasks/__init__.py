@@ -18,6 +18,7 @@ from .azure_sql import (
     AzureSQLCreateTable,
     AzureSQLDBQuery,
     AzureSQLToDF,
+    AzureSQLToParquetFile,
     AzureSQLUpsert,
     CheckColumnOrder,
     CreateTableFromBlob,
@@ -48,7 +49,7 @@ except ImportError:
 from .business_core import BusinessCoreToParquet
 from .customer_gauge import CustomerGaugeToDF
 from .duckdb import DuckDBCreateTableFromParquet, DuckDBQuery, DuckDBToDF
-from .epicor import EpicorOrdersToDF
+from .epicor import EpicorOrdersToDF, EpicorOrdersToParquetFile
 from .eurostat import EurostatToDF
 from .git import CloneRepo
 from .hubspot import HubspotToDF
@@ -56,6 +57,11 @@ from .luma import LumaIngest
 from .mediatool import MediatoolToDF
 from .mindful import MindfulToCSV
 from .sftp import SftpList, SftpToDF
-from .sql_server import SQLServerCreateTable, SQLServerQuery, SQLServerToDF
+from .sql_server import (
+    SQLServerCreateTable,
+    SQLServerQuery,
+    SQLServerToDF,
+    SQLServerToParquetFile,
+)
 from .tm1 import TM1ToDF
 from .vid_club import VidClubToDF
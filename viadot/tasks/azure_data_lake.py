@@ -1,7 +1,7 @@
 import json
 import os
 from datetime import timedelta
-from typing import List
+from typing import Any, Dict, List
 
 import numpy as np
 import pandas as pd
@@ -13,6 +13,44 @@ from ..sources import AzureDataLake
 from .azure_key_vault import AzureKeyVaultSecret
 
 
+def get_adls_credentials(
+    sp_credentials_secret: str = None, vault_name: str = None
+) -> Dict[str, Any]:
+    """Get the credentials of the service principal used to access Azure Data Lake.
+
+    Args:
+        sp_credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary with
+            ACCOUNT_NAME and Service Principal credentials (TENANT_ID, CLIENT_ID, CLIENT_SECRET). Defaults to None
+            (the `AZURE_DEFAULT_ADLS_SERVICE_PRINCIPAL_SECRET` Prefect secret, or environment variables if it's not set).
+        vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: The credentials to pass to `AzureDataLake`.
+    """
+    if not sp_credentials_secret:
+        # attempt to read a default for the service principal secret name
+        try:
+            sp_credentials_secret = PrefectSecret(
+                "AZURE_DEFAULT_ADLS_SERVICE_PRINCIPAL_SECRET"
+            ).run()
+        except ValueError:
+            pass
+
+    if sp_credentials_secret:
+        azure_secret_task = AzureKeyVaultSecret()
+        credentials_str = azure_secret_task.run(
+            secret=sp_credentials_secret, vault_name=vault_name
+        )
+        return json.loads(credentials_str)
+
+    return {
+        "ACCOUNT_NAME": os.environ["AZURE_ACCOUNT_NAME"],
+        "AZURE_TENANT_ID": os.environ["AZURE_TENANT_ID"],
+        "AZURE_CLIENT_ID": os.environ["AZURE_CLIENT_ID"],
+        "AZURE_CLIENT_SECRET": os.environ["AZURE_CLIENT_SECRET"],
+    }
+
+
 class AzureDataLakeDownload(Task):
     """
     Task for downloading data from the Azure Data lakes (gen1 and gen2).
@@ -95,28 +133,9 @@ class AzureDataLakeDownload(Task):
         file_name = from_path.split("/")[-1]
         to_path = to_path or file_name
 
-        if not sp_credentials_secret:
-            # attempt to read a default for the service principal secret name
-            try:
-                sp_credentials_secret = PrefectSecret(
-                    "AZURE_DEFAULT_ADLS_SERVICE_PRINCIPAL_SECRET"
-                ).run()
-            except ValueError:
-                pass
-
-        if sp_credentials_secret:
-            azure_secret_task = AzureKeyVaultSecret()
-            credentials_str = azure_secret_task.run(
-                secret=sp_credentials_secret, vault_name=vault_name
-            )
-            credentials = json.loads(credentials_str)
-        else:
-            credentials = {
-                "ACCOUNT_NAME": os.environ["AZURE_ACCOUNT_NAME"],
-                "AZURE_TENANT_ID": os.environ["AZURE_TENANT_ID"],
-                "AZURE_CLIENT_ID": os.environ["AZURE_CLIENT_ID"],
-                "AZURE_CLIENT_SECRET": os.environ["AZURE_CLIENT_SECRET"],
-            }
+        credentials = get_adls_credentials(
+            sp_credentials_secret=sp_credentials_secret, vault_name=vault_name
+        )
         lake = AzureDataLake(gen=gen, credentials=credentials)
 
         full_dl_path = os.path.join(credentials["ACCOUNT_NAME"], from_path)
@@ -208,28 +227,9 @@ class AzureDataLakeUpload(Task):
             vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
         """
 
-        if not sp_credentials_secret:
-            # attempt to read a default for the service principal secret name
-            try:
-                sp_credentials_secret = PrefectSecret(
-                    "AZURE_DEFAULT_ADLS_SERVICE_PRINCIPAL_SECRET"
-                ).run()
-            except ValueError:
-                pass
-
-        if sp_credentials_secret:
-            azure_secret_task = AzureKeyVaultSecret()
-            credentials_str = azure_secret_task.run(
-                secret=sp_credentials_secret, vault_name=vault_name
-            )
-            credentials = json.loads(credentials_str)
-        else:
-            credentials = {
-                "ACCOUNT_NAME": os.environ["AZURE_ACCOUNT_NAME"],
-                "AZURE_TENANT_ID": os.environ["AZURE_TENANT_ID"],
-                "AZURE_CLIENT_ID": os.environ["AZURE_CLIENT_ID"],
-                "AZURE_CLIENT_SECRET": os.environ["AZURE_CLIENT_SECRET"],
-            }
+        credentials = get_adls_credentials(
+            sp_credentials_secret=sp_credentials_secret, vault_name=vault_name
+        )
         lake = AzureDataLake(gen=gen, credentials=credentials)
 
         full_to_path = os.path.join(credentials["ACCOUNT_NAME"], to_path)
@@ -338,28 +338,9 @@ class AzureDataLakeToDF(Task):
         if path is None:
             raise ValueError("Please provide the path to the file to be downloaded.")
 
-        if not sp_credentials_secret:
-            # attempt to read a default for the service principal secret name
-            try:
-                sp_credentials_secret = PrefectSecret(
-                    "AZURE_DEFAULT_ADLS_SERVICE_PRINCIPAL_SECRET"
-                ).run()
-            except ValueError:
-                pass
-
-        if sp_credentials_secret:
-            azure_secret_task = AzureKeyVaultSecret()
-            credentials_str = azure_secret_task.run(
-                secret=sp_credentials_secret, vault_name=vault_name
-            )
-            credentials = json.loads(credentials_str)
-        else:
-            credentials = {
-                "ACCOUNT_NAME": os.environ["AZURE_ACCOUNT_NAME"],
-                "AZURE_TENANT_ID": os.environ["AZURE_TENANT_ID"],
-                "AZURE_CLIENT_ID": os.environ["AZURE_CLIENT_ID"],
-                "AZURE_CLIENT_SECRET": os.environ["AZURE_CLIENT_SECRET"],
-            }
+        credentials = get_adls_credentials(
+            sp_credentials_secret=sp_credentials_secret, vault_name=vault_name
+        )
         lake = AzureDataLake(gen=gen, credentials=credentials, path=path)
 
         full_dl_path = os.path.join(credentials["ACCOUNT_NAME"], path)
@@ -456,28 +437,9 @@ class AzureDataLakeCopy(Task):
         file_name = from_path.split("/")[-1]
         to_path = to_path or file_name
 
-        if not sp_credentials_secret:
-            # attempt to read a default for the service principal secret name
-            try:
-                sp_credentials_secret = PrefectSecret(
-                    "AZURE_DEFAULT_ADLS_SERVICE_PRINCIPAL_SECRET"
-                ).run()
-            except ValueError:
-                pass
-
-        if sp_credentials_secret:
-            azure_secret_task = AzureKeyVaultSecret()
-            credentials_str = azure_secret_task.run(
-                secret=sp_credentials_secret, vault_name=vault_name
-            )
-            credentials = json.loads(credentials_str)
-        else:
-            credentials = {
-                "ACCOUNT_NAME": os.environ["AZURE_ACCOUNT_NAME"],
-                "AZURE_TENANT_ID": os.environ["AZURE_TENANT_ID"],
-                "AZURE_CLIENT_ID": os.environ["AZURE_CLIENT_ID"],
-                "AZURE_CLIENT_SECRET": os.environ["AZURE_CLIENT_SECRET"],
-            }
+        credentials = get_adls_credentials(
+            sp_credentials_secret=sp_credentials_secret, vault_name=vault_name
+        )
         lake = AzureDataLake(gen=gen, credentials=credentials)
 
         full_dl_path = os.path.join(credentials["ACCOUNT_NAME"], from_path)
@@ -566,28 +528,9 @@ class AzureDataLakeList(Task):
             will be shown as "raw/supermetrics/test_file.txt".
         """
 
-        if not sp_credentials_secret:
-            # attempt to read a default for the service principal secret name
-            try:
-                sp_credentials_secret = PrefectSecret(
-                    "AZURE_DEFAULT_ADLS_SERVICE_PRINCIPAL_SECRET"
-                ).run()
-            except ValueError:
-                pass
-
-        if sp_credentials_secret:
-            azure_secret_task = AzureKeyVaultSecret()
-            credentials_str = azure_secret_task.run(
-                secret=sp_credentials_secret, vault_name=vault_name
-            )
-            credentials = json.loads(credentials_str)
-        else:
-            credentials = {
-                "ACCOUNT_NAME": os.environ["AZURE_ACCOUNT_NAME"],
-                "AZURE_TENANT_ID": os.environ["AZURE_TENANT_ID"],
-                "AZURE_CLIENT_ID": os.environ["AZURE_CLIENT_ID"],
-                "AZURE_CLIENT_SECRET": os.environ["AZURE_CLIENT_SECRET"],
-            }
+        credentials = get_adls_credentials(
+            sp_credentials_secret=sp_credentials_secret, vault_name=vault_name
+        )
         lake = AzureDataLake(gen=gen, credentials=credentials)
 
         full_dl_path = os.path.join(credentials["ACCOUNT_NAME"], path)
@@ -683,28 +626,9 @@ class AzureDataLakeRemove(Task):
             vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
         """
 
-        if not sp_credentials_secret:
-            # attempt to read a default for the service principal secret name
-            try:
-                sp_credentials_secret = PrefectSecret(
-                    "AZURE_DEFAULT_ADLS_SERVICE_PRINCIPAL_SECRET"
-                ).run()
-            except ValueError:
-                pass
-
-        if sp_credentials_secret:
-            azure_secret_task = AzureKeyVaultSecret()
-            credentials_str = azure_secret_task.run(
-                secret=sp_credentials_secret, vault_name=vault_name
-            )
-            credentials = json.loads(credentials_str)
-        else:
-            credentials = {
-                "ACCOUNT_NAME": os.environ["AZURE_ACCOUNT_NAME"],
-                "AZURE_TENANT_ID": os.environ["AZURE_TENANT_ID"],
-                "AZURE_CLIENT_ID": os.environ["AZURE_CLIENT_ID"],
-                "AZURE_CLIENT_SECRET": os.environ["AZURE_CLIENT_SECRET"],
-            }
+        credentials = get_adls_credentials(
+            sp_credentials_secret=sp_credentials_secret, vault_name=vault_name
+        )
         lake = AzureDataLake(gen=gen, credentials=credentials)
         full_path = os.path.join(credentials["ACCOUNT_NAME"], path)
 
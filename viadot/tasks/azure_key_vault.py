@@ -1,5 +1,10 @@
+import hashlib
+import json
 import os
+import threading
+import time
 from datetime import timedelta
+from typing import Callable, Dict, Optional, Tuple
 
 import pendulum
 from azure.identity import EnvironmentCredential
@@ -9,6 +14,138 @@ from prefect.tasks.secrets.base import SecretBase
 from prefect.utilities.tasks import defaults_from_attrs
 
 
+class SecretCache:
+    """
+    A thread-safe, in-memory cache of Azure Key Vault secrets, keyed by vault and secret name.
+
+    Optionally, secrets can also be spilled to disk, encrypted with a Fernet key, so that they
+    can be shared between processes (eg. Prefect tasks running in separate processes).
+
+    Args:
+        - ttl (int, optional): for how many seconds a cached secret is valid. Defaults to 3600.
+        - cache_dir (str, optional): the directory in which to spill the encrypted secrets.
+            Requires `encryption_key`. Defaults to None (no on-disk cache).
+        - encryption_key (str, optional): the Fernet key used to encrypt the secrets on disk.
+            Defaults to None.
+    """
+
+    def __init__(
+        self, ttl: int = 3600, cache_dir: str = None, encryption_key: str = None
+    ):
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.encryption_key = encryption_key
+        self.hits = 0
+        self.misses = 0
+        self._secrets: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+    @property
+    def _fernet(self):
+        if not (self.cache_dir and self.encryption_key):
+            return None
+        from cryptography.fernet import Fernet
+
+        return Fernet(self.encryption_key)
+
+    def _spill_path(self, vault_name: str, secret: str) -> str:
+        file_name = hashlib.sha256(f"{vault_name}/{secret}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, file_name)
+
+    def get(self, vault_name: str, secret: str) -> Optional[str]:
+        """Get a secret from the cache, or None if it's not cached or has expired."""
+        key = (vault_name, secret)
+        with self._lock:
+            cached = self._secrets.get(key)
+            if cached and time.time() - cached[0] < self.ttl:
+                self.hits += 1
+                return cached[1]
+
+        value = self._read_spilled(vault_name, secret)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._secrets[key] = (time.time(), value)
+        return value
+
+    def set(self, vault_name: str, secret: str, value: str) -> None:
+        """Store a secret in the cache."""
+        with self._lock:
+            self._secrets[(vault_name, secret)] = (time.time(), value)
+
+        fernet = self._fernet
+        if fernet is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._spill_path(vault_name, secret), "wb") as f:
+                f.write(fernet.encrypt(value.encode()))
+
+    def _read_spilled(self, vault_name: str, secret: str) -> Optional[str]:
+        fernet = self._fernet
+        if fernet is None:
+            return None
+        path = self._spill_path(vault_name, secret)
+        if not os.path.isfile(path):
+            return None
+
+        from cryptography.fernet import InvalidToken
+
+        with open(path, "rb") as f:
+            token = f.read()
+        try:
+            return fernet.decrypt(token, ttl=self.ttl).decode()
+        except InvalidToken:
+            # expired or encrypted with a different key
+            return None
+
+    def get_or_fetch(
+        self, vault_name: str, secret: str, fetch: Callable[[], str]
+    ) -> str:
+        """
+        Get a secret from the cache, fetching and caching it if it's not there.
+
+        Concurrent requests for the same secret wait for a single fetch.
+        """
+        key = (vault_name, secret)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.get(vault_name, secret)
+            if value is None:
+                value = fetch()
+                self.set(vault_name, secret, value)
+        return value
+
+    def invalidate(self, vault_name: str, secret: str) -> None:
+        """Remove a secret from the cache."""
+        with self._lock:
+            self._secrets.pop((vault_name, secret), None)
+        if self.cache_dir:
+            path = self._spill_path(vault_name, secret)
+            if os.path.isfile(path):
+                os.remove(path)
+
+    def clear(self) -> None:
+        """Remove all secrets from the in-memory cache and reset the counters."""
+        with self._lock:
+            self._secrets.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# shared by all tasks resolving secrets in the process
+secret_cache = SecretCache(
+    ttl=int(os.environ.get("VIADOT_SECRET_CACHE_TTL", 3600)),
+    cache_dir=os.environ.get("VIADOT_SECRET_CACHE_DIR"),
+    encryption_key=os.environ.get("VIADOT_SECRET_CACHE_KEY"),
+)
+
+_secret_clients: Dict[tuple, SecretClient] = {}
+_secret_clients_lock = threading.Lock()
+
+
 def get_key_vault(
     credentials: str, secret_client_kwargs: dict, vault_name: str = None
 ) -> SecretClient:
@@ -43,11 +180,24 @@ def get_key_vault(
         except ValueError as e:
             # go to step 3 (attempt to read from env)
             pass
-    credentials = EnvironmentCredential(additionally_allowed_tenants=["*"])
     vault_url = f"https://{vault_name}.vault.azure.net"
-    key_vault = SecretClient(
-        vault_url=vault_url, credential=credentials, **secret_client_kwargs
+
+    # reuse clients (and the access tokens cached by their credentials) between calls
+    client_key = (
+        vault_url,
+        os.environ.get("AZURE_TENANT_ID"),
+        os.environ.get("AZURE_CLIENT_ID"),
+        os.environ.get("AZURE_CLIENT_SECRET"),
+        json.dumps(secret_client_kwargs, sort_keys=True, default=str),
     )
+    with _secret_clients_lock:
+        key_vault = _secret_clients.get(client_key)
+        if key_vault is None:
+            credentials = EnvironmentCredential(additionally_allowed_tenants=["*"])
+            key_vault = SecretClient(
+                vault_url=vault_url, credential=credentials, **secret_client_kwargs
+            )
+            _secret_clients[client_key] = key_vault
     return key_vault
 
 
@@ -66,6 +216,8 @@ class AzureKeyVaultSecret(SecretBase):
         - secret (str, optional): the name of the secret to retrieve
         - vault_name (str): the name of the vault from which to fetch the secret
         - secret_client_kwargs (dict, optional): additional keyword arguments to forward to the SecretClient.
+        - use_cache (bool, optional): whether to use the process-wide secret cache (`secret_cache`).
+            Defaults to True.
         - **kwargs (dict, optional): additional keyword arguments to pass to the Task constructor
     """
 
@@ -74,12 +226,14 @@ class AzureKeyVaultSecret(SecretBase):
         secret: str = None,
         vault_name: str = None,
         secret_client_kwargs: dict = None,
+        use_cache: bool = True,
         max_retries: int = 3,
         retry_delay: timedelta = timedelta(seconds=10),
         **kwargs,
     ):
         self.secret = secret
         self.vault_name = vault_name
+        self.use_cache = use_cache
 
         if secret_client_kwargs is None:
             self.secret_client_kwargs = {}
@@ -131,13 +285,21 @@ class AzureKeyVaultSecret(SecretBase):
         if secret is None:
             raise ValueError("A secret name must be provided.")
 
-        key_vault = get_key_vault(
-            vault_name=vault_name,
-            credentials=credentials,
-            secret_client_kwargs=self.secret_client_kwargs,
-        )
+        if not vault_name:
+            vault_name = PrefectSecret("AZURE_DEFAULT_KEYVAULT").run()
+
+        def fetch_secret() -> str:
+            key_vault = get_key_vault(
+                vault_name=vault_name,
+                credentials=credentials,
+                secret_client_kwargs=self.secret_client_kwargs,
+            )
+            return key_vault.get_secret(secret).value
 
-        secret_string = key_vault.get_secret(secret).value
+        if not self.use_cache:
+            return fetch_secret()
+
+        secret_string = secret_cache.get_or_fetch(vault_name, secret, fetch_secret)
 
         return secret_string
 
@@ -236,6 +398,9 @@ class CreateAzureKeyVaultSecret(SecretBase):
         if secret is None:
             raise ValueError("A secret name must be provided.")
 
+        if not vault_name:
+            vault_name = PrefectSecret("AZURE_DEFAULT_KEYVAULT").run()
+
         key_vault = get_key_vault(
             vault_name=vault_name,
             credentials=credentials,
@@ -245,6 +410,7 @@ class CreateAzureKeyVaultSecret(SecretBase):
         expires_on = pendulum.now("UTC").add(days=lifetime)
         secret_obj = key_vault.set_secret(secret, value, expires_on=expires_on)
         was_successful = secret_obj.name == secret
+        secret_cache.invalidate(vault_name, secret)
 
         return was_successful
 
@@ -329,6 +495,9 @@ class DeleteAzureKeyVaultSecret(SecretBase):
         if secret is None:
             raise ValueError("A secret name must be provided.")
 
+        if not vault_name:
+            vault_name = PrefectSecret("AZURE_DEFAULT_KEYVAULT").run()
+
         key_vault = get_key_vault(
             vault_name=vault_name,
             credentials=credentials,
@@ -338,5 +507,6 @@ class DeleteAzureKeyVaultSecret(SecretBase):
         poller = key_vault.begin_delete_secret(secret)
         poller.wait(timeout=60 * 5)
         was_successful = poller.status() == "finished"
+        secret_cache.invalidate(vault_name, secret)
 
         return was_successful
@@ -12,7 +12,6 @@ from ..exceptions import ValidationError
 from ..sources import AzureSQL
 from ..utils import (
     build_merge_query,
-    gen_bulk_insert_query_from_df,
     get_sql_server_table_dtypes,
 )
 from .azure_key_vault import AzureKeyVaultSecret
@@ -347,6 +346,78 @@ class AzureSQLToDF(Task):
         return df
 
 
+class AzureSQLToParquetFile(Task):
+    """
+    Task for streaming the result of an Azure SQL Database query into a Parquet file.
+    Unlike `AzureSQLToDF`, the result is never loaded into memory as a whole.
+
+    Args:
+        credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary
+        with SQL db credentials (server, db_name, user, and password).
+        vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
+        if_exists (Literal, optional): What to do if the file already exists. Defaults to "replace".
+        batch_size (int, optional): The number of rows fetched and written at once. Defaults to None
+            (the `arraysize` of the source).
+        timeout(int, optional): The amount of time (in seconds) to wait while running this task before
+            a timeout occurs. Defaults to 3600.
+    """
+
+    def __init__(
+        self,
+        credentials_secret: str = None,
+        vault_name: str = None,
+        if_exists: Literal["append", "replace", "skip"] = "replace",
+        batch_size: int = None,
+        timeout: int = 3600,
+        *args,
+        **kwargs,
+    ):
+        self.credentials_secret = credentials_secret
+        self.vault_name = vault_name
+        self.if_exists = if_exists
+        self.batch_size = batch_size
+
+        super().__init__(
+            name="azure_sql_to_parquet_file", timeout=timeout, *args, **kwargs
+        )
+
+    @defaults_from_attrs("credentials_secret", "vault_name", "if_exists", "batch_size")
+    def run(
+        self,
+        query: str,
+        path: str,
+        credentials_secret: str = None,
+        vault_name: str = None,
+        if_exists: Literal["append", "replace", "skip"] = None,
+        batch_size: int = None,
+    ) -> str:
+        """Stream the result of an Azure SQL Database query into a Parquet file.
+
+        Args:
+            query (str, required): The query to execute on the database.
+            path (str, required): The path to the Parquet file or dataset directory.
+            credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary
+            with SQL db credentials (server, db_name, user, and password).
+            vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
+            if_exists (Literal, optional): What to do if the file already exists. Defaults to None.
+            batch_size (int, optional): The number of rows fetched and written at once. Defaults to None.
+
+        Returns:
+            str: The path to the Parquet file.
+        """
+
+        credentials = get_credentials(credentials_secret, vault_name=vault_name)
+        azure_sql = AzureSQL(credentials=credentials)
+
+        written = azure_sql.to_parquet(
+            path=path, query=query, if_exists=if_exists, batch_size=batch_size
+        )
+
+        if written:
+            self.logger.info(f"Successfully wrote the query result to {path}.")
+        return path
+
+
 class CheckColumnOrder(Task):
     """
     Task for checking the order of columns in the loaded DF and in the SQL table into which the data from DF will be loaded.
@@ -524,8 +595,7 @@ class AzureSQLUpsert(Task):
 
         # Insert data into the temp table
         stg_table_fqn = f"{schema}.{stg_table}"
-        insert_query = gen_bulk_insert_query_from_df(df, table_fqn=stg_table_fqn)
-        inserted = azure_sql.run(insert_query)
+        azure_sql.insert_into(table=stg_table_fqn, df=df)
 
         # Upsert into prod table
         merge_query = build_merge_query(
@@ -21,6 +21,7 @@ class C4CReportToDF(Task):
         skip: int = 0,
         top: int = 1000,
         env: str = "QA",
+        max_workers: int = 1,
         max_retries: int = 3,
         retry_delay: timedelta = timedelta(seconds=10),
         timeout: int = 3600,
@@ -30,6 +31,7 @@ class C4CReportToDF(Task):
         self.env = env
         self.skip = skip
         self.top = top
+        self.max_workers = max_workers
 
         super().__init__(
             name="c4c_report_to_df",
@@ -49,6 +51,7 @@ class C4CReportToDF(Task):
         "env",
         "skip",
         "top",
+        "max_workers",
     )
     def run(
         self,
@@ -56,6 +59,7 @@ class C4CReportToDF(Task):
         env: str = "QA",
         skip: int = 0,
         top: int = 1000,
+        max_workers: int = 1,
         credentials_secret: str = None,
         vault_name: str = None,
         max_retries: int = 3,
@@ -69,6 +73,8 @@ class C4CReportToDF(Task):
             env (str, optional): The environment to use. Defaults to 'QA'.
             skip (int, optional): Initial index value of reading row. Defaults to 0.
             top (int, optional): The value of top reading row. Defaults to 1000.
+            max_workers (int, optional): How many pages of `top` rows to download at the same time. If greater
+            than 1, the whole report is downloaded at once and `skip` is ignored. Defaults to 1.
             credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary
             with C4C credentials (username & password). Defaults to None.
             vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
@@ -91,6 +97,15 @@ class C4CReportToDF(Task):
         else:
             credentials = local_config.get("CLOUD_FOR_CUSTOMERS")[env]
 
+        if max_workers > 1:
+            return CloudForCustomers(
+                report_url=report_url,
+                env=env,
+                credentials=credentials,
+                max_workers=max_workers,
+                page_size=top,
+            ).to_df()
+
         final_df = pd.DataFrame()
         next_batch = True
         while next_batch:
@@ -121,6 +136,7 @@ class C4CToDF(Task):
         chunksize: int = 20000,
         env: str = "QA",
         if_empty: str = "warn",
+        max_workers: int = 1,
         max_retries: int = 3,
         retry_delay: timedelta = timedelta(seconds=10),
         timeout: int = 3600,
@@ -133,6 +149,7 @@ class C4CToDF(Task):
         self.chunksize = chunksize
         self.env = env
         self.if_empty = if_empty
+        self.max_workers = max_workers
 
         super().__init__(
             name="c4c_to_df",
@@ -144,7 +161,14 @@ class C4CToDF(Task):
         )
 
     @defaults_from_attrs(
-        "url", "endpoint", "fields", "params", "chunksize", "env", "if_empty"
+        "url",
+        "endpoint",
+        "fields",
+        "params",
+        "chunksize",
+        "env",
+        "if_empty",
+        "max_workers",
     )
     def run(
         self,
@@ -155,6 +179,7 @@ class C4CToDF(Task):
         params: Dict[str, str] = None,
         chunksize: int = None,
         if_empty: str = "warn",
+        max_workers: int = 1,
         credentials_secret: str = None,
         vault_name: str = None,
     ):
@@ -176,6 +201,7 @@ class C4CToDF(Task):
             params (Dict[str, str]): Query parameters. Defaults to None.
             chunksize (int, optional): How many rows to retrieve from C4C at a time. Uses a server-side cursor. Defaults to None.
             if_empty (str, optional): What to do if query returns no data. Defaults to "warn".
+            max_workers (int, optional): How many chunks to download at the same time. Defaults to 1.
             credentials_secret (str, optional): The name of the Azure Key Vault secret containing a dictionary
             with C4C credentials. Defaults to None.
             vault_name (str, optional): The name of the vault from which to obtain the secret. Defaults to None.
@@ -209,6 +235,21 @@ class C4CToDF(Task):
                 credentials=credentials,
             ).to_df(if_empty=if_empty, fields=fields)
 
+        if max_workers > 1:
+            df = CloudForCustomers(
+                url=url,
+                endpoint=endpoint,
+                params=params,
+                env=env,
+                credentials=credentials,
+                max_workers=max_workers,
+                page_size=chunksize,
+            ).to_df(if_empty=if_empty, fields=fields)
+            self.logger.info(
+                f"Data from {url+endpoint} has been downloaded successfully."
+            )
+            return df
+
         def _generate_chunks() -> Generator[pd.DataFrame, None, None]:
             """
             Util function returning chunks.
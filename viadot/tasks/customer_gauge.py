@@ -1,6 +1,7 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, Iterator, List, Literal, Union
 
 import pandas as pd
 from prefect import Task
@@ -182,7 +183,6 @@ class CustomerGaugeToDF(Task):
         unpack_by_field_reference_cols: List[str] = None,
         unpack_by_nested_dict_transformer: List[str] = None,
     ) -> List[Dict[str, Any]]:
-
         """
         Function to unpack and modify specific columns in a list of dictionaries by using one of two methods,
         chosen by the user.
@@ -307,19 +307,26 @@ class CustomerGaugeToDF(Task):
         """
 
         df = df.astype(str)
-        df = df.applymap(lambda x: x.strip("[]"))
+        df = df.apply(lambda column: column.str.strip("[]"))
         return df
 
-    def _drivers_cleaner(self, drivers: str = None) -> str:
+    def _drivers_cleaner(
+        self, drivers: Union[str, pd.Series] = None
+    ) -> Union[str, pd.Series]:
         """
         Clean and format the 'drivers' data.
 
         Args:
-            drivers (str, optional): Column name of the data to be cleaned. Defaults to None.
+            drivers (Union[str, pd.Series], optional): The data to be cleaned, a single value
+                or a whole column. Defaults to None.
 
         Returns:
-            str: A cleaned and formatted string of driver data.
+            Union[str, pd.Series]: A cleaned and formatted string of driver data, or a column of them.
         """
+        if isinstance(drivers, pd.Series):
+            return drivers.str.replace(r"[{}']", "", regex=True).str.replace(
+                "label: ", "", regex=False
+            )
 
         cleaned_drivers = (
             drivers.replace("{", "")
@@ -330,6 +337,42 @@ class CustomerGaugeToDF(Task):
 
         return cleaned_drivers
 
+    def _get_pages(
+        self,
+        customer_gauge: CustomerGauge,
+        total_load: bool = True,
+        cursor: int = None,
+        **kwargs,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the 'data' part of each page. The next page is requested in the background
+        as soon as its cursor is known, so that it's downloaded while the current page is processed.
+
+        Args:
+            customer_gauge (CustomerGauge): The source to download the pages from.
+            total_load (bool, optional): Indicate whether to download the data to the latest.
+                If 'False', only the first page is returned. Defaults to True.
+            cursor (int, optional): Cursor value to navigate to the first page. Defaults to None.
+            **kwargs: Keyword arguments passed to `get_json_response()` for the first page.
+
+        Yields:
+            List[Dict[str, Any]]: The data of a single page.
+        """
+        json_data = customer_gauge.get_json_response(cursor=cursor, **kwargs)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while True:
+                cur = customer_gauge.get_cursor(json_data)
+                jsn = self.get_data(json_data)
+                next_page = None
+                if total_load and jsn:
+                    next_page = executor.submit(
+                        customer_gauge.get_json_response, cursor=cur
+                    )
+                yield jsn
+                if next_page is None:
+                    break
+                json_data = next_page.result()
+
     def __call__(self):
         """Download Customer Gauge data to a DF"""
         super().__call__(self)
@@ -402,26 +445,12 @@ class CustomerGaugeToDF(Task):
         except (ValueError, TypeError) as e:
             logger.error(e)
 
-        total_json = []
-
         customer_gauge = CustomerGauge(
             endpoint=endpoint, url=endpoint_url, credentials=credentials
         )
         logger.info(
             f"Starting downloading data from {self.endpoint or self.endpoint_url} endpoint..."
         )
-        json_data = customer_gauge.get_json_response(
-            cursor=cursor,
-            pagesize=pagesize,
-            date_field=date_field,
-            start_date=start_date,
-            end_date=end_date,
-        )
-        cur = customer_gauge.get_cursor(json_data)
-
-        jsn = self.get_data(json_data)
-        total_json += jsn
-
         if total_load == True:
             if cursor is None:
                 logger.info(
@@ -432,22 +461,32 @@ class CustomerGaugeToDF(Task):
                 logger.info(
                     f"Downloading starting from the {cursor} cursor. Process might take a few minutes..."
                 )
-            while jsn:
-                json_data = customer_gauge.get_json_response(cursor=cur)
-                cur = customer_gauge.get_cursor(json_data)
-                jsn = self.get_data(json_data)
-                total_json += jsn
 
-        clean_json = self.column_unpacker(
-            json_list=total_json,
-            unpack_by_field_reference_cols=unpack_by_field_reference_cols,
-            unpack_by_nested_dict_transformer=unpack_by_nested_dict_transformer,
-        )
+        # Each page is unpacked and flattened as soon as it arrives.
+        records = []
+        for jsn in self._get_pages(
+            customer_gauge,
+            total_load=total_load,
+            cursor=cursor,
+            pagesize=pagesize,
+            date_field=date_field,
+            start_date=start_date,
+            end_date=end_date,
+        ):
+            if not jsn:
+                continue
+            clean_json = self.column_unpacker(
+                json_list=jsn,
+                unpack_by_field_reference_cols=unpack_by_field_reference_cols,
+                unpack_by_nested_dict_transformer=unpack_by_nested_dict_transformer,
+            )
+            records.extend(map(self.flatten_json, clean_json))
+
         logger.info("Inserting data into the DataFrame...")
-        df = pd.DataFrame(list(map(self.flatten_json, clean_json)))
+        df = pd.DataFrame(records)
         df = self.square_brackets_remover(df)
         if "drivers" in list(df.columns):
-            df["drivers"] = df["drivers"].apply(self._drivers_cleaner)
+            df["drivers"] = self._drivers_cleaner(df["drivers"])
         df.columns = df.columns.str.lower().str.replace(" ", "_")
         logger.info("DataFrame: Ready. Data: Inserted. Let the magic happen!")
 
@@ -52,10 +52,9 @@ class DuckDBQuery(Task):
             the query was excuted successfuly.
         """
 
-        duckdb = DuckDB(credentials=credentials)
-
         # run the query and fetch the results if it's a select
-        result = duckdb.run(query, fetch_type=fetch_type)
+        with DuckDB(credentials=credentials) as duckdb:
+            result = duckdb.run(query, fetch_type=fetch_type)
 
         self.logger.info(f"Successfully ran the query.")
         return result
@@ -138,12 +137,11 @@ class DuckDBCreateTableFromParquet(Task):
             self.logger.info("The input file is empty. Skipping.")
             return
 
-        duckdb = DuckDB(credentials=self.credentials)
-
         fqn = f"{schema}.{table}" if schema is not None else table
-        created = duckdb.create_table_from_parquet(
-            path=path, schema=schema, table=table, if_exists=if_exists
-        )
+        with DuckDB(credentials=self.credentials) as duckdb:
+            created = duckdb.create_table_from_parquet(
+                path=path, schema=schema, table=table, if_exists=if_exists
+            )
         if created:
             self.logger.info(f"Successfully created table {fqn}.")
         else:
@@ -210,12 +208,11 @@ class DuckDBToDF(Task):
         if table is None:
             raise ValueError("Table is required.")
 
-        duckdb = DuckDB(credentials=credentials)
-
         # run the query and fetch the results if it's a select
         fqn = f"{schema}.{table}" if schema is not None else table
         query = f"SELECT * FROM {fqn}"
-        df = duckdb.to_df(query, if_empty=if_empty)
+        with DuckDB(credentials=credentials) as duckdb:
+            df = duckdb.to_df(query, if_empty=if_empty)
 
         self.logger.info(f"Data has been loaded sucessfully.")
         return df
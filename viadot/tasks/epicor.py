@@ -1,5 +1,5 @@
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from xml.etree.ElementTree import fromstring
 
 import pandas as pd
@@ -7,6 +7,7 @@ from prefect import Task
 from prefect.utilities.tasks import defaults_from_attrs
 
 from ..sources import Epicor
+from ..sources.base import DEFAULT_BATCH_SIZE
 
 
 class EpicorOrdersToDF(Task):
@@ -19,6 +20,7 @@ class EpicorOrdersToDF(Task):
         validate_date_filter: bool = True,
         start_date_field: str = "BegInvoiceDate",
         end_date_field: str = "EndInvoiceDate",
+        days_interval: int = None,
         timeout: int = 3600,
         *args,
         **kwargs,
@@ -35,6 +37,8 @@ class EpicorOrdersToDF(Task):
             validate_date_filter (bool, optional): Whether or not validate xml date filters. Defaults to True.
             start_date_field (str, optional) The name of filters filed containing start date. Defaults to "BegInvoiceDate".
             end_date_field (str, optional) The name of filters filed containing end date. Defaults to "EndInvoiceDate".
+            days_interval (int, optional): If provided, the date range of the filters is downloaded in windows of
+                this many days. Defaults to None.
             timeout(int, optional): The amount of time (in seconds) to wait while running this task before
                 a timeout occurs. Defaults to 3600.
 
@@ -48,6 +52,7 @@ class EpicorOrdersToDF(Task):
         self.validate_date_filter = validate_date_filter
         self.start_date_field = start_date_field
         self.end_date_field = end_date_field
+        self.days_interval = days_interval
         super().__init__(
             name="epicor_orders_to_df",
             timeout=timeout,
@@ -67,6 +72,7 @@ class EpicorOrdersToDF(Task):
         "validate_date_filter",
         "start_date_field",
         "end_date_field",
+        "days_interval",
     )
     def run(
         self,
@@ -77,6 +83,7 @@ class EpicorOrdersToDF(Task):
         validate_date_filter: bool = True,
         start_date_field: str = None,
         end_date_field: str = None,
+        days_interval: int = None,
     ):
         epicor = Epicor(
             credentials=credentials,
@@ -86,5 +93,121 @@ class EpicorOrdersToDF(Task):
             validate_date_filter=validate_date_filter,
             start_date_field=start_date_field,
             end_date_field=end_date_field,
+            days_interval=days_interval,
         )
         return epicor.to_df()
+
+
+class EpicorOrdersToParquetFile(Task):
+    def __init__(
+        self,
+        base_url: str,
+        filters_xml: str,
+        credentials: Dict[str, Any] = None,
+        config_key: str = None,
+        validate_date_filter: bool = True,
+        start_date_field: str = "BegInvoiceDate",
+        end_date_field: str = "EndInvoiceDate",
+        days_interval: int = None,
+        if_exists: Literal["append", "replace", "skip"] = "replace",
+        if_empty: Literal["warn", "skip", "fail"] = "warn",
+        batch_size: int = None,
+        timeout: int = 3600,
+        *args,
+        **kwargs,
+    ):
+        """
+        Task for streaming orders data from Epicor API into a Parquet file.
+        Unlike `EpicorOrdersToDF`, the orders are never loaded into memory as a whole.
+
+        Args:
+            base_url (str, required): Base url to Epicor Orders.
+            filters_xml (str, required): Filters in form of XML. The date filter is necessary.
+            credentials (Dict[str, Any], optional): Credentials to connect with Epicor Api containing host, port, username and password. Defaults to None.
+            config_key (str, optional): Credential key to dictionary where details are stored. Defauls to None.
+            validate_date_filter (bool, optional): Whether or not validate xml date filters. Defaults to True.
+            start_date_field (str, optional) The name of filters filed containing start date. Defaults to "BegInvoiceDate".
+            end_date_field (str, optional) The name of filters filed containing end date. Defaults to "EndInvoiceDate".
+            days_interval (int, optional): If provided, the date range of the filters is downloaded in windows of
+                this many days. Defaults to None.
+            if_exists (Literal, optional): What to do if the file already exists. Defaults to "replace".
+            if_empty (Literal, optional): What to do if there are no orders. Defaults to "warn".
+            batch_size (int, optional): The number of rows written at once. Defaults to None (100 000).
+            timeout(int, optional): The amount of time (in seconds) to wait while running this task before
+                a timeout occurs. Defaults to 3600.
+        """
+        self.credentials = credentials
+        self.config_key = config_key
+        self.base_url = base_url
+        self.filters_xml = filters_xml
+        self.validate_date_filter = validate_date_filter
+        self.start_date_field = start_date_field
+        self.end_date_field = end_date_field
+        self.days_interval = days_interval
+        self.if_exists = if_exists
+        self.if_empty = if_empty
+        self.batch_size = batch_size
+        super().__init__(
+            name="epicor_orders_to_parquet_file",
+            timeout=timeout,
+            *args,
+            **kwargs,
+        )
+
+    @defaults_from_attrs(
+        "credentials",
+        "config_key",
+        "base_url",
+        "filters_xml",
+        "validate_date_filter",
+        "start_date_field",
+        "end_date_field",
+        "days_interval",
+        "if_exists",
+        "if_empty",
+        "batch_size",
+    )
+    def run(
+        self,
+        path: str,
+        credentials: Dict[str, Any] = None,
+        config_key: str = None,
+        base_url: str = None,
+        filters_xml: str = None,
+        validate_date_filter: bool = True,
+        start_date_field: str = None,
+        end_date_field: str = None,
+        days_interval: int = None,
+        if_exists: Literal["append", "replace", "skip"] = None,
+        if_empty: Literal["warn", "skip", "fail"] = None,
+        batch_size: int = None,
+    ) -> str:
+        """
+        Stream the orders into a Parquet file.
+
+        Args:
+            path (str, required): The path to the Parquet file or dataset directory.
+
+        Returns:
+            str: The path to the Parquet file.
+        """
+        epicor = Epicor(
+            credentials=credentials,
+            config_key=config_key,
+            base_url=base_url,
+            filters_xml=filters_xml,
+            validate_date_filter=validate_date_filter,
+            start_date_field=start_date_field,
+            end_date_field=end_date_field,
+            days_interval=days_interval,
+        )
+        written = epicor.to_parquet(
+            path=path,
+            if_exists=if_exists,
+            if_empty=if_empty,
+            batch_size=batch_size or DEFAULT_BATCH_SIZE,
+        )
+
+        if written:
+            self.logger.info(f"Successfully wrote the orders to {path}.")
+        return path
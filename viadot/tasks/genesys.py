@@ -1,5 +1,4 @@
 import os
-import time
 from typing import Any, Dict, List
 
 import numpy as np
@@ -19,6 +18,36 @@ from viadot.task_utils import *
 logger = logging.get_logger()
 
 
+def _flatten_record(
+    record: Dict[str, Any],
+    sep: str = ".",
+    prefix: str = "",
+    exclude: List[str] = None,
+) -> Dict[str, Any]:
+    """Flatten the nested dictionaries of a record the same way as `pd.json_normalize()`.
+
+    Args:
+        record (Dict[str, Any]): The record to flatten.
+        sep (str, optional): Separator of the nested keys. Defaults to ".".
+        prefix (str, optional): Prefix added to all keys. Defaults to "".
+        exclude (List[str], optional): Top level keys to skip. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: The flat record.
+    """
+    flat_record = {}
+    for key, value in record.items():
+        if exclude and key in exclude:
+            continue
+        if isinstance(value, dict):
+            flat_record.update(
+                _flatten_record(value, sep=sep, prefix=f"{prefix}{key}{sep}")
+            )
+        else:
+            flat_record[f"{prefix}{key}"] = value
+    return flat_record
+
+
 class GenesysToCSV(Task):
     def __init__(
         self,
@@ -183,118 +212,55 @@ class GenesysToCSV(Task):
         Returns:
             DataFrame: A single data frame with all the content.
         """
-        # LEVEL 0
-        df0 = pd.json_normalize(data_to_merge)
-        df0.drop(["participants"], axis=1, inplace=True)
-
-        # LEVEL 1
-        df1 = pd.json_normalize(
-            data_to_merge,
-            record_path=["participants"],
-            meta=["conversationId"],
-        )
-        df1.drop(["sessions"], axis=1, inplace=True)
-
-        # LEVEL 2
-        df2 = pd.json_normalize(
-            data_to_merge,
-            record_path=["participants", "sessions"],
-            meta=[
-                ["participants", "externalContactId"],
-                ["participants", "participantId"],
-            ],
-            errors="ignore",
-            sep="_",
-        )
-        df2.rename(
-            columns={
-                "participants_externalContactId": "externalContactId",
-                "participants_participantId": "participantId",
-            },
-            inplace=True,
-        )
-        for key in ["metrics", "segments", "mediaEndpointStats"]:
-            try:
-                df2.drop([key], axis=1, inplace=True)
-            except KeyError as e:
-                logger.info(f"Key {e} not appearing in the response.")
-
-        # LEVEL 3
-        # not all levels 3 have the same data, and that creates problems of standardization
-        # so I add empty data where it is not available to avoid future errors
-        conversations_df = {}
-        for i, conversation in enumerate(data_to_merge):
-            for j, entry_0 in enumerate(conversation["participants"]):
-                for key in list(entry_0.keys()):
-                    if key == "sessions":
-                        for k, entry_1 in enumerate(entry_0[key]):
-                            if "metrics" not in list(entry_1.keys()):
-                                conversation["participants"][j][key][k]["metrics"] = []
-                            if "segments" not in list(entry_1.keys()):
-                                conversation["participants"][j][key][k]["segments"] = []
-                            if "mediaEndpointStats" not in list(entry_1.keys()):
-                                conversation["participants"][j][key][k][
-                                    "mediaEndpointStats"
-                                ] = []
-            # LEVEL 3 metrics
-            df3_1 = pd.json_normalize(
-                conversation,
-                record_path=["participants", "sessions", "metrics"],
-                meta=[
-                    ["participants", "sessions", "sessionId"],
-                ],
-                errors="ignore",
-                record_prefix="metrics_",
-                sep="_",
+        conversations, participants, sessions, details = [], [], [], []
+        for conversation in data_to_merge:
+            # LEVEL 0
+            conversations.append(
+                _flatten_record(conversation, sep=".", exclude=["participants"])
             )
-            df3_1.rename(
-                columns={"participants_sessions_sessionId": "sessionId"}, inplace=True
-            )
-            # LEVEL 3 segments
-            df3_2 = pd.json_normalize(
-                conversation,
-                record_path=["participants", "sessions", "segments"],
-                meta=[
-                    ["participants", "sessions", "sessionId"],
-                ],
-                errors="ignore",
-                record_prefix="segments_",
-                sep="_",
-            )
-            df3_2.rename(
-                columns={"participants_sessions_sessionId": "sessionId"}, inplace=True
-            )
-            # LEVEL 3 mediaEndpointStats
-            df3_3 = pd.json_normalize(
-                conversation,
-                record_path=["participants", "sessions", "mediaEndpointStats"],
-                meta=[
-                    ["participants", "sessions", "sessionId"],
-                ],
-                errors="ignore",
-                record_prefix="mediaEndpointStats_",
-                sep="_",
-            )
-            df3_3.rename(
-                columns={"participants_sessions_sessionId": "sessionId"}, inplace=True
-            )
-
-            # merging all LEVELs 3 from the same conversation
-            dff3_tmp = pd.concat([df3_1, df3_2])
-            dff3 = pd.concat([dff3_tmp, df3_3])
-
-            conversations_df.update({i: dff3})
-
-        # NERGING ALL LEVELS
-        # LEVELS 3
-        for l, key in enumerate(list(conversations_df.keys())):
-            if l == 0:
-                dff3_f = conversations_df[key]
-            else:
-                dff3_f = pd.concat([dff3_f, conversations_df[key]])
+            for participant in conversation["participants"]:
+                # LEVEL 1
+                participant_record = _flatten_record(
+                    participant, sep=".", exclude=["sessions"]
+                )
+                participant_record["conversationId"] = conversation.get(
+                    "conversationId", np.nan
+                )
+                participants.append(participant_record)
+
+                for session in participant.get("sessions", []):
+                    # LEVEL 2
+                    session_record = _flatten_record(
+                        session,
+                        sep="_",
+                        exclude=["metrics", "segments", "mediaEndpointStats"],
+                    )
+                    session_record["externalContactId"] = participant.get(
+                        "externalContactId", np.nan
+                    )
+                    session_record["participantId"] = participant.get(
+                        "participantId", np.nan
+                    )
+                    sessions.append(session_record)
+
+            # LEVEL 3
+            # not all levels 3 have the same data, missing values are filled in
+            # when building the data frame
+            for key in ["metrics", "segments", "mediaEndpointStats"]:
+                for participant in conversation["participants"]:
+                    for session in participant.get("sessions", []):
+                        for entry in session.get(key, []):
+                            record = _flatten_record(entry, sep="_", prefix=f"{key}_")
+                            record["sessionId"] = session.get("sessionId", np.nan)
+                            details.append(record)
+
+        df0 = pd.DataFrame(conversations)
+        df1 = pd.DataFrame(participants)
+        df2 = pd.DataFrame(sessions)
+        df3 = pd.DataFrame(details, columns=None if details else ["sessionId"])
 
         # LEVEL 3 with LEVEL 2
-        dff2 = pd.merge(dff3_f, df2, how="outer", on=["sessionId"])
+        dff2 = pd.merge(df3, df2, how="outer", on=["sessionId"])
 
         # LEVEL 2 with LEVEL 1
         dff1 = pd.merge(
@@ -347,7 +313,8 @@ class GenesysToCSV(Task):
         Args:
             report_name (str, optional): The name of this task. Defaults to a general name 'genesys_to_csv'.
             view_type (str, optional): The type of view export job to be created. Defaults to None.
-            view_type_time_sleep (int, optional): Waiting time to retrieve data from Genesys API. Defaults to 80.
+            view_type_time_sleep (int, optional): The maximum time, in seconds, to wait for the reports to be generated
+                in Genesys API. Defaults to 80.
             post_data_list (List[str], optional): List of string templates to generate json body. Defaults to None.
             end_point (str, optional): Final end point for Genesys connection. Defaults to "analytics/reporting/exports".
             credentials_genesys (Dict[str, Any], optional): Credentials to connect with Genesys API containing CLIENT_ID. Defaults to None.
@@ -391,74 +358,28 @@ class GenesysToCSV(Task):
             report_columns=report_columns,
         )
 
-        if view_type == "queue_performance_detail_view":
+        if view_type is not None and end_point == "analytics/reporting/exports":
             genesys.genesys_api_connection(
                 post_data_list=post_data_list, end_point=end_point
             )
-
             logger.info(
-                f"Waiting {view_type_time_sleep} seconds for caching data in Genesys database."
+                f"Waiting up to {view_type_time_sleep} seconds for generating the reports in Genesys database."
             )
-            # sleep time to allow Genesys generate all exports
-            time.sleep(view_type_time_sleep)
-            # in order to wait for API POST request add it
-            timeout_start = time.time()
-            # 30 seconds timeout is minimal but for safety added 60.
-            timeout = timeout_start + 60
-            # while loop with timeout
-            while time.time() < timeout:
-                try:
-                    genesys.get_reporting_exports_data()
-                    urls = [col for col in np.array(genesys.report_data).T][1]
-                    if None in urls:
-                        logger.warning("Found None object in list of urls.")
-                    else:
-                        break
-                except TypeError:
-                    pass
-
-                # There is a need to clear a list before repeating try statement.
-                genesys.report_data.clear()
-
-        elif view_type in [
-            "agent_performance_summary_view",
-            "agent_status_summary_view",
-            "agent_status_detail_view",
-            "agent_interaction_detail_view",
-            "agent_timeline_summary_view",
-        ]:
-            genesys.genesys_api_connection(
-                post_data_list=post_data_list, end_point=end_point
+            # each report is downloaded as soon as it's generated
+            file_names = genesys.download_reporting_exports_when_ready(
+                path=self.local_file_path, timeout=view_type_time_sleep
             )
-            logger.info(
-                f"Waiting for getting data in Genesys database ({view_type_time_sleep} seconds)."
-            )
-            time.sleep(view_type_time_sleep)
-
-            genesys.get_reporting_exports_data()
-
-        if view_type is not None and end_point == "analytics/reporting/exports":
-            failed = [col for col in np.array(genesys.report_data).T][-1]
 
-            if "FAILED" in failed and "COMPLETED" in failed:
+            statuses = [report[-1] for report in genesys.report_data]
+            if "FAILED" in statuses and "COMPLETED" in statuses:
                 logger.warning("Some reports failed.")
 
-            if len(genesys.report_data) == 0 or np.unique(failed)[0] == "FAILED":
+            if "COMPLETED" not in statuses:
                 genesys.delete_all_reporting_exports()
                 logger.warning(f"All existing reports were deleted.")
                 raise APIError("No exporting reports were generated.")
-            elif not None in [col for col in np.array(genesys.report_data).T][1]:
-                logger.info("Downloaded the data from the Genesys into the CSV.")
-            else:
-                logger.info("Succesfully loaded all exports.")
 
-            file_names = genesys.download_all_reporting_exports(
-                path=self.local_file_path
-            )
             logger.info("Downloaded the data from the Genesys into the CSV.")
-            # in order to wait for API GET request call it
-            logger.info("Waiting for caching data in Genesys database.")
-            time.sleep(20)
             genesys.delete_all_reporting_exports()
             logger.info(f"All existing reports were deleted.")
 
@@ -492,11 +413,7 @@ class GenesysToCSV(Task):
                 post_data_list[0]["paging"]["pageNumber"] += 1
                 page_counter += 1
 
-            for i, key in enumerate(list(merged_data.keys())):
-                if i == 0:
-                    final_df = merged_data[key]
-                else:
-                    final_df = pd.concat([final_df, merged_data[key]])
+            final_df = pd.concat(list(merged_data.values()))
 
             date = start_date.replace("-", "")
             file_name = f"conversations_detail_{date}".upper() + ".csv"
@@ -505,7 +422,7 @@ class GenesysToCSV(Task):
             if mapping_dict:
                 final_df.rename(columns=mapping_dict, inplace=True)
             if columns_order:
-                final_df = df[columns_order]
+                final_df = final_df[columns_order]
 
             if validate_df_dict:
                 validate_df.run(df=final_df, tests=validate_df_dict)
@@ -557,7 +474,7 @@ class GenesysToCSV(Task):
             file_name = f"WEBMESSAGE_{start}-{end}.csv"
 
             df.to_csv(
-                os.path.join(file_name),
+                os.path.join(self.local_file_path, file_name),
                 index=False,
                 sep="\t",
             )
@@ -646,7 +563,7 @@ class GenesysToCSV(Task):
 
             file_name = "All_Genesys_Users.csv"
             df.to_csv(
-                os.path.join(file_name),
+                os.path.join(self.local_file_path, file_name),
                 index=False,
                 sep="\t",
             )
@@ -24,6 +24,7 @@ class MediatoolToDF(Task):
         media_entries_columns: List[str] = None,
         mediatool_credentials: dict = None,
         mediatool_credentials_key: str = None,
+        max_workers: int = 8,
         *args: List[Any],
         **kwargs: Dict[str, Any],
     ):
@@ -35,10 +36,13 @@ class MediatoolToDF(Task):
             media_entries_columns (List[str], optional): List of media entries fields to download. Defaults to None.
             mediatool_credentials (dict, optional): Dictionary containing Mediatool credentials. Defaults to None.
             mediatool_credentials_key (str, optional): Key for Mediatool credentials. Defaults to None.
+            max_workers (int, optional): The maximum number of vehicles or media types requested
+                concurrently. Defaults to 8.
         """
 
         self.media_entries_columns = media_entries_columns
         self.organization_ids = organization_ids
+        self.max_workers = max_workers
 
         if mediatool_credentials is None:
             self.mediatool_credentials = credentials_loader.run(
@@ -112,7 +116,9 @@ class MediatoolToDF(Task):
         Returns:
             pd.DataFrame: Data frame containing all of the information for organization or list of organizations.
         """
-        mediatool = Mediatool(credentials=self.mediatool_credentials)
+        mediatool = Mediatool(
+            credentials=self.mediatool_credentials, max_workers=self.max_workers
+        )
         df_orgs = mediatool.get_organizations(self.mediatool_credentials["USER_ID"])
 
         list_of_dfs = []
@@ -247,6 +247,9 @@ class SalesforceToDF(Task):
         client_id (str, optional): Client id to keep the track of API calls. Defaults to None.
         env (str, optional): Environment information, provides information about credential
             and connection configuration. Defaults to 'DEV'.
+        mode (str, optional): Whether to page through the REST API ("rest") or to run
+            a Bulk API 2.0 query job ("bulk"). The bulk mode is much faster for large tables,
+            but it returns all values as strings. Defaults to "rest".
     """
 
     def __init__(
@@ -257,6 +260,7 @@ class SalesforceToDF(Task):
         domain: str = "test",
         client_id: str = "viadot",
         env: str = "DEV",
+        mode: str = "rest",
         timeout: int = 3600,
         *args: List[Any],
         **kwargs: Dict[str, Any],
@@ -267,6 +271,7 @@ class SalesforceToDF(Task):
         self.domain = domain
         self.client_id = client_id
         self.env = env
+        self.mode = mode
 
         super().__init__(
             name="salesforce_to_df",
@@ -286,6 +291,7 @@ class SalesforceToDF(Task):
         "domain",
         "client_id",
         "env",
+        "mode",
     )
     def run(
         self,
@@ -295,6 +301,7 @@ class SalesforceToDF(Task):
         env: str = None,
         domain: str = None,
         client_id: str = None,
+        mode: str = None,
         credentials_secret: str = None,
         vault_name: str = None,
         **kwargs: Dict[str, Any],
@@ -311,6 +318,8 @@ class SalesforceToDF(Task):
             domain (str, optional): Domain of a connection. defaults to 'test' (sandbox).
                 Can only be added if built-in username/password/security token is provided. Defaults to None.
             client_id (str, optional): Client id to keep the track of API calls. Defaults to None.
+            mode (str, optional): Whether to page through the REST API ("rest") or to run
+                a Bulk API 2.0 query job ("bulk"). Defaults to "rest".
             credentials_secret (str, optional): The name of the Azure Key Vault secret for Salesforce. Defaults to None.
             vault_name (str, optional): The name of the vault from which to obtain the secrets. Defaults to None.
         """
@@ -323,7 +332,7 @@ class SalesforceToDF(Task):
         )
         self.logger.info(f"Retreiving the data from Salesforce...")
         df = salesforce.to_df(
-            query=query, table=table, columns=columns, if_empty="replace"
+            query=query, table=table, columns=columns, if_empty="replace", mode=mode
         )
         self.logger.info(f"Successfully downloaded data from Salesforce.")
 
@@ -101,6 +101,8 @@ class SAPRFCToDF(Task):
         rfc_total_col_width_character_limit: int = None,
         rfc_unique_id: List[str] = None,
         alternative_version: bool = False,
+        max_workers: int = 1,
+        fixed_width: bool = False,
     ) -> pd.DataFrame:
         """Task run method.
 
@@ -128,6 +130,10 @@ class SAPRFCToDF(Task):
                     ...
                     )
             alternative_version (bool, optional): Enable the use version 2 in source. Defaults to False.
+            max_workers (int, optional): The number of column chunks to download concurrently. Only used
+                with `alternative_version=True`. Defaults to 1.
+            fixed_width (bool, optional): Whether to query SAP without a delimiter and split the records
+                by field offsets instead of trying separators. Defaults to False.
 
         Returns:
             pd.DataFrame: DataFrame with SAP data.
@@ -158,6 +164,8 @@ class SAPRFCToDF(Task):
                 func=func,
                 rfc_total_col_width_character_limit=rfc_total_col_width_character_limit,
                 rfc_unique_id=rfc_unique_id,
+                max_workers=max_workers,
+                fixed_width=fixed_width,
             )
         else:
             sap = SAPRFC(
@@ -167,6 +175,7 @@ class SAPRFCToDF(Task):
                 env=env,
                 func=func,
                 rfc_total_col_width_character_limit=rfc_total_col_width_character_limit,
+                fixed_width=fixed_width,
             )
         sap.query(query)
         self.logger.info(f"Downloading data from SAP to a DataFrame...")
@@ -138,6 +138,70 @@ class SQLServerToDF(Task):
         return df
 
 
+class SQLServerToParquetFile(Task):
+    def __init__(
+        self,
+        config_key: str = None,
+        if_exists: Literal["append", "replace", "skip"] = "replace",
+        batch_size: int = None,
+        timeout: int = 3600,
+        *args,
+        **kwargs,
+    ):
+        """
+        Task for streaming the result of a SQL Server query into a Parquet file.
+        Unlike `SQLServerToDF`, the result is never loaded into memory as a whole.
+
+        Args:
+            config_key (str, optional): The key inside local config containing the credentials. Defaults to None.
+            if_exists (Literal, optional): What to do if the file already exists. Defaults to "replace".
+            batch_size (int, optional): The number of rows fetched and written at once. Defaults to None
+                (the `arraysize` of the source).
+            timeout(int, optional): The amount of time (in seconds) to wait while running this task before
+                a timeout occurs. Defaults to 3600.
+        """
+        self.config_key = config_key
+        self.if_exists = if_exists
+        self.batch_size = batch_size
+
+        super().__init__(
+            name="sql_server_to_parquet_file", timeout=timeout, *args, **kwargs
+        )
+
+    @defaults_from_attrs("config_key", "if_exists", "batch_size")
+    def run(
+        self,
+        query: str,
+        path: str,
+        config_key: str = None,
+        if_exists: Literal["append", "replace", "skip"] = None,
+        batch_size: int = None,
+    ) -> str:
+        """
+        Stream the result of a SQL Server Database query into a Parquet file.
+
+        Args:
+            query (str, required): The query to execute on the SQL Server database.
+            path (str, required): The path to the Parquet file or dataset directory.
+            config_key (str, optional): The key inside local config containing the credentials. Defaults to None.
+            if_exists (Literal, optional): What to do if the file already exists. Defaults to None.
+            batch_size (int, optional): The number of rows fetched and written at once. Defaults to None.
+
+        Returns:
+            str: The path to the Parquet file.
+        """
+        if config_key is None:
+            config_key = "SQL_SERVER"
+        sql_server = SQLServer(config_key=config_key)
+        written = sql_server.to_parquet(
+            path=path, query=query, if_exists=if_exists, batch_size=batch_size
+        )
+
+        if written:
+            self.logger.info(f"Successfully wrote the query result to {path}.")
+        return path
+
+
 class SQLServerQuery(Task):
     def __init__(
         self,
@@ -87,6 +87,7 @@ class VidClubToDF(Task):
         items_per_page: int = 100,
         region: Literal["bg", "hu", "hr", "pl", "ro", "si", "all"] = None,
         days_interval: int = 30,
+        max_workers: int = 4,
         cols_to_drop: List[str] = None,
     ) -> pd.DataFrame:
         """
@@ -100,6 +101,7 @@ class VidClubToDF(Task):
             items_per_page (int, optional): Number of entries per page. 100 entries by default.
             region (str, optional): Region filter for the query. Valid inputs: ["bg", "hu", "hr", "pl", "ro", "si", "all"]. Defaults to None.
             days_interval (int, optional): Days specified in date range per api call (test showed that 30-40 is optimal for performance). Defaults to 30.
+            max_workers (int, optional): The maximum number of date ranges downloaded concurrently. Defaults to 4.
             cols_to_drop (List[str], optional): List of columns to drop. Defaults to None.
 
         Raises:
@@ -119,6 +121,7 @@ class VidClubToDF(Task):
             items_per_page=items_per_page,
             region=region,
             days_interval=days_interval,
+            max_workers=max_workers,
         )
         if cols_to_drop is not None:
             if isinstance(cols_to_drop, list):
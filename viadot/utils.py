@@ -1,11 +1,22 @@
+import asyncio
 import functools
+import glob
+import hashlib
 import os
 import re
+import tempfile
+import threading
+import time
+import uuid
+import warnings
+from http.cookiejar import DefaultCookiePolicy
 from itertools import chain
-from typing import Any, Callable, Dict, List, Literal, Union
+from typing import Any, Callable, Dict, Iterable, List, Literal, Union
+from urllib.parse import urlparse
 
 import pandas as pd
 import prefect
+import pyarrow as pa
 import pyarrow.parquet
 import pyodbc
 import requests
@@ -34,6 +45,202 @@ def slugify(name: str) -> str:
     return name.replace(" ", "_").lower()
 
 
+class HTTPClient:
+    """A keep-alive, connection-pooled HTTP client shared by the API sources.
+
+    Connections are kept open and reused between requests to the same host, instead of
+    performing a new TCP and TLS handshake for each request. Cookies are not persisted
+    between requests, so that sources sharing the client don't affect each other.
+
+    Args:
+        pool_connections (int, optional): The number of hosts to keep connection pools
+            for. Defaults to 10.
+        pool_maxsize (int, optional): The maximum number of connections to keep open
+            per host. Defaults to 10.
+        retries (int, optional): How many times to retry requests failing with
+            429, 500, 502, 503 or 504 status codes. Defaults to 3.
+        backoff_factor (float, optional): The backoff factor between retries.
+            Defaults to 1.
+    """
+
+    RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        retries: int = 3,
+        backoff_factor: float = 1,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self._metrics: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = self._get_adapter(pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _get_adapter(self, pool_maxsize: int) -> HTTPAdapter:
+        retry_strategy = Retry(
+            total=self.retries,
+            status_forcelist=self.RETRY_STATUSES,
+            backoff_factor=self.backoff_factor,
+        )
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry_strategy,
+        )
+
+    def set_pool_size(self, host: str, pool_maxsize: int) -> None:
+        """Set the maximum number of connections kept open to a specific host.
+
+        Args:
+            host (str): The host, eg. "api.mypurecloud.de".
+            pool_maxsize (int): The maximum number of connections.
+        """
+        adapter = self._get_adapter(pool_maxsize)
+        self.session.mount(f"https://{host}/", adapter)
+        self.session.mount(f"http://{host}/", adapter)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.models.Response:
+        """Send a request and record its latency and size. See `requests.request()`."""
+        start = time.perf_counter()
+        response = self.session.request(method=method, url=url, **kwargs)
+        elapsed = time.perf_counter() - start
+
+        host = urlparse(url).netloc
+        with self._lock:
+            metrics = self._metrics.setdefault(
+                host, {"requests": 0, "seconds": 0.0, "bytes": 0}
+            )
+            metrics["requests"] += 1
+            metrics["seconds"] += elapsed
+            metrics["bytes"] += len(response.content)
+
+        return response
+
+    @property
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """The number of requests, total time (in seconds) and total size of the
+        responses (in bytes) per host."""
+        with self._lock:
+            return {host: dict(metrics) for host, metrics in self._metrics.items()}
+
+    def close(self) -> None:
+        """Close all open connections."""
+        self.session.close()
+
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """Get the HTTP client shared by all API sources in the process."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = HTTPClient()
+        return _http_client
+
+
+class OAuthTokenManager:
+    """Cache an OAuth access token until shortly before it expires.
+
+    Concurrent callers asking for a token while it's being refreshed wait for the
+    single refresh instead of each requesting a new token.
+
+    Args:
+        fetch_token (Callable[[], Dict[str, Any]], optional): A function requesting a new
+            token and returning the token response, with the `access_token`, `token_type`
+            and `expires_in` keys. Can instead be passed to each `get_token()` call, so
+            that the manager doesn't keep a reference to its caller. Defaults to None.
+        refresh_margin (int, optional): How many seconds before the token's expiration
+            to refresh it. Defaults to 60.
+    """
+
+    def __init__(
+        self,
+        fetch_token: Callable[[], Dict[str, Any]] = None,
+        refresh_margin: int = 60,
+    ):
+        self.fetch_token = fetch_token
+        self.refresh_margin = refresh_margin
+        self._token = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_token(
+        self, fetch_token: Callable[[], Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Return the cached token response, requesting a new token if needed.
+
+        Args:
+            fetch_token (Callable[[], Dict[str, Any]], optional): The function to request
+                a new token with. Defaults to None (the manager's `fetch_token`).
+        """
+        fetch_token = fetch_token or self.fetch_token
+        if fetch_token is None:
+            raise ValueError("No function to request a new token with was provided.")
+        with self._lock:
+            if self._token is None or time.monotonic() >= self._expires_at:
+                token = fetch_token()
+                # tokens without an expiration time are not cached
+                expires_in = float(token.get("expires_in") or 0)
+                self._token = token
+                self._expires_at = time.monotonic() + expires_in - self.refresh_margin
+            return self._token
+
+    def invalidate(self) -> None:
+        """Discard the cached token, eg. after the API has rejected it."""
+        with self._lock:
+            self._token = None
+
+
+_token_managers: Dict[Any, OAuthTokenManager] = {}
+_token_managers_lock = threading.Lock()
+
+
+def credentials_fingerprint(*secrets: Any) -> str:
+    """Return a hash identifying the given secrets, without storing them.
+
+    Args:
+        *secrets (Any): The secrets, eg. a client secret.
+
+    Returns:
+        str: The SHA-256 hex digest of the secrets.
+    """
+    return hashlib.sha256(repr(secrets).encode("utf-8")).hexdigest()
+
+
+def get_token_manager(key: Any, refresh_margin: int = 60) -> OAuthTokenManager:
+    """Get the token manager shared by all sources using the same `key`.
+
+    The manager doesn't keep a function to request tokens with, so pass it to
+    `OAuthTokenManager.get_token()`. Include a `credentials_fingerprint()` in the
+    key, so that a rotated secret gets its own token.
+
+    Args:
+        key (Any): A hashable key identifying the token, eg. (token URL, client ID,
+            fingerprint of the client secret).
+        refresh_margin (int, optional): How many seconds before the token's expiration
+            to refresh it. Defaults to 60.
+
+    Returns:
+        OAuthTokenManager: The token manager.
+    """
+    with _token_managers_lock:
+        if key not in _token_managers:
+            _token_managers[key] = OAuthTokenManager(refresh_margin=refresh_margin)
+        return _token_managers[key]
+
+
 def handle_api_response(
     url: str,
     auth: tuple = None,
@@ -45,6 +252,7 @@ def handle_api_response(
     verify: bool = True,
 ) -> requests.models.Response:
     """Handle and raise Python exceptions during request with retry strategy for specific status.
+    The request is sent over the shared, connection-pooled client (see `get_http_client()`).
     Args:
         url (str): The URL which trying to connect.
         auth (tuple, optional): Authorization information. Defaults to None.
@@ -69,16 +277,7 @@ def handle_api_response(
             f"Method not found. Please use one of the available methods: 'GET', 'POST', 'DELETE'."
         )
     try:
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            backoff_factor=1,
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        with session.request(
+        with get_http_client().request(
             url=url,
             auth=auth,
             params=params,
@@ -109,6 +308,18 @@ def handle_api_response(
     return response
 
 
+async def handle_api_response_async(*args, **kwargs) -> requests.models.Response:
+    """An asyncio variant of `handle_api_response()`, with the same parameters.
+
+    The request is sent over the shared HTTP client in the event loop's default
+    executor, so that many requests can be awaited concurrently.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, functools.partial(handle_api_response, *args, **kwargs)
+    )
+
+
 def get_flow_last_run_date(flow_name: str) -> str:
     """
     Retrieve a flow's last run date as an ISO datetime string.
@@ -270,6 +481,9 @@ def gen_bulk_insert_query_from_df(
     """
     Converts a DataFrame to a bulk INSERT query.
 
+    Deprecated: values are inlined into the query as strings. Use the parameterized
+    `SQL.insert_into()` instead.
+
     Args:
         df (pd.DataFrame): The DataFrame which data should be put into the INSERT query.
         table_fqn (str): The fully qualified name (schema.table) of the table to be inserted into.
@@ -294,6 +508,12 @@ def gen_bulk_insert_query_from_df(
            (2, 'Noneprefix', 0, NULL, 'APPROVED', NULL),
            (3, 'fooNULLbar', 1, 2.34, 'APPROVED', NULL);
     """
+    warnings.warn(
+        "`gen_bulk_insert_query_from_df()` is deprecated and will be removed in a "
+        "future release. Use `SQL.insert_into()` instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     if df.shape[1] == 1:
         raise NotImplementedError(
             "Currently, this function only handles DataFrames with at least two columns."
@@ -504,3 +724,226 @@ def get_nested_value(
     except (TypeError, AttributeError) as e:
         logger.error(f"The 'nested_dict' must be a dictionary. {e}")
         return None
+
+
+def common_arrow_type(types: List[pa.DataType]) -> pa.DataType:
+    """
+    The type which values of a column typed differently in several tables share.
+
+    Columns without any values are typed as strings, integers and floats are promoted
+    to floats and any other mix of types falls back to strings.
+
+    Args:
+        types (List[pa.DataType]): The types of the column in each table.
+
+    Returns:
+        pa.DataType: The type to cast all the values to.
+    """
+    types = [type_ for type_ in types if not pa.types.is_null(type_)]
+    if not types:
+        return pa.string()
+    if all(type_ == types[0] for type_ in types):
+        return types[0]
+    if all(pa.types.is_integer(type_) for type_ in types):
+        return pa.int64()
+    if all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in types):
+        return pa.float64()
+    return pa.string()
+
+
+def cast_arrow_column(column: pa.ChunkedArray, type_: pa.DataType) -> pa.ChunkedArray:
+    """
+    Cast a column to the type determined by `common_arrow_type()`. Values which
+    Arrow can't cast to strings (eg. structs) are converted with `str()`.
+    """
+    if column.type == type_:
+        return column
+    try:
+        return column.cast(type_)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        if not pa.types.is_string(type_):
+            return column.cast(type_, safe=False)
+        values = column.to_pylist()
+        return pa.chunked_array(
+            [[None if v is None else str(v) for v in values]], pa.string()
+        )
+
+
+def _conform_to_schema(
+    batch: Union[pa.RecordBatch, pa.Table], schema: pa.Schema
+) -> pa.Table:
+    """
+    Reorder and cast the columns of `batch` to match `schema`. Columns missing
+    from `batch` are filled with nulls.
+
+    Args:
+        batch (Union[pa.RecordBatch, pa.Table]): The data to conform.
+        schema (pa.Schema): The target schema.
+
+    Returns:
+        pa.Table: A table with exactly the columns and types of `schema`.
+    """
+    if isinstance(batch, pa.RecordBatch):
+        batch = pa.Table.from_batches([batch])
+    columns = []
+    for field in schema:
+        if field.name in batch.schema.names:
+            column = batch.column(batch.schema.get_field_index(field.name))
+            columns.append(cast_arrow_column(column, field.type))
+        else:
+            columns.append(pa.nulls(batch.num_rows, type=field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _reconcile_schemas(existing: pa.Schema, new: pa.Schema) -> pa.Schema:
+    """
+    Build the schema to use when appending data with schema `new` to data with
+    schema `existing`. Columns typed differently in both are widened with
+    `common_arrow_type()`; columns which are only present in `new` are appended
+    at the end.
+    """
+    fields = []
+    for field in existing:
+        if field.name in new.names:
+            new_type = new.field(field.name).type
+            if new_type != field.type:
+                field = field.with_type(common_arrow_type([field.type, new_type]))
+        fields.append(field)
+    for field in new:
+        if field.name not in existing.names:
+            fields.append(field)
+    return pa.schema(fields, metadata=existing.metadata)
+
+
+def _write_parquet_file(
+    path: str,
+    schema: pa.Schema,
+    tables: Iterable[Union[pa.RecordBatch, pa.Table]],
+    tmp_path: str,
+    **kwargs,
+) -> None:
+    """
+    Write `tables` into a temporary file at `tmp_path` and move it to `path` once
+    it's complete, so that readers never see a partially written file and `path`
+    is left untouched if writing fails.
+    """
+    try:
+        with pyarrow.parquet.ParquetWriter(tmp_path, schema, **kwargs) as writer:
+            for table in tables:
+                writer.write_table(_conform_to_schema(table, schema))
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def write_parquet(
+    data: Union[pa.Table, pa.RecordBatchReader],
+    path: str,
+    if_exists: Literal["append", "replace"] = "replace",
+    **kwargs,
+) -> None:
+    """
+    Write Arrow data to a Parquet file or to a Parquet dataset directory.
+
+    If `path` is a directory (or ends with a path separator), it is treated as a
+    dataset: `if_exists="append"` writes the data into a new part file, so the
+    cost of an append only depends on the number of new rows. This is the
+    recommended way of appending. `if_exists="replace"` removes the existing part
+    files only once the new one has been written.
+
+    Otherwise, `path` is a single file. A Parquet file can't be extended in place,
+    so in order to append, its row groups are copied one by one into a new file,
+    followed by the new data. Memory usage is bounded by the size of a single row
+    group, but the cost of each append grows with the size of the file.
+
+    Files are written under a temporary name and then moved into place. The new
+    data is reconciled with the schema of the existing data: missing columns are
+    filled with nulls, and columns typed differently are widened to a common type
+    (see `common_arrow_type()`), in which case the existing data is rewritten
+    with that type. In the single-file mode, new columns are added to the file.
+
+    Args:
+        data (Union[pa.Table, pa.RecordBatchReader]): The data to write.
+        path (str): The path to the Parquet file or dataset directory.
+        if_exists (Literal["append", "replace"], optional): What to do if the
+        file or dataset exists. Defaults to "replace".
+        **kwargs: Keyword arguments passed to `pyarrow.parquet.ParquetWriter`.
+
+    Raises:
+        ValueError: If `if_exists` is incorrect, or if new columns are appended
+        to a dataset directory.
+    """
+    if if_exists not in ("append", "replace"):
+        raise ValueError("'if_exists' must be one of ['append', 'replace']")
+
+    if isinstance(data, pa.Table):
+        data = pa.RecordBatchReader.from_batches(data.schema, data.to_batches())
+
+    is_dataset = os.path.isdir(path) or path.endswith(os.sep)
+    if is_dataset:
+        os.makedirs(path, exist_ok=True)
+        part_files = sorted(glob.glob(os.path.join(path, "*.parquet")))
+
+        schema = data.schema
+        if if_exists == "append" and part_files:
+            existing_schema = pyarrow.parquet.read_schema(part_files[0])
+            new_columns = set(schema.names) - set(existing_schema.names)
+            if new_columns:
+                raise ValueError(
+                    f"Cannot append columns {sorted(new_columns)} to the dataset '{path}'."
+                )
+            schema = _reconcile_schemas(existing_schema, schema)
+            if not schema.equals(existing_schema):
+                # Widen the existing part files too, so that the dataset can be
+                # read as a whole.
+                for part_file in part_files:
+                    part = pyarrow.parquet.ParquetFile(part_file)
+                    _write_parquet_file(
+                        part_file,
+                        schema,
+                        (part.read_row_group(i) for i in range(part.num_row_groups)),
+                        tmp_path=os.path.join(
+                            path, f".{os.path.basename(part_file)}.tmp"
+                        ),
+                        **kwargs,
+                    )
+
+        part_name = f"part-{uuid.uuid4().hex}.parquet"
+        # Files starting with "." are ignored by Parquet dataset readers.
+        _write_parquet_file(
+            os.path.join(path, part_name),
+            schema,
+            data,
+            tmp_path=os.path.join(path, f".{part_name}.tmp"),
+            **kwargs,
+        )
+        if if_exists == "replace":
+            for part_file in part_files:
+                os.remove(part_file)
+        return
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # Write to a temporary file first, as `path` may be read from.
+    fd, tmp_path = tempfile.mkstemp(suffix=".parquet.tmp", dir=directory or None)
+    os.close(fd)
+
+    if if_exists == "replace" or not os.path.isfile(path):
+        _write_parquet_file(path, data.schema, data, tmp_path=tmp_path, **kwargs)
+        return
+
+    existing_file = pyarrow.parquet.ParquetFile(path)
+    schema = _reconcile_schemas(existing_file.schema_arrow, data.schema)
+    existing_row_groups = (
+        existing_file.read_row_group(i) for i in range(existing_file.num_row_groups)
+    )
+    _write_parquet_file(
+        path,
+        schema,
+        chain(existing_row_groups, data),
+        tmp_path=tmp_path,
+        **kwargs,
+    )